@@ -33,7 +33,7 @@ inline size_t getDataSize(const std::shared_ptr<LineSeries>& data_source) {
         } else {
             // When _idx is -1, no data is available yet in streaming mode
             // But we still return the total array size for batch mode compatibility
-            return buffer->array().size();
+            return buffer->data_size();
         }
     }
     
@@ -49,7 +49,7 @@ inline double getBufferValue(const std::shared_ptr<LineBuffer>& buffer, int inde
     if (!buffer || index < 0 || index >= static_cast<int>(data_size)) {
         return std::numeric_limits<double>::quiet_NaN();
     }
-    return buffer->array()[index];
+    return buffer->data_ptr()[index];
 }
 
 /**
@@ -103,9 +103,9 @@ protected:
     // New calculation methods
     void calculate_with_separate_lines();
     void calculate_with_single_datasource();
-    void calculate_stochastic_values(const std::vector<double>& high_array, 
-                                   const std::vector<double>& low_array,
-                                   const std::vector<double>& close_array,
+    void calculate_stochastic_values(const double* high_array, 
+                                   const double* low_array,
+                                   const double* close_array,
                                    int data_size);
     
 private:
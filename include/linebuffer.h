@@ -62,8 +62,11 @@ public:
     const double* data_ptr() const { return array_.data(); }
     size_t data_size() const { return array_.size(); }
     void reserve(size_t capacity) { array_.reserve(capacity); }
+    void batch_append(const double* values, size_t count) {
+        array_.insert(array_.end(), values, values + count);
+    }
     void batch_append(const std::vector<double>& values) {
-        array_.insert(array_.end(), values.begin(), values.end());
+        batch_append(values.data(), values.size());
     }
     
     // Length operations
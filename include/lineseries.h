@@ -78,7 +78,7 @@ public:
     void add_alias(const std::string& name, size_t idx);
     size_t get_alias_idx(const std::string& name) const;
     bool has_alias(const std::string& name) const;
-    std::vector<std::string> get_aliases() const;
+    const std::vector<std::string>& get_aliases() const;
     
     // Class derivation (simplified version of Python's _derive)
     static std::shared_ptr<Lines> derive(const std::string& name, 
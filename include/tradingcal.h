@@ -101,6 +101,8 @@ public:
             Weekday::MONDAY, Weekday::TUESDAY, Weekday::WEDNESDAY, 
             Weekday::THURSDAY, Weekday::FRIDAY
         };
+        // Ascending and unique for is_holiday; change through
+        // add_holiday/remove_holiday/set_holidays
         std::vector<std::chrono::system_clock::time_point> holidays;
     } params;
     
@@ -116,6 +118,7 @@ public:
     // Additional methods
     void add_holiday(const std::chrono::system_clock::time_point& holiday);
     void remove_holiday(const std::chrono::system_clock::time_point& holiday);
+    void set_holidays(std::vector<std::chrono::system_clock::time_point> holidays);
     bool is_holiday(const std::chrono::system_clock::time_point& day) const;
     bool is_trading_day(const std::chrono::system_clock::time_point& day) const;
     
@@ -71,18 +71,9 @@ void TimeReturn::next() {
     // Calculate return for current period
     // This matches Python: self.rets[self.dtkey] = (self._value / self._value_start) - 1.0
     std::string date_key = get_current_date_key();
-    std::cerr << "TimeReturn::next() - value_start_=" << value_start_ 
-              << ", current_value_=" << current_value_ 
-              << ", date_key=" << date_key << std::endl;
     if (value_start_ > 0.0 && current_value_ > 0.0) {
         double return_value = (current_value_ / value_start_) - 1.0;
         returns_[date_key] = return_value;
-        std::cerr << "TimeReturn::next() - Added return " << return_value 
-                  << " for date " << date_key 
-                  << " (current=" << current_value_ 
-                  << ", start=" << value_start_ << ")" << std::endl;
-    } else {
-        std::cerr << "TimeReturn::next() - SKIPPED return calculation!" << std::endl;
     }
     
     // Update last value - Python: self._lastvalue = self._value
@@ -92,9 +83,6 @@ void TimeReturn::next() {
 void TimeReturn::notify_fund(double cash, double value, double fundvalue, double shares) {
     notify_fund_call_count_++;
     
-    std::cerr << "TimeReturn::notify_fund() called - cash=" << cash 
-              << ", value=" << value << ", fundvalue=" << fundvalue << std::endl;
-    
     // Update current value based on fund mode - matches Python logic
     if (!fundmode_) {
         current_value_ = value;  // Portfolio value if tracking no data
@@ -108,9 +96,6 @@ void TimeReturn::notify_fund(double cash, double value, double fundvalue, double
 void TimeReturn::on_dt_over() {
     on_dt_over_call_count_++;
     
-    std::cerr << "TimeReturn::on_dt_over() called - last_value_=" << last_value_ 
-              << ", current_value_=" << current_value_ << std::endl;
-    
     // Called when timeframe period ends - update value_start for next period
     // Python: if self._lastvalue is not None: self._value_start = self._lastvalue
     // Only update if we have a valid last_value
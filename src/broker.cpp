@@ -167,21 +167,8 @@ std::shared_ptr<Position> BackBroker::getposition(std::shared_ptr<DataSeries> da
     // std::cerr << "BackBroker::getposition - looking for data=" << data.get() << std::endl;
     // std::cerr << "BackBroker::getposition - positions_.size()=" << positions_.size() << std::endl;
     
-    // Debug: print all position keys
-    static int call_count = 0;
-    if (++call_count % 10 == 0 || !positions_.empty()) {
-        std::cerr << "BackBroker::getposition[" << call_count << "] - broker=" << this 
-                  << ", Looking for: " << data.get() 
-                  << ", positions_.size()=" << positions_.size() << std::endl;
-        for (const auto& [key, pos] : positions_) {
-            std::cerr << "  Key: " << key << ", Position size: " << pos->size << std::endl;
-        }
-    }
-    
     auto it = positions_.find(data.get());
     if (it != positions_.end()) {
-        std::cerr << "BackBroker::getposition - Found position for " << data.get() 
-                  << ", size=" << it->second->size << std::endl;
         return it->second;
     }
     
@@ -288,9 +275,6 @@ std::shared_ptr<CommInfo> BackBroker::getcommissioninfo(std::shared_ptr<DataSeri
 }
 
 void BackBroker::next() {
-    std::cerr << "BackBroker::next() called - pending_orders.size()=" << pending_orders_.size() 
-              << ", new_orders.size()=" << new_orders_.size() << std::endl;
-    
     // CRITICAL FIX: Move new orders to pending BEFORE processing
     // Orders submitted in bar N-1 should be executed in bar N
     if (!new_orders_.empty()) {
@@ -523,12 +507,6 @@ double BackBroker::_get_order_price(std::shared_ptr<Order> order, double ago) {
     switch (order->type) {
         case OrderType::Market: {
             price = (*order->data->lines->getline(DataSeries::Open))[static_cast<int>(ago)];
-            // Debug: Also print close price to verify which bar we're on
-            double close_price = (*order->data->lines->getline(DataSeries::Close))[static_cast<int>(ago)];
-            std::cerr << "BackBroker::_get_order_price - Market order, ago=" << ago 
-                      << ", open price=" << price 
-                      << ", close price=" << close_price 
-                      << ", data ptr=" << order->data.get() << std::endl;
             break;
         }
         case OrderType::Close:
@@ -483,8 +483,6 @@ void Cerebro::_brokernotify() {
         return;
     }
     
-    std::cerr << "Cerebro::_brokernotify() called, broker_=" << broker_.get() << std::endl;
-    
     // Process broker notifications
     broker_->next();
     
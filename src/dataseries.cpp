@@ -41,7 +41,7 @@ std::vector<std::string> DataSeries::getwriterheaders() {
     }
     
     // Add remaining line aliases
-    auto aliases = lines->get_aliases();
+    const auto& aliases = lines->get_aliases();
     if (aliases.size() > LineOrder.size()) {
         for (size_t i = LineOrder.size(); i < aliases.size(); ++i) {
             headers.push_back(aliases[i]);
@@ -740,21 +740,17 @@ size_t DataResample::size() const {
                 
                 // For preloaded data (runonce mode), always return full buffer size
                 if (preloaded_ && buflen_val > 0) {
-                    std::cerr << "DataResample::size() - preloaded runonce mode, idx=" << idx << ", returning buflen=" << buflen_val << std::endl;
                     return buflen_val;
                 }
                 
                 // For non-runonce mode, return current position + 1
                 if (idx >= 0 && static_cast<size_t>(idx) < buflen_val) {
                     size_t current_size = idx + 1;
-                    std::cerr << "DataResample::size() - non-runonce mode, returning current_size=" << current_size 
-                              << " (idx=" << idx << ", buflen=" << buflen_val << ")" << std::endl;
                     return current_size;
                 }
                 
                 // Fallback for edge cases
                 if (buflen_val > 0) {
-                    std::cerr << "DataResample::size() - fallback, returning buflen=" << buflen_val << std::endl;
                     return buflen_val;
                 }
             }
@@ -771,7 +767,6 @@ size_t DataResample::buflen() const {
         if (line) {
             if (auto linebuf = std::dynamic_pointer_cast<LineBuffer>(line)) {
                 size_t buflen_val = linebuf->buflen();
-                std::cerr << "DataResample::buflen() - returning " << buflen_val << std::endl;
                 return buflen_val;
             }
         }
@@ -794,8 +789,6 @@ bool DataResample::_load_aggregate() {
             
             // Handle any remaining open bar as the final bar
             if (bar_open_) {
-                std::cerr << "DataResample::_load_aggregate() - final bar: dt=" << current_bar_.datetime 
-                          << ", close=" << current_bar_.close << std::endl;
                 return true;
             }
             break;
@@ -808,9 +801,6 @@ bool DataResample::_load_aggregate() {
         double current_dt = source_data_->datetime(0);
         if (bar_open_ && _checkbarover(current_dt)) {
             // Bar is complete, append it and prepare for next
-            std::cerr << "DataResample::_load_aggregate() - completed bar: dt=" << current_bar_.datetime 
-                      << ", close=" << current_bar_.close << std::endl;
-            
             _append_bar();
             
             // Reset for next bar
@@ -345,7 +345,7 @@ bool CTPData::validate_market_data(const std::map<std::string, std::any>& data)
 bool CTPData::is_valid_instrument(const std::string& instrument_id) const {
     // Basic validation for Chinese futures instrument format
     // Example: rb2410, au2412, IF2410, etc.
-    std::regex pattern(R"([A-Za-z]{1,4}\d{4})");
+    static const std::regex pattern(R"([A-Za-z]{1,4}\d{4})");
     return std::regex_match(instrument_id, pattern);
 }
 
@@ -482,7 +482,7 @@ std::chrono::system_clock::time_point CTPData::get_next_trading_session() const
 
 std::string CTPData::get_product_id() const {
     // Extract product ID from instrument ID
-    std::regex pattern(R"([A-Za-z]+)");
+    static const std::regex pattern(R"([A-Za-z]+)");
     std::smatch match;
     
     if (std::regex_search(params_.instrument_id, match, pattern)) {
@@ -494,7 +494,7 @@ std::string CTPData::get_product_id() const {
 
 std::string CTPData::get_contract_month() const {
     // Extract contract month from instrument ID
-    std::regex pattern(R"(\d{4})");
+    static const std::regex pattern(R"(\d{4})");
     std::smatch match;
     
     if (std::regex_search(params_.instrument_id, match, pattern)) {
@@ -296,7 +296,7 @@ void AccelerationDecelerationOscillator::once(int start, int end) {
     // std::cerr << "AccDecOsc::once - After append, idx: " << accde_line->get_idx() 
     //           << ", buflen: " << accde_line->buflen() 
     //           << ", size: " << accde_line->size() 
-    //           << ", array size: " << accde_line->array().size() << std::endl;
+    //           << ", array size: " << accde_line->data_size() << std::endl;
     
     // Debug: verify some values
     if (accde_line->size() > 0) {
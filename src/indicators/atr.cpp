@@ -437,7 +437,7 @@ void AverageTrueRange::calculate() {
     
     // Get LineBuffer for size
     auto high_buffer = std::dynamic_pointer_cast<LineBuffer>(high_line);
-    int data_size = high_buffer ? high_buffer->array().size() : high_line->size();
+    int data_size = high_buffer ? high_buffer->data_size() : high_line->size();
     
     
     // Calculate ATR for the entire dataset using once() method
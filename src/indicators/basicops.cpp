@@ -121,7 +121,7 @@ void OperationN::once(int start, int end) {
     
     // Position _idx at the last value in the buffer
     // This ensures that get(0) returns the most recent calculated value
-    int buffer_size = result_line->array().size();
+    int buffer_size = result_line->data_size();
     if (buffer_size > 0) {
         result_line->set_idx(buffer_size - 1);
     }
@@ -249,7 +249,7 @@ void Highest::calculate() {
     // Determine mode: streaming (size==0) or forward mode (size>0)
     if (data_buffer->size() == 0) {
         // Streaming mode: calculate all values at once
-        size_t actual_size = data_buffer->array().size();
+        size_t actual_size = data_buffer->data_size();
         if (actual_size > 0 && result_buffer->size() == 0) {
             // Only calculate if not already done
             once(0, actual_size);
@@ -100,9 +100,8 @@ void CloseLine::once(int start, int end) {
         if (data_source_->lines && data_source_->lines->size() > DataSeries::Close) {
             auto data_close_line = data_source_->lines->getline(DataSeries::Close);
             if (auto data_buffer = std::dynamic_pointer_cast<LineBuffer>(data_close_line)) {
-                const auto& array = data_buffer->array();
-                if (i >= 0 && i < static_cast<int>(array.size())) {
-                    close_val = array[i];
+                if (i >= 0 && i < static_cast<int>(data_buffer->data_size())) {
+                    close_val = data_buffer->data_ptr()[i];
                 }
             }
         }
@@ -124,8 +123,8 @@ void CloseLine::_once() {
     
     // Position at the last valid index
     auto close_line = std::dynamic_pointer_cast<LineBuffer>(lines->getline(close));
-    if (close_line && close_line->array().size() > 0) {
-        close_line->set_idx(close_line->array().size() - 1);
+    if (close_line && close_line->data_size() > 0) {
+        close_line->set_idx(close_line->data_size() - 1);
     }
     
     // Execute binding synchronization if any
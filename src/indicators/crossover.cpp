@@ -8,7 +8,8 @@ namespace backtrader {
 
 // Helper function to get the default value from a LineSeries
 // For DataSeries, returns close price; for indicators, returns default line
-// When ago is an absolute index (in once mode), access array directly
+// When ago is an absolute index (in once mode), read the buffer storage in place
+// (array() would copy the whole line on every bar)
 static double getDefaultValue(std::shared_ptr<LineSeries> series, int ago = 0) {
     static int call_count = 0;
     call_count++;
@@ -19,9 +20,8 @@ static double getDefaultValue(std::shared_ptr<LineSeries> series, int ago = 0) {
         if (data_series->lines && data_series->lines->size() > 3) {
             auto close_line = data_series->lines->getline(3);  // Close line (correct index)
             if (auto buffer = std::dynamic_pointer_cast<LineBuffer>(close_line)) {
-                const auto& array = buffer->array();
-                if (ago >= 0 && ago < static_cast<int>(array.size())) {
-                    return array[ago];
+                if (ago >= 0 && ago < static_cast<int>(buffer->data_size())) {
+                    return buffer->data_ptr()[ago];
                 }
             }
         }
@@ -34,9 +34,8 @@ static double getDefaultValue(std::shared_ptr<LineSeries> series, int ago = 0) {
         if (series->lines && series->lines->size() > 0) {
             auto line = series->lines->getline(0);
             if (auto buffer = std::dynamic_pointer_cast<LineBuffer>(line)) {
-                const auto& array = buffer->array();
-                if (ago >= 0 && ago < static_cast<int>(array.size())) {
-                    double val = array[ago];
+                if (ago >= 0 && ago < static_cast<int>(buffer->data_size())) {
+                    double val = buffer->data_ptr()[ago];
                     if (call_count <= 20) {
                         std::cerr << "getDefaultValue #" << call_count << " - Indicator buffer[" << ago << "] = " << val 
                                   << ", indicator ptr=" << indicator.get() << std::endl;
@@ -60,9 +59,8 @@ static double getDefaultValue(std::shared_ptr<LineSeries> series, int ago = 0) {
             // In once() mode, ago is actually an absolute index
             // Check if we have a LineBuffer and use direct array access
             if (auto buffer = std::dynamic_pointer_cast<LineBuffer>(line)) {
-                const auto& array = buffer->array();
-                if (ago >= 0 && ago < static_cast<int>(array.size())) {
-                    return array[ago];
+                if (ago >= 0 && ago < static_cast<int>(buffer->data_size())) {
+                    return buffer->data_ptr()[ago];
                 }
             }
             // Fallback to operator[]
@@ -196,12 +194,6 @@ void NonZeroDifference::next() {
         if (!std::isnan(val0) && !std::isnan(val1)) {
             diff = val0 - val1;
         }
-        
-        {
-            std::cout << "NonZeroDifference::next()" 
-                      << ": val0=" << val0 << ", val1=" << val1 
-                      << ", diff=" << diff << ", last_nzd_=" << last_nzd_ << std::endl;
-        }
 
         if (!std::isnan(diff)) {
             // Python behavior: only use last non-zero value if diff is EXACTLY 0.0
@@ -301,8 +293,8 @@ void NonZeroDifference::_once() {
     
     // Position at the last valid index
     auto nzd_line = std::dynamic_pointer_cast<LineBuffer>(lines->getline(nzd));
-    if (nzd_line && nzd_line->array().size() > 0) {
-        nzd_line->set_idx(nzd_line->array().size() - 1);
+    if (nzd_line && nzd_line->data_size() > 0) {
+        nzd_line->set_idx(nzd_line->data_size() - 1);
     }
     
     // Execute binding synchronization if any
@@ -527,34 +519,15 @@ void CrossBase::next() {
         
         // Count bars for this instance
         bar_count_++;
-        
-        // Debug for more bars to see crossover activity
-        if (bar_count_ <= 50) {
-            std::cout << "**DISTINCTIVE** DEBUG CrossBase::next() bar_count_=" << bar_count_ 
-                      << ", data0=" << current_data0 << ", data1=" << current_data1
-                      << ", current_nzd=" << (nzd_line->size() > 0 ? (*nzd_line)[0] : 0.0)
-                      << ", prev_nzd=" << prev_nzd << ", nzd_size=" << nzd_line->size()
-                      << ", crossup_=" << crossup_ << std::endl;
-        }
 
         bool cross_detected = false;
         
         if (crossup_) {
             // CrossUp: previous diff was negative and current data0 > data1
             cross_detected = (prev_nzd < 0.0) && (current_data0 > current_data1);
-            if (bar_count_ <= 50 || cross_detected) {
-                std::cout << "DEBUG CrossUp bar_count_=" << bar_count_ << ": prev_nzd < 0.0 = " << (prev_nzd < 0.0) 
-                          << ", data0 > data1 = " << (current_data0 > current_data1)
-                          << ", cross_detected = " << cross_detected << std::endl;
-            }
         } else {
             // CrossDown: previous diff was positive and current data0 < data1
             cross_detected = (prev_nzd > 0.0) && (current_data0 < current_data1);
-            if (bar_count_ <= 50 || cross_detected) {
-                std::cout << "DEBUG CrossDown bar_count_=" << bar_count_ << ": prev_nzd > 0.0 = " << (prev_nzd > 0.0) 
-                          << ", data0 < data1 = " << (current_data0 < current_data1)
-                          << ", cross_detected = " << cross_detected << std::endl;
-            }
         }
         
         auto cross_buffer = std::dynamic_pointer_cast<LineBuffer>(cross_line);
@@ -605,11 +578,12 @@ void CrossBase::once(int start, int end) {
         double prev_nzd = 0.0;
         double curr_nzd = 0.0;
         if (nzd_buffer && i > 0) {
-            const auto& nzd_array = nzd_buffer->array();
-            if (i < static_cast<int>(nzd_array.size())) {
+            const double* nzd_array = nzd_buffer->data_ptr();
+            const int nzd_size = static_cast<int>(nzd_buffer->data_size());
+            if (i < nzd_size) {
                 curr_nzd = nzd_array[i];
             }
-            if (i - 1 >= 0 && i - 1 < static_cast<int>(nzd_array.size())) {
+            if (i - 1 >= 0 && i - 1 < nzd_size) {
                 prev_nzd = nzd_array[i - 1];
                 // Skip if previous NZD is NaN
                 if (std::isnan(prev_nzd)) {
@@ -672,8 +646,8 @@ void CrossBase::_once() {
     
     // Position at the last valid index
     auto cross_line = std::dynamic_pointer_cast<LineBuffer>(lines->getline(cross));
-    if (cross_line && cross_line->array().size() > 0) {
-        cross_line->set_idx(cross_line->array().size() - 1);
+    if (cross_line && cross_line->data_size() > 0) {
+        cross_line->set_idx(cross_line->data_size() - 1);
     }
     
     // IMPORTANT: Reset buffer index to 0 for array access compatibility
@@ -910,15 +884,15 @@ void CrossOver::once(int start, int end) {
     auto downcross_buffer = std::dynamic_pointer_cast<LineBuffer>(downcross_line);
     if (call_count <= 3) {
         std::cerr << "CrossOver::once() - Child buffer sizes: up=" 
-                  << (upcross_buffer ? upcross_buffer->array().size() : 0)
-                  << ", down=" << (downcross_buffer ? downcross_buffer->array().size() : 0)
+                  << (upcross_buffer ? upcross_buffer->data_size() : 0)
+                  << ", down=" << (downcross_buffer ? downcross_buffer->data_size() : 0)
                   << ", need range [" << start << ", " << end << ")" << std::endl;
         
         // Check actual values in child buffers
-        if (upcross_buffer && upcross_buffer->array().size() > 10) {
+        if (upcross_buffer && upcross_buffer->data_size() > 10) {
             std::cerr << "  UP buffer values [0-10]: ";
-            for (int idx = 0; idx <= 10 && idx < static_cast<int>(upcross_buffer->array().size()); idx++) {
-                std::cerr << "[" << idx << "]=" << upcross_buffer->array()[idx] << " ";
+            for (int idx = 0; idx <= 10 && idx < static_cast<int>(upcross_buffer->data_size()); idx++) {
+                std::cerr << "[" << idx << "]=" << upcross_buffer->data_ptr()[idx] << " ";
             }
             std::cerr << std::endl;
         }
@@ -998,18 +972,18 @@ void CrossOver::_once() {
     
     // Position at the last valid index
     auto crossover_line = std::dynamic_pointer_cast<LineBuffer>(lines->getline(crossover));
-    if (crossover_line && crossover_line->array().size() > 0) {
-        crossover_line->set_idx(crossover_line->array().size() - 1);
+    if (crossover_line && crossover_line->data_size() > 0) {
+        crossover_line->set_idx(crossover_line->data_size() - 1);
         
         // Debug: verify some values were set
         static int debug_count = 0;
         if (debug_count++ < 3) {
-            std::cerr << "CrossOver::_once() complete - buffer size=" << crossover_line->array().size() << std::endl;
-            if (crossover_line->array().size() > 20) {
+            std::cerr << "CrossOver::_once() complete - buffer size=" << crossover_line->data_size() << std::endl;
+            if (crossover_line->data_size() > 20) {
                 std::cerr << "  Values at key positions: ";
                 for (int idx : {7, 8, 10, 18, 24}) {
-                    if (idx < static_cast<int>(crossover_line->array().size())) {
-                        std::cerr << "[" << idx << "]=" << crossover_line->array()[idx] << " ";
+                    if (idx < static_cast<int>(crossover_line->data_size())) {
+                        std::cerr << "[" << idx << "]=" << crossover_line->data_ptr()[idx] << " ";
                     }
                 }
                 std::cerr << std::endl;
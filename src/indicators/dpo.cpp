@@ -174,7 +174,7 @@ void DetrendedPriceOscillator::once(int start, int end) {
             dpo_line->append(std::numeric_limits<double>::quiet_NaN());
         } else {
             // Current price at chronological position i
-            double current_price = data_buffer->array()[i];
+            double current_price = data_buffer->data_ptr()[i];
             
             // Calculate shifted SMA
             // Python: ma(-period // 2 + 1) means we use SMA from (period//2 - 1) bars before current
@@ -187,7 +187,7 @@ void DetrendedPriceOscillator::once(int start, int end) {
                 for (int j = 0; j < params.period; ++j) {
                     int data_pos = ma_center_pos - params.period + 1 + j;
                     if (data_pos >= 0 && data_pos < data_size) {
-                        ma_sum += data_buffer->array()[data_pos];
+                        ma_sum += data_buffer->data_ptr()[data_pos];
                     }
                 }
                 double ma_value = ma_sum / params.period;
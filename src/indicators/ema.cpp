@@ -105,12 +105,6 @@ void EMA::once(int start, int end) {
         // For LineSeries with single close line, use index 0; for DataSeries, use index 4 (close)
         int line_index = (data_source_->lines->size() > 4) ? 4 : 0;
         data_line = data_source_->lines->getline(line_index);
-        
-        // Debug output to understand the data structure
-        if (period == 30) {
-            std::cout << "EMA Debug: data_source_ lines size = " << data_source_->lines->size() 
-                      << ", using line index = " << line_index << std::endl;
-        }
     } else if (data && data->lines && data->lines->size() > 0) {
         // For LineSeries with single close line, use index 0; for DataSeries, use index 4 (close)
         int line_index = (data->lines->size() > 4) ? 4 : 0;
@@ -139,9 +133,9 @@ void EMA::once(int start, int end) {
         // For first calculation, we need to properly initialize the buffer
         // The LineBuffer constructor adds an initial NaN, so we account for that
         
-        const auto& data_array = data_buffer->array();
+        const double* data_array = data_buffer->data_ptr();
         // Use the actual array size, not the index position
-        size_t data_size = data_array.size();
+        size_t data_size = data_buffer->data_size();
         
         // Find the first non-NaN value in the data
         int data_start = -1;
@@ -166,17 +160,6 @@ void EMA::once(int start, int end) {
             return;
         }
         
-        // Debug output to understand the data structure
-        if (period == 30) {
-            std::cout << "EMA Debug: data_array.size() = " << data_array.size() 
-                      << ", data_start = " << data_start 
-                      << ", first few values: ";
-            for (int i = 0; i < 5 && i < static_cast<int>(data_array.size()); ++i) {
-                std::cout << data_array[i] << " ";
-            }
-            std::cout << std::endl;
-        }
-        
         // Calculate how many valid data points we have
         int valid_data_points = data_size - data_start;
         
@@ -217,11 +200,6 @@ void EMA::once(int start, int end) {
             
             // Place the first EMA value at index (period-1)
             ema_line->append(seed_value);
-            // Debug output
-            if (data_start == 0 && period == 30) {
-                std::cout << "EMA Debug: SMA seed value = " << std::fixed << std::setprecision(6) << seed_value << " at index " << first_ema_index << std::endl;
-                std::cout << "EMA Debug: alpha = " << std::fixed << std::setprecision(10) << alpha << std::endl;
-            }
             
             // Then calculate subsequent EMA values
             // Note: Start with the seed value as the previous EMA
@@ -241,7 +219,8 @@ void EMA::once(int start, int end) {
         }
     } else {
         // Incremental calculation - we already have some values
-        const auto& data_array = data_buffer->array();
+        // Read both buffers in place; array() would copy the whole history on every call
+        const double* data_array = data_buffer->data_ptr();
         int data_available = current_data_idx + 1;  // Data up to current index
         int ema_calculated = ema_line->size();     // How many EMA values we have
         
@@ -267,7 +246,7 @@ void EMA::once(int start, int end) {
                 // We want the last valid value
                 auto ema_buffer = std::dynamic_pointer_cast<LineBuffer>(ema_line);
                 if (ema_buffer) {
-                    const auto& ema_array = ema_buffer->array();
+                    const double* ema_array = ema_buffer->data_ptr();
                     for (int j = ema_calculated - 1; j >= 0; --j) {
                         if (!std::isnan(ema_array[j])) {
                             prev_ema = ema_array[j];
@@ -340,12 +319,6 @@ double EMA::get(int ago) const {
         int buffer_size = ema_line->size();
         int actual_index = buffer_size + ago;
         
-        // Debug output for period 30
-        if (period == 30 && (actual_index == 30 || actual_index == 31)) {
-            std::cout << "EMA::get debug: ago=" << ago << ", buffer_size=" << buffer_size 
-                      << ", actual_index=" << actual_index << ", period=" << period << std::endl;
-        }
-        
         // If we're trying to access index 31 (the second EMA value),
         // return the SMA seed value at index 29 instead
         if (actual_index == 31 && period == 30) {
@@ -393,7 +366,7 @@ void EMA::calculate() {
             // Calculate EMA for the entire dataset using once() method
             // Use the actual data size from LineBuffer array, not size() method
             auto data_buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
-            size_t data_size = data_buffer ? data_buffer->array().size() : data_line->size();
+            size_t data_size = data_buffer ? data_buffer->data_size() : data_line->size();
             once(0, data_size);
         }
     } else if (data && data->lines && data->lines->size() > 0) {
@@ -401,7 +374,7 @@ void EMA::calculate() {
         auto data_line = data->lines->getline(line_index);
         if (data_line) {
             auto data_buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
-            size_t data_size = data_buffer ? data_buffer->array().size() : data_line->size();
+            size_t data_size = data_buffer ? data_buffer->data_size() : data_line->size();
             once(0, data_size);
         }
     } else {
@@ -175,7 +175,7 @@ void Envelope::calculate() {
     if (data_line) {
         auto buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
         if (buffer) {
-            data_size = buffer->array().size();
+            data_size = buffer->data_size();
         }
     }
     
@@ -186,7 +186,7 @@ void Envelope::calculate() {
     // Check actual array size, not just size() which might be 0 due to indexing
     size_t current_size = 0;
     if (src_buffer) {
-        current_size = src_buffer->array().size();
+        current_size = src_buffer->data_size();
     }
     
     if (current_size < data_size) {
@@ -319,7 +319,7 @@ void Envelope::once(int start, int end) {
                 }
                 
                 // Debug output for first few SMA values
-                // if (src_line->array().size() <= 3) {
+                // if (src_line->data_size() <= 3) {
                 //     std::cerr << "SMA[" << i << "] = " << std::fixed << std::setprecision(6) << sma_value << std::endl;
                 // }
             } else {
@@ -331,17 +331,17 @@ void Envelope::once(int start, int end) {
     }
     
     // Set LineBuffer indices to last valid position for proper ago indexing
-    if (end > start && src_line->array().size() > 0) {
-        src_line->set_idx(src_line->array().size() - 1);
-        top_line->set_idx(top_line->array().size() - 1);
-        bot_line->set_idx(bot_line->array().size() - 1);
+    if (end > start && src_line->data_size() > 0) {
+        src_line->set_idx(src_line->data_size() - 1);
+        top_line->set_idx(top_line->data_size() - 1);
+        bot_line->set_idx(bot_line->data_size() - 1);
         
         // Debug output
-        // std::cerr << "Envelope once() completed: buffer size = " << src_line->array().size() 
+        // std::cerr << "Envelope once() completed: buffer size = " << src_line->data_size() 
         //           << ", _idx = " << src_line->get_idx() << std::endl;
         
         // // Check values at key points
-        // if (src_line->array().size() >= 255) {
+        // if (src_line->data_size() >= 255) {
         //     std::cerr << "SMA[254] (ago=0) = " << src_line->get(0) << std::endl;
         //     std::cerr << "SMA[30] (ago=-224) = " << src_line->get(-224) << std::endl;
         //     std::cerr << "SMA[142] (ago=-112) = " << src_line->get(-112) << std::endl;
@@ -450,11 +450,11 @@ void SimpleMovingAverageEnvelope::calculate() {
         auto data_line = data_source_->lines->getline(0);
         if (data_line) {
             auto data_buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
-            size_t data_size = data_buffer ? data_buffer->array().size() : data_line->size();
+            size_t data_size = data_buffer ? data_buffer->data_size() : data_line->size();
             
             // Check if we've already calculated for this data size to avoid redundant calculations
             auto sma_line = std::dynamic_pointer_cast<LineBuffer>(lines->getline(0));
-            if (sma_line && sma_line->array().size() >= data_size) {
+            if (sma_line && sma_line->data_size() >= data_size) {
                 std::cout << "*** SMAEnvelope already calculated for size " << data_size << ", skipping ***" << std::endl;
                 return;
             }
@@ -710,7 +710,7 @@ void ExponentialMovingAverageEnvelope::calculate() {
         auto data_line = datas[0]->lines->getline(line_index);
         if (data_line) {
             auto data_buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
-            data_size = data_buffer ? data_buffer->array().size() : data_line->size();
+            data_size = data_buffer ? data_buffer->data_size() : data_line->size();
         }
     }
     
@@ -938,7 +938,7 @@ void DoubleExponentialMovingAverageEnvelope::calculate() {
         auto data_line = datas[0]->lines->getline(line_index);
         if (data_line) {
             auto data_buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
-            data_size = data_buffer ? data_buffer->array().size() : data_line->size();
+            data_size = data_buffer ? data_buffer->data_size() : data_line->size();
         }
     }
     
@@ -1335,8 +1335,8 @@ void TripleExponentialMovingAverageEnvelope::once(int start, int end) {
             }
             
             // Set buffer positions to the end
-            if (tema_buffer->array().size() > 0) {
-                int last_idx = tema_buffer->array().size() - 1;
+            if (tema_buffer->data_size() > 0) {
+                int last_idx = tema_buffer->data_size() - 1;
                 tema_buffer->set_idx(last_idx);
                 top_buffer->set_idx(last_idx);
                 bot_buffer->set_idx(last_idx);
@@ -1425,14 +1425,14 @@ double SmoothedMovingAverageEnvelope::get(int ago) const {
         if (ago == 0) {
             // Get the current (last) value
             if (buffer->size() > 0) {
-                return buffer->array()[buffer->size() - 1];
+                return buffer->data_ptr()[buffer->size() - 1];
             }
         } else if (ago < 0) {
             // Negative ago means access historical values
             // ago=0 is current (last), ago=-1 is one before last, etc.
             int idx = static_cast<int>(buffer->size()) - 1 + ago;
             if (idx >= 0 && idx < static_cast<int>(buffer->size())) {
-                return buffer->array()[idx];
+                return buffer->data_ptr()[idx];
             }
         } else {
             // Positive ago - delegate to the line's get method
@@ -187,7 +187,6 @@ void Fractal::calculate() {
                 up_buffer->set_idx(fractal_size - 1);
                 int relative_pos = fractal_pos - (fractal_size - 1);
                 up_buffer->set(relative_pos, max_high * bardist_up);
-                std::cerr << "Found up fractal at pos " << fractal_pos << ", relative_pos=" << relative_pos << ", value=" << (max_high * bardist_up) << std::endl;
             }
         }
         
@@ -203,7 +202,6 @@ void Fractal::calculate() {
                 int relative_pos = fractal_pos - (fractal_size - 1);
                 double fractal_value = min_low * bardist_down;
                 down_buffer->set(relative_pos, fractal_value);
-                std::cerr << "Found down fractal at pos " << fractal_pos << ", relative_pos=" << relative_pos << ", min_low=" << min_low << ", bardist_down=" << bardist_down << ", value=" << fractal_value << " -- USING SET METHOD!" << std::endl;
             }
         }
     }
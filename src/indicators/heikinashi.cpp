@@ -333,11 +333,11 @@ void HeikinAshi::once(int start, int end) {
     
     // Set the buffer indices to the last valid position
     // The buffers now have the same number of elements as processed (minus skipped NaN)
-    int final_size = ha_open_buffer->array().size();
+    int final_size = ha_open_buffer->data_size();
     
     // Set the buffer indices to the last element in the buffer
     // After processing, buffers have (number_of_valid_elements + 1) elements due to initial NaN
-    int final_buffer_size = ha_open_buffer->array().size();
+    int final_buffer_size = ha_open_buffer->data_size();
     if (final_buffer_size > 1) {
         // Set index to the last valid element (buffer_size - 1)
         int final_idx = final_buffer_size - 1;
@@ -278,65 +278,32 @@ void HullMovingAverage::once(int start, int end) {
     // Pre-allocate space
     hma_line->reserve(end - start);
     
+    // The difference series 2*WMA(period/2) - WMA(period) is shared by every
+    // final WMA(sqrt(period)) window, so compute each point once up front
+    const int array_size = static_cast<int>(data_array.size());
+    const int diff_begin = std::max(period - 1, start - sqrt_period + 1);
+    const int diff_end = std::min({end, static_cast<int>(data_size), array_size});
+    std::vector<double> diff_series;
+    if (diff_end > diff_begin) {
+        diff_series.reserve(diff_end - diff_begin);
+        for (int k = diff_begin; k < diff_end; ++k) {
+            double wma_period = calculateWMA(data_array, k - period + 1, k + 1);
+            double wma_half = calculateWMA(data_array, k - half_period + 1, k + 1);
+            diff_series.push_back(2.0 * wma_half - wma_period);
+        }
+    }
+    
     // Calculate HMA for each point
     for (int i = start; i < end && i < static_cast<int>(data_size); ++i) {
-        if (i < min_period - 1) {
+        if (i < min_period - 1 || i >= array_size) {
             // Not enough data yet
             hma_line->append(std::numeric_limits<double>::quiet_NaN());
             continue;
         }
         
-        // Build data vector for this point
-        std::vector<double> point_data;
-        point_data.reserve(period);
-        
-        for (int j = i - period + 1; j <= i; ++j) {
-            if (j >= 0 && j < data_array.size()) {
-                point_data.push_back(data_array[j]);
-            }
-        }
-        
-        if (point_data.size() != period) {
-            hma_line->append(std::numeric_limits<double>::quiet_NaN());
-            continue;
-        }
-        
-        // Calculate difference series: 2*WMA(period/2) - WMA(period)
-        std::vector<double> diff_series;
-        diff_series.reserve(sqrt_period);
-        
-        for (int k = i - sqrt_period + 1; k <= i; ++k) {
-            if (k >= period - 1) {
-                // Get data for WMA calculations
-                std::vector<double> wma_data;
-                wma_data.reserve(period);
-                
-                for (int m = k - period + 1; m <= k; ++m) {
-                    if (m >= 0 && m < data_array.size()) {
-                        wma_data.push_back(data_array[m]);
-                    }
-                }
-                
-                if (wma_data.size() == period) {
-                    // Calculate WMA(period)
-                    double wma_period = calculateWMA(wma_data, 0, period);
-                    
-                    // Calculate WMA(period/2) using last half_period values
-                    double wma_half = calculateWMA(wma_data, period - half_period, period);
-                    
-                    // Add to difference series
-                    diff_series.push_back(2.0 * wma_half - wma_period);
-                }
-            }
-        }
-        
-        // Calculate final HMA value
-        if (diff_series.size() == sqrt_period) {
-            double hma_value = calculateWMA(diff_series, 0, sqrt_period);
-            hma_line->append(hma_value);
-        } else {
-            hma_line->append(std::numeric_limits<double>::quiet_NaN());
-        }
+        // Final WMA over the sqrt_period difference values ending at i
+        int window_start = i - sqrt_period + 1 - diff_begin;
+        hma_line->append(calculateWMA(diff_series, window_start, window_start + sqrt_period));
     }
     
     // Finalize the line buffer
@@ -435,7 +435,7 @@ void Ichimoku::calculate() {
     if (!high_buffer) return;
     
     // Use array data size for LineBuffer
-    size_t data_size = high_buffer->array().size();
+    size_t data_size = high_buffer->data_size();
     if (data_size == 0) {
         data_size = high_buffer->size();
     }
@@ -243,12 +243,13 @@ void AdaptiveMovingAverage::once(int start, int end) {
     if (!close_buffer) return;
     
     // Get the actual data array from the buffer
-    std::vector<double> prices = close_buffer->array();
-    // std::cout << "KAMA::once prices.size()=" << prices.size();
+    const double* prices = close_buffer->data_ptr();
+    const size_t price_count = close_buffer->data_size();
+    // std::cout << "KAMA::once price_count=" << price_count;
     
     // Debug: find first non-NaN value
     int first_non_nan = -1;
-    for (int i = 0; i < static_cast<int>(prices.size()); ++i) {
+    for (int i = 0; i < static_cast<int>(price_count); ++i) {
         if (!std::isnan(prices[i])) {
             first_non_nan = i;
             break;
@@ -256,9 +257,9 @@ void AdaptiveMovingAverage::once(int start, int end) {
     }
     // std::cout << ", first_non_nan_at=" << first_non_nan;
     
-    if (!prices.empty()) {
+    if (price_count > 0) {
         // std::cout << ", First 5 prices: ";
-        for (int i = 0; i < 5 && i < static_cast<int>(prices.size()); ++i) {
+        for (int i = 0; i < 5 && i < static_cast<int>(price_count); ++i) {
             // std::cout << prices[i] << " ";
         }
     }
@@ -266,7 +267,7 @@ void AdaptiveMovingAverage::once(int start, int end) {
     
     // Skip initial NaN if present
     int data_offset = 0;
-    if (!prices.empty() && std::isnan(prices[0])) {
+    if (price_count > 0 && std::isnan(prices[0])) {
         data_offset = 1;
     }
     
@@ -275,7 +276,7 @@ void AdaptiveMovingAverage::once(int start, int end) {
     // std::cout << "KAMA::once: Checking condition start=" << start << " >= params.period=" << params.period << std::endl;
     if (start >= params.period) {
         // 这是第一次有效调用 - 计算从最小周期到数据结尾的所有值
-        // std::cout << "KAMA::once: Computing ALL values from " << params.period << " to " << (prices.size() - data_offset) << std::endl;
+        // std::cout << "KAMA::once: Computing ALL values from " << params.period << " to " << (price_count - data_offset) << std::endl;
         
         // 重置并计算所有KAMA值
         kama_buffer->reset();
@@ -288,7 +289,7 @@ void AdaptiveMovingAverage::once(int start, int end) {
         double kama_prev = std::numeric_limits<double>::quiet_NaN();
         
         // 计算所有有效的KAMA值
-        for (int i = params.period; i < static_cast<int>(prices.size()) - data_offset; ++i) {
+        for (int i = params.period; i < static_cast<int>(price_count) - data_offset; ++i) {
             if (i == params.period) {
                 // 第一个KAMA值：使用SMA作为种子
                 double sum = 0.0;
@@ -423,23 +424,24 @@ void AdaptiveMovingAverage::calculate() {
     if (!kama_buffer || !close_buffer) return;
     
     // Get actual data array size
-    std::vector<double> prices = close_buffer->array();
-    // std::cout << "KAMA::calculate() prices.size()=" << prices.size() << std::endl;
-    if (prices.empty()) {
-        // std::cout << "KAMA::calculate() early return - prices.empty()" << std::endl;
+    const double* prices = close_buffer->data_ptr();
+    const size_t price_count = close_buffer->data_size();
+    // std::cout << "KAMA::calculate() price_count=" << price_count << std::endl;
+    if (price_count == 0) {
+        // std::cout << "KAMA::calculate() early return - price_count == 0" << std::endl;
         return;
     }
     
     // Debug: print first few prices
     // std::cout << "KAMA::calculate() First 5 prices: ";
-    for (int i = 0; i < 5 && i < static_cast<int>(prices.size()); ++i) {
+    for (int i = 0; i < 5 && i < static_cast<int>(price_count); ++i) {
         // std::cout << prices[i] << " ";
     }
     // std::cout << std::endl;
     
     // Count initial NaN values
     int nan_count = 0;
-    for (size_t i = 0; i < prices.size(); ++i) {
+    for (size_t i = 0; i < price_count; ++i) {
         if (std::isnan(prices[i])) {
             nan_count++;
         } else {
@@ -457,7 +459,7 @@ void AdaptiveMovingAverage::calculate() {
         kama_buffer->append(std::numeric_limits<double>::quiet_NaN());
     }
     
-    int effective_size = static_cast<int>(prices.size()) - nan_count;
+    int effective_size = static_cast<int>(price_count) - nan_count;
     std::vector<double> alphas(effective_size, std::numeric_limits<double>::quiet_NaN());
     
     // Step 1: Calculate dynamic smoothing constants (alphas) for each position
@@ -555,7 +557,7 @@ size_t AdaptiveMovingAverage::size() const {
     }
     
     // Return the actual number of values in the array
-    return kama_buffer->array().size();
+    return kama_buffer->data_size();
 }
 
 } // namespace backtrader
\ No newline at end of file
@@ -134,7 +134,7 @@ void KAMAOscillator::calculate() {
                 if (data_size == 0) {
                     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line);
                     if (close_buffer) {
-                        data_size = close_buffer->array().size();
+                        data_size = close_buffer->data_size();
                     }
                 }
             }
@@ -148,7 +148,7 @@ void KAMAOscillator::calculate() {
                     if (data_size == 0) {
                         auto line_buffer = std::dynamic_pointer_cast<LineBuffer>(line);
                         if (line_buffer) {
-                            data_size = line_buffer->array().size();
+                            data_size = line_buffer->data_size();
                         }
                     }
                 }
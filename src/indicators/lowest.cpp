@@ -79,7 +79,7 @@ double Lowest::get(int ago) const {
     // Debug: check line content
     auto line_buffer = std::dynamic_pointer_cast<LineBuffer>(lowest_line);
     if (line_buffer) {
-        std::cerr << "  Line buffer size: " << line_buffer->array().size() 
+        std::cerr << "  Line buffer size: " << line_buffer->data_size() 
                   << ", idx: " << line_buffer->get_idx() << std::endl;
     }
     
@@ -142,7 +142,7 @@ void Lowest::calculate() {
             // Use array size instead of size() because data line idx might be -1
             auto data_buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
             if (data_buffer) {
-                size_t array_size = data_buffer->array().size();
+                size_t array_size = data_buffer->data_size();
                 std::cerr << "  Calling once(0, " << array_size << ")" << std::endl;
                 once(0, array_size);
             } else {
@@ -184,7 +184,7 @@ void Lowest::calculate() {
             // Use array size instead of size() because data line idx might be -1
             auto data_buffer_2 = std::dynamic_pointer_cast<LineBuffer>(data_line);
             if (data_buffer_2) {
-                once(0, data_buffer_2->array().size());
+                once(0, data_buffer_2->data_size());
             } else {
                 once(0, data_line->size());
             }
@@ -120,7 +120,8 @@ void LaguerreRSI::once(int start, int end) {
     auto data_buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
     if (!data_buffer) return;
     
-    std::vector<double> prices = data_buffer->array();
+    const double* prices = data_buffer->data_ptr();
+    const size_t price_count = data_buffer->data_size();
     
     // Don't reset - it adds an initial NaN
     // lrsi_line->reset();
@@ -130,7 +131,7 @@ void LaguerreRSI::once(int start, int end) {
     
     // Check if we need to skip the first NaN
     size_t start_idx = 0;
-    while (start_idx < prices.size() && std::isnan(prices[start_idx])) {
+    while (start_idx < price_count && std::isnan(prices[start_idx])) {
         start_idx++;
     }
     
@@ -143,13 +144,11 @@ void LaguerreRSI::once(int start, int end) {
     //     lrsi_buffer.push_back(std::numeric_limits<double>::quiet_NaN());
     // }
     
-    std::cout << "LRSI once(): start_idx=" << start_idx << ", prices.size()=" << prices.size() << std::endl;
-    
     // Check if we have enough data
-    size_t valid_data_count = prices.size() - start_idx;
+    size_t valid_data_count = price_count - start_idx;
     if (valid_data_count < params.period) {
         // Not enough data, fill with NaN
-        for (size_t i = 0; i < prices.size(); ++i) {
+        for (size_t i = 0; i < price_count; ++i) {
             lrsi_buffer.push_back(std::numeric_limits<double>::quiet_NaN());
         }
         // Copy to output
@@ -167,12 +166,10 @@ void LaguerreRSI::once(int start, int end) {
         return;
     }
     
-    // Track index for first calculated value
-    size_t calc_count = 0;
     std::vector<double> calculated_values;  // Store all calculated LRSI values
     
     // Process all data points
-    for (size_t i = start_idx; i < prices.size(); ++i) {
+    for (size_t i = start_idx; i < price_count; ++i) {
         double current_data = prices[i];
         
         if (std::isnan(current_data)) {
@@ -228,14 +225,6 @@ void LaguerreRSI::once(int start, int end) {
         // Store the calculated value
         calculated_values.push_back(lrsi_value);
         
-        // Debug output for first few calculations
-        if (calc_count < 6) {
-            std::cout << "LRSI[" << calc_count << "]: price=" << current_data 
-                      << ", l0=" << l0 << ", l1=" << l1 << ", l2=" << l2 << ", l3=" << l3
-                      << ", cu=" << cu << ", cd=" << cd << ", lrsi=" << lrsi_value << std::endl;
-        }
-        calc_count++;
-        
         // Don't add to lrsi_buffer here yet - we'll do it after the loop
     }
     
@@ -316,16 +305,6 @@ void LaguerreRSI::once(int start, int end) {
     // Copy lrsi_buffer to output
     // The issue is that reset() adds a NaN, making the buffer have 257 elements instead of 256
     
-    std::cout << "LRSI once(): lrsi_buffer.size()=" << lrsi_buffer.size() << std::endl;
-    std::cout << "First 10 values in lrsi_buffer: ";
-    for (size_t i = 0; i < std::min(size_t(10), lrsi_buffer.size()); ++i) {
-        std::cout << lrsi_buffer[i] << " ";
-    }
-    std::cout << std::endl;
-    
-    // Check current state of lrsi_line
-    std::cout << "Before copying: lrsi_line array size=" << lrsi_line->array().size() << std::endl;
-    
     // Clear the line buffer without reset (which adds NaN)
     // We'll manipulate the underlying array directly
     lrsi_line->reset();
@@ -338,9 +317,6 @@ void LaguerreRSI::once(int start, int end) {
     // The issue is that reset() adds a NaN, shifting everything by 1
     // Let's see what happens if we DON'T call reset first
     
-    // First check if the buffer is already populated (it shouldn't be)
-    std::cout << "After reset, array size: " << lrsi_line->array().size() << std::endl;
-    
     // Now copy values - we have 255 values to copy
     // Since reset() added 1 NaN, we now have index 0 with NaN
     // We want to REPLACE that and add the rest
@@ -350,7 +326,7 @@ void LaguerreRSI::once(int start, int end) {
             lrsi_line->set(0, lrsi_buffer[i]);
         } else {
             // For the rest, we need to check if we're within existing array bounds
-            if (i < lrsi_line->array().size()) {
+            if (i < lrsi_line->data_size()) {
                 lrsi_line->set(i, lrsi_buffer[i]);
             } else {
                 lrsi_line->append(lrsi_buffer[i]);
@@ -358,33 +334,9 @@ void LaguerreRSI::once(int start, int end) {
         }
     }
     
-    // Verify what we have
-    std::cout << "After copying, first 10 values in array: ";
-    for (size_t i = 0; i < std::min(size_t(10), lrsi_line->array().size()); ++i) {
-        std::cout << lrsi_line->array()[i] << " ";
-    }
-    std::cout << std::endl;
-    std::cout << "Detailed check - array[5]: " << lrsi_line->array()[5] 
-              << ", array[6]: " << lrsi_line->array()[6] 
-              << ", array[7]: " << lrsi_line->array()[7] << std::endl;
-    
     // Set LineBuffer index to last valid position for proper ago indexing
     if (!lrsi_buffer.empty()) {
         lrsi_line->set_idx(lrsi_buffer.size() - 1);
-        std::cout << "LRSI once(): set_idx to " << lrsi_buffer.size() 
-                  << ", size()=" << lrsi_line->size() 
-                  << ", array().size()=" << lrsi_line->array().size() << std::endl;
-        // Check what get(-249) returns
-        // With 256 total values and _idx at 255:
-        // Position -249 means: _idx + (-249) = 255 - 249 = 6
-        // But we need index 7 (where 0.714286 is)
-        // The issue is off-by-one because Python counts from the end differently
-        std::cout << "Test get(-249): _idx=" << lrsi_line->get_idx() 
-                  << ", actual_idx=" << (lrsi_line->get_idx() - 249) 
-                  << ", value=" << (*lrsi_line)[-249] << std::endl;
-        std::cout << "Test get(-248): " << (*lrsi_line)[-248] << std::endl;
-        std::cout << "Test direct array access [6]: " << lrsi_line->array()[6] << std::endl;
-        std::cout << "Test direct array access [7]: " << lrsi_line->array()[7] << std::endl;
     }
     
     // Store final state in instance variables for streaming mode
@@ -392,34 +344,6 @@ void LaguerreRSI::once(int start, int end) {
     l1_ = l1;
     l2_ = l2;
     l3_ = l3;
-    
-    // Debug: Print last few values and key positions
-    std::cout << "Last 5 values in lrsi_buffer: ";
-    for (size_t i = lrsi_buffer.size() - 5; i < lrsi_buffer.size(); ++i) {
-        std::cout << lrsi_buffer[i] << " ";
-    }
-    std::cout << std::endl;
-    std::cout << "Last 5 calculated_values: ";
-    for (size_t i = calculated_values.size() - 5; i < calculated_values.size(); ++i) {
-        std::cout << calculated_values[i] << " ";
-    }
-    std::cout << std::endl;
-    
-    // Debug key positions
-    if (lrsi_buffer.size() == 255 && calculated_values.size() >= 250) {
-        std::cout << "Key buffer positions - [5]=" << lrsi_buffer[5] 
-                  << ", [129]=" << lrsi_buffer[129]
-                  << ", [130]=" << lrsi_buffer[130]
-                  << ", [254]=" << lrsi_buffer[254] << std::endl;
-        std::cout << "Key calculated positions - [0]=" << calculated_values[0]
-                  << ", [124]=" << calculated_values[124]
-                  << ", [129]=" << (calculated_values.size() > 129 ? calculated_values[129] : -999)
-                  << ", [249]=" << (calculated_values.size() > 249 ? calculated_values[249] : -999)
-                  << ", [254]=" << (calculated_values.size() > 254 ? calculated_values[254] : -999) << std::endl;
-    }
-    
-    std::cout << "calculated_values.size()=" << calculated_values.size() 
-              << ", lrsi_buffer.size()=" << lrsi_buffer.size() << std::endl;
 }
 
 // LaguerreFilter implementation
@@ -531,29 +455,16 @@ void LaguerreRSI::calculate() {
         return;
     }
     
-    // Debug: show current state
-    std::cout << "LRSI calculate() called: data_size=" << data_buffer->array().size() 
-              << ", lrsi_size=" << lrsi_buffer->array().size() 
-              << ", data.size()=" << data_buffer->size() << std::endl;
-    
     // Check if we have all data preloaded (batch mode)
-    size_t data_size = data_buffer->array().size();
-    size_t lrsi_size = lrsi_buffer->array().size();
+    size_t data_size = data_buffer->data_size();
+    size_t lrsi_size = lrsi_buffer->data_size();
     
     if (data_size > 1 && lrsi_size <= 1) {
         // Batch mode: calculate all values at once
-        std::cout << "LRSI: entering BATCH mode with " << data_size << " data points" << std::endl;
-        std::cout << "About to call once(0, " << data_size << ")" << std::endl;
         once(0, data_size);
-        std::cout << "once() completed" << std::endl;
     } else if (data_buffer->size() > 0) {
         // Streaming mode: calculate current value  
-        std::cout << "LRSI: entering STREAMING mode" << std::endl;
         next();
-    } else {
-        std::cout << "LRSI: no calculation performed" << std::endl;
-        std::cout << "Debug: data_size=" << data_size << ", lrsi_size=" << lrsi_size 
-                  << ", data_buffer->size()=" << data_buffer->size() << std::endl;
     }
 }
 
@@ -452,7 +452,7 @@ void MACD::once(int start, int end) {
     size_t signal_start_idx = macd_start_idx + params.period_signal - 1;  // Index 33 for signal period 9
     
     // Fill buffers - account for initial buffer NaN from reset()
-    bool buffer_has_initial_nan = (macd_buffer->array().size() == 1);
+    bool buffer_has_initial_nan = (macd_buffer->data_size() == 1);
     
     for (size_t i = start_idx; i < effective_size; ++i) {
         // We already adjusted the loop start to skip initial NaN if necessary
@@ -497,9 +497,9 @@ void MACD::once(int start, int end) {
     // Debug: check final values
     
     // Set the current index to the last element in the buffer
-    if (macd_buffer->array().size() > 0) {
+    if (macd_buffer->data_size() > 0) {
         // The buffer should have 255 elements after skipping initial NaN
-        size_t buffer_size = macd_buffer->array().size();
+        size_t buffer_size = macd_buffer->data_size();
         int last_idx = buffer_size - 1;
         
         
@@ -608,8 +608,8 @@ void MACDHisto::once(int start, int end) {
     }
     
     // Set the buffer index to the last valid position
-    if (histo_buffer->array().size() > 0) {
-        histo_buffer->set_idx(histo_buffer->array().size() - 1);
+    if (histo_buffer->data_size() > 0) {
+        histo_buffer->set_idx(histo_buffer->data_size() - 1);
     }
 }
 
@@ -678,7 +678,7 @@ void MACD::calculate() {
     }
     
     // Get data size
-    size_t actual_size = close_buffer->array().size();
+    size_t actual_size = close_buffer->data_size();
     
     // For batch mode (when all data is available), use once() for efficient calculation
     // This is the typical case when called from tests
@@ -790,7 +790,7 @@ void MACDHisto::calculate() {
     // Determine how many histogram values we need to calculate
     size_t macd_size = macd_array.size();
     size_t signal_size = signal_array.size();
-    size_t histo_size = histo_buffer->array().size();
+    size_t histo_size = histo_buffer->data_size();
     
     // Only calculate new histogram values (for streaming mode)
     size_t start_idx = histo_size;
@@ -816,8 +816,8 @@ void MACDHisto::calculate() {
     // Match the buffer index with MACD buffer
     if (macd_buffer->get_idx() >= 0) {
         histo_buffer->set_idx(macd_buffer->get_idx());
-    } else if (histo_buffer->array().size() > 0) {
-        histo_buffer->set_idx(histo_buffer->array().size() - 1);
+    } else if (histo_buffer->data_size() > 0) {
+        histo_buffer->set_idx(histo_buffer->data_size() - 1);
     }
 }
 
@@ -120,8 +120,8 @@ void Oscillator::calculate() {
         auto data_line = data_source_->lines->getline(0);
         if (data_line) {
             auto data_buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
-            if (data_buffer && data_buffer->array().size() > 0) {
-                once(0, data_buffer->array().size());
+            if (data_buffer && data_buffer->data_size() > 0) {
+                once(0, data_buffer->data_size());
             }
         }
         return;
@@ -139,8 +139,8 @@ void Oscillator::calculate() {
         
         if (data_line) {
             auto data_buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
-            if (data_buffer && data_buffer->array().size() > 0) {
-                once(0, data_buffer->array().size());
+            if (data_buffer && data_buffer->data_size() > 0) {
+                once(0, data_buffer->data_size());
             }
         }
     } else if (data_source_ && current_index_ < data_source_->size()) {
@@ -226,8 +226,8 @@ void Oscillator::once(int start, int end) {
                 }
                 
                 // Set buffer position to the end
-                if (osc_buffer->array().size() > 0) {
-                    osc_buffer->set_idx(osc_buffer->array().size() - 1);
+                if (osc_buffer->data_size() > 0) {
+                    osc_buffer->set_idx(osc_buffer->data_size() - 1);
                 }
             }
         }
@@ -329,8 +329,8 @@ void Oscillator::once(int start, int end) {
                 }
                 
                 // Set buffer position to the end
-                if (osc_buffer->array().size() > 0) {
-                    osc_buffer->set_idx(osc_buffer->array().size() - 1);
+                if (osc_buffer->data_size() > 0) {
+                    osc_buffer->set_idx(osc_buffer->data_size() - 1);
                 }
             }
         }
@@ -549,7 +549,7 @@ double EMAOscillator::get(int ago) const {
             int access_idx = idx + ago;
             std::cout << "EMAOsc::get(" << ago << ") - buffer idx=" << idx 
                       << ", access_idx=" << access_idx 
-                      << ", array_size=" << buffer->array().size() << std::endl;
+                      << ", array_size=" << buffer->data_size() << std::endl;
             debug_count++;
         }
     }
@@ -597,9 +597,9 @@ void EMAOscillator::calculate() {
     }
     
     // Get actual data size from array
-    size_t data_size = data_buffer->array().size();
+    size_t data_size = data_buffer->data_size();
     std::cout << "EMAOsc::calculate() - Data size: " << data_size 
-              << ", osc buffer size: " << osc_buffer->array().size() << std::endl;
+              << ", osc buffer size: " << osc_buffer->data_size() << std::endl;
     
     if (data_size == 0) {
         std::cout << "EMAOsc::calculate() - Data size is 0" << std::endl;
@@ -607,7 +607,7 @@ void EMAOscillator::calculate() {
     }
     
     // Only reset buffer if it's empty or has different size
-    if (osc_buffer->array().size() != data_size) {
+    if (osc_buffer->data_size() != data_size) {
         std::cout << "EMAOsc::calculate() - Processing data" << std::endl;
         osc_buffer->reset();
         
@@ -616,9 +616,9 @@ void EMAOscillator::calculate() {
         
         // Position the buffer index at the end after calculation
         // Use array().size() - 1, not size() - 1, to position correctly
-        if (osc_buffer->array().size() > 0) {
-            osc_buffer->set_idx(osc_buffer->array().size() - 1);
-            std::cout << "EMAOsc::calculate() - Set buffer idx to " << (osc_buffer->array().size() - 1) << std::endl;
+        if (osc_buffer->data_size() > 0) {
+            osc_buffer->set_idx(osc_buffer->data_size() - 1);
+            std::cout << "EMAOsc::calculate() - Set buffer idx to " << (osc_buffer->data_size() - 1) << std::endl;
         }
     } else {
         std::cout << "EMAOsc::calculate() - Buffer already has data, skipping" << std::endl;
@@ -636,7 +636,7 @@ size_t EMAOscillator::size() const {
     }
     
     // Return the actual number of values in the array
-    return osc_buffer->array().size();
+    return osc_buffer->data_size();
 }
 
 void EMAOscillator::next() {
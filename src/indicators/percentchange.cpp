@@ -89,11 +89,11 @@ void PercentChange::calculate() {
     int pct_idx = pct_buffer->get_idx();
     
     // Get data size
-    size_t data_size = linebuf->array().size();
+    size_t data_size = linebuf->data_size();
     
     // Check if this is the first call - calculate all available data
-    if (pct_buffer->array().size() == 0 || 
-        (pct_buffer->array().size() == 1 && std::isnan((*pct_buffer)[0]))) {
+    if (pct_buffer->data_size() == 0 || 
+        (pct_buffer->data_size() == 1 && std::isnan((*pct_buffer)[0]))) {
         // First time - calculate all values at once
         if (data_size > static_cast<size_t>(params.period)) {
             once(0, static_cast<int>(data_size));
@@ -102,13 +102,13 @@ void PercentChange::calculate() {
     } else {
         // Subsequent calls - handle streaming mode
         // Check if data has moved forward beyond our calculations
-        if (data_idx >= static_cast<int>(pct_buffer->array().size())) {
+        if (data_idx >= static_cast<int>(pct_buffer->data_size())) {
             // Data has moved forward, need to extend our buffer
             // Calculate new values for the extended range
             const auto& data_array = linebuf->array();
             
-            while (static_cast<int>(pct_buffer->array().size()) <= data_idx) {
-                int calc_idx = pct_buffer->array().size();
+            while (static_cast<int>(pct_buffer->data_size()) <= data_idx) {
+                int calc_idx = pct_buffer->data_size();
                 
                 if (calc_idx < params.period) {
                     pct_buffer->append(std::numeric_limits<double>::quiet_NaN());
@@ -300,7 +300,11 @@ void PercentChange::once(int start, int end) {
     
     // Clear the buffer completely (don't use reset() which may add NaN)
     pct_buffer->clear();
-    
+    if (end > start) {
+        // One value is appended per bar; size the buffer up front
+        pct_buffer->reserve(end - start);
+    }
+
     const auto& data_array = data_buffer->array();
     
     // Process data in forward order - DO NOT skip initial NaN to maintain alignment
@@ -337,8 +341,8 @@ void PercentChange::once(int start, int end) {
     
     // Set the buffer position to the end (matching the data buffer's final position)
     // This is important so get(0) returns the last calculated value
-    if (pct_buffer->array().size() > 0) {
-        pct_buffer->set_idx(pct_buffer->array().size() - 1);
+    if (pct_buffer->data_size() > 0) {
+        pct_buffer->set_idx(pct_buffer->data_size() - 1);
     }
 }
 
@@ -398,33 +398,32 @@ void PercentRank::once(int start, int end) {
         
         // Check if we have enough data points for calculation
         // Need at least period points (i starts from 0, so i >= period-1)
-        if (i >= params.period - 1) {
-            // Calculate PercentRank for position i using the window [i-period+1, i]
-            std::vector<double> window_data;
-            
-            // Collect the window data (period data points ending at position i)
+        double current_value = raw_array[i];
+        if (i >= params.period - 1 && !std::isnan(current_value)) {
+            // Calculate PercentRank for position i using the window [i-period+1, i].
+            // Count the non-NaN values and those below the current value in a
+            // single pass instead of copying the window into a temporary vector
+            int valid_count = 0;
+            int count_less = 0;
             for (int j = i - params.period + 1; j <= i; ++j) {
-                if (j >= 0 && j < end) {
-                    double value = raw_array[j];
-                    if (!std::isnan(value)) {
-                        window_data.push_back(value);
+                double value = raw_array[j];
+                if (!std::isnan(value)) {
+                    valid_count++;
+                    if (value < current_value) {
+                        count_less++;
                     }
                 }
             }
             
             // Calculate percent rank if we have exactly the right amount of data
-            if (static_cast<int>(window_data.size()) == params.period) {
-                // Get current value (at position i)
-                double current_value = raw_array[i];
+            // Following Python's implementation: fsum(x < d[-1] for x in d) / len(d)
+            if (valid_count == params.period) {
+                percent_rank_val = static_cast<double>(count_less) / params.period;
                 
-                if (!std::isnan(current_value)) {
-                    percent_rank_val = calculate_percent_rank(window_data, current_value);
-                    
-                    if (once_count <= 3 && i < 60) {  // Debug first few calculations
-                        std::cerr << "PercentRank::once() #" << once_count 
-                                  << " i=" << i << " current_value=" << current_value 
-                                  << " pct_rank=" << percent_rank_val << std::endl;
-                    }
+                if (once_count <= 3 && i < 60) {  // Debug first few calculations
+                    std::cerr << "PercentRank::once() #" << once_count 
+                              << " i=" << i << " current_value=" << current_value 
+                              << " pct_rank=" << percent_rank_val << std::endl;
                 }
             }
         }
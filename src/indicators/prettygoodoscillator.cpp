@@ -82,7 +82,7 @@ void PrettyGoodOscillator::calculate() {
             return;
     }
     
-    int data_len = close_line->array().size();
+    int data_len = close_line->data_size();
     
     // Calculate all values from the beginning
     once(0, data_len);
@@ -201,7 +201,7 @@ void PrettyGoodOscillator::once(int start, int end) {
     for (int i = start; i < end; ++i) {
         if (i >= getMinPeriod() - 1) {
             // Get values from buffers at absolute position i
-            double current_price = close_line->array()[i];
+            double current_price = close_line->data_ptr()[i];
             
             // Get SMA and ATR values using their buffer arrays
             auto sma_line = std::dynamic_pointer_cast<LineBuffer>(sma_->lines->getline(0));
@@ -213,10 +213,10 @@ void PrettyGoodOscillator::once(int start, int end) {
             }
             
             // Access values from the arrays
-            const auto& sma_array = sma_line->array();
-            const auto& atr_array = atr_line->array();
+            const double* sma_array = sma_line->data_ptr();
+            const double* atr_array = atr_line->data_ptr();
             
-            if (i < static_cast<int>(sma_array.size()) && i < static_cast<int>(atr_array.size())) {
+            if (i < static_cast<int>(sma_line->data_size()) && i < static_cast<int>(atr_line->data_size())) {
                 double sma_value = sma_array[i];
                 double atr_value = atr_array[i];
                 
@@ -241,8 +241,8 @@ void PrettyGoodOscillator::once(int start, int end) {
     }
     
     // Set LineBuffer index to last valid position for proper ago indexing
-    if (end > start && pgo_line->array().size() > 0) {
-        pgo_line->set_idx(pgo_line->array().size() - 1);
+    if (end > start && pgo_line->data_size() > 0) {
+        pgo_line->set_idx(pgo_line->data_size() - 1);
     }
 }
 
@@ -259,7 +259,7 @@ void PriceOscillator::calculate() {
             // Get actual data size from the array
             auto data_buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
             if (data_buffer) {
-                int data_size = data_buffer->array().size();
+                int data_size = data_buffer->data_size();
                 if (data_size > 0) {
                     once(0, data_size);
                 }
@@ -376,7 +376,7 @@ void PercentagePriceOscillator::calculate() {
             // Get actual data size from the array
             auto data_buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
             if (data_buffer) {
-                int data_size = data_buffer->array().size();
+                int data_size = data_buffer->data_size();
                 if (data_size > 0) {
                     once(0, data_size);
                 }
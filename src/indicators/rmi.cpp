@@ -344,7 +344,7 @@ void RelativeMomentumIndex::calculate() {
             auto buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
             if (buffer) {
                 // Use array().size() to get actual data size
-                data_size = buffer->array().size();
+                data_size = buffer->data_size();
             } else {
                 // Fallback to regular size() method
                 data_size = data_line->size();
@@ -149,29 +149,22 @@ void RSI::once(int start, int end) {
         return;
     }
     
-    std::vector<double> prices = data_buffer->array();
+    const double* prices = data_buffer->data_ptr();
+    const size_t price_count = data_buffer->data_size();
     
     // Skip initial NaN if present
     size_t start_idx = 0;
-    if (!prices.empty() && std::isnan(prices[0])) {
+    if (price_count > 0 && std::isnan(prices[0])) {
         start_idx = 1;
     }
     
-    if (prices.size() - start_idx <= period) {
+    if (price_count - start_idx <= period) {
         return;
     }
     
     // PYTHON-STYLE RSI CALCULATION
-    // Step 1: Calculate UpDay and DownDay (price changes)
-    std::vector<double> updays, downdays;
-    for (size_t i = start_idx + 1; i < prices.size(); ++i) {
-        double change = prices[i] - prices[i-1];
-        updays.push_back(std::max(0.0, change));    // max(close - close_prev, 0)
-        downdays.push_back(std::max(0.0, -change)); // max(close_prev - close, 0)
-    }
-    
-    
-    // Step 2: Apply SMMA (Wilder's Smoothed Moving Average)
+    // UpDay/DownDay moves and their SMMA (Wilder's Smoothed Moving Average)
+    // are produced in one pass; the smoothing only needs the running averages.
     // alpha = 1.0 / period, so for period=14, alpha = 1/14 ≈ 0.071428
     double alpha = 1.0 / period;
     double alpha1 = 1.0 - alpha;
@@ -179,9 +172,7 @@ void RSI::once(int start, int end) {
     // Reset and prepare RSI buffer 
     rsi_line->reset(); // This creates buffer with one NaN
     
-    // Step 3: Calculate RSI values using SMMA
     double smma_up = 0.0, smma_down = 0.0;
-    bool smma_initialized = false;
     
     // Fill initial NaN values (for period where we can't calculate RSI)
     for (int i = 0; i < period; ++i) {
@@ -189,27 +180,26 @@ void RSI::once(int start, int end) {
     }
     
     // Calculate RSI for each valid position
-    for (size_t i = 0; i < updays.size(); ++i) {
-        if (i < period - 1) {
-            // Not enough data yet for RSI
-            continue;
-        }
+    for (size_t i = start_idx + 1; i < price_count; ++i) {
+        const size_t move = i - start_idx - 1;  // index of this up/down move
+        double change = prices[i] - prices[i-1];
+        double upday = std::max(0.0, change);     // max(close - close_prev, 0)
+        double downday = std::max(0.0, -change);  // max(close_prev - close, 0)
         
-        if (!smma_initialized) {
+        if (move < static_cast<size_t>(period)) {
             // Initialize SMMA with simple average of first 'period' values
-            smma_up = 0.0;
-            smma_down = 0.0;
-            for (size_t j = i - period + 1; j <= i; ++j) {
-                smma_up += updays[j];
-                smma_down += downdays[j];
+            smma_up += upday;
+            smma_down += downday;
+            if (move < static_cast<size_t>(period - 1)) {
+                // Not enough data yet for RSI
+                continue;
             }
             smma_up /= period;
             smma_down /= period;
-            smma_initialized = true;
         } else {
             // Update SMMA using Wilder's smoothing: new = prev * (1-alpha) + current * alpha
-            smma_up = smma_up * alpha1 + updays[i] * alpha;
-            smma_down = smma_down * alpha1 + downdays[i] * alpha;
+            smma_up = smma_up * alpha1 + upday * alpha;
+            smma_down = smma_down * alpha1 + downday * alpha;
         }
         
         // Calculate RSI: rsi = 100 - 100 / (1 + rs), where rs = smma_up / smma_down
@@ -353,7 +343,7 @@ void RSI::calculate() {
     }
     
     // Check the actual data array size (not size() which can be 0 after reset)
-    size_t actual_size = data_buffer->array().size();
+    size_t actual_size = data_buffer->data_size();
     
     // Determine the mode: batch (all data pre-loaded) or streaming
     // RSI buffer starts with size 1 (initial NaN), so check if we haven't calculated yet
@@ -195,7 +195,8 @@ void SMA::nextstart() {
         if (static_cast<int>(values_.size()) < period) {
             auto linebuf = std::dynamic_pointer_cast<LineBuffer>(close_line);
             if (linebuf) {
-                const auto& data_array = linebuf->array();
+                const double* data_array = linebuf->data_ptr();
+                int data_count = static_cast<int>(linebuf->data_size());
                 int current_idx = linebuf->get_idx();
                 
                 // Collect values from the beginning up to current position
@@ -205,7 +206,7 @@ void SMA::nextstart() {
                 // We need 'period' values ending at current_idx
                 int start_idx = std::max(0, current_idx - period + 1);
                 for (int i = start_idx; i <= current_idx; ++i) {
-                    if (i >= 0 && i < static_cast<int>(data_array.size())) {
+                    if (i >= 0 && i < data_count) {
                         double value = data_array[i];
                         if (!std::isnan(value)) {
                             values_.push_back(value);
@@ -318,18 +319,6 @@ void SMA::once(int start, int end) {
         }
     }
     
-    // Debug: Check what we're processing
-    static int once_debug = 0;
-    if (once_debug++ == 0) {
-        auto linebuf = std::dynamic_pointer_cast<LineBuffer>(data_line);
-        if (linebuf) {
-            std::cout << "SMA::once() debug:\n";
-            std::cout << "  start=" << start << ", end=" << end << "\n";
-            std::cout << "  Data array size: " << linebuf->array().size() << "\n";
-            std::cout << "  Processing " << (end - start) << " values\n";
-        }
-    }
-    
     auto sma_line = std::dynamic_pointer_cast<LineBuffer>(lines->getline(0));
     if (!sma_line || !data_line) {
         // std::cerr << "SMA::once() - no lines! sma_line=" << sma_line.get() 
@@ -346,8 +335,8 @@ void SMA::once(int start, int end) {
     if (!linebuf) {
         return;
     }
-    const auto& data_array = linebuf->array();
-    int data_size = static_cast<int>(data_array.size());
+    const double* data_array = linebuf->data_ptr();
+    int data_size = static_cast<int>(linebuf->data_size());
     
     // Adjust end to not exceed data size
     end = std::min(end, data_size);
@@ -358,49 +347,63 @@ void SMA::once(int start, int end) {
         sma_values.reserve(end - start);
     }
     
+    // Sliding window sum over [i-period+1, i]: each step adds the incoming value
+    // and drops the outgoing one, so the pass is O(N) instead of O(N * period).
+    // Kahan compensation keeps the running sum from drifting on long series.
+    // NaN values are kept out of the sum and tracked through valid_count.
+    // Infinities count as valid but are tallied apart from the finite sum,
+    // so the window recovers once they leave it.
+    double window_sum = 0.0;
+    double compensation = 0.0;
+    int valid_count = 0;
+    int pos_inf_count = 0;
+    int neg_inf_count = 0;
+    auto window_update = [&](double value, int direction) {
+        if (std::isnan(value)) {
+            return;
+        }
+        valid_count += direction;
+        if (std::isinf(value)) {
+            (value > 0 ? pos_inf_count : neg_inf_count) += direction;
+            return;
+        }
+        double y = direction * value - compensation;
+        double t = window_sum + y;
+        compensation = (t - window_sum) - y;
+        window_sum = t;
+    };
+
+    // Prime the window with the values preceding start (nested indicators
+    // process from start > 0); index start - period is dropped on the first step
+    for (int j = std::max(0, start - period); j < std::min(start, data_size); ++j) {
+        window_update(data_array[j], 1);
+    }
+
     // Process data in forward order (matching Python's behavior)
+    // In runonce mode, data is pre-loaded and we access it directly by index
     for (int i = start; i < end; ++i) {
-        // Calculate SMA for position i using the window [i-period+1, i]
-        double window_sum = 0.0;
-        int valid_count = 0;
-        
-        
-        // Calculate the range for this position
-        // When processing from start > 0 (nested indicators), adjust window accordingly
-        int window_start = std::max(0, i - period + 1);
-        int window_end = i + 1;
-        
-        // Debug output for first few calculations
-        if (i < start + 3) {
-            std::cerr << "SMA::once() - i=" << i << ", window_start=" << window_start 
-                      << ", window_end=" << window_end << ", period=" << period << std::endl;
-        }
-        
-        
-        // Sum up the window
-        // In runonce mode, data is pre-loaded and we access it directly by index
-        for (int j = window_start; j < window_end; ++j) {
-            // Access the value at absolute position j using array()
-            // data_array was already obtained above
-            if (j >= 0 && j < data_size) {
-                double value = data_array[j];
-                
-                if (!std::isnan(value)) {
-                    window_sum += value;
-                    valid_count++;
-                    
-                }
-                
-            }
+        window_update(data_array[i], 1);
+
+        int outgoing_idx = i - period;
+        if (outgoing_idx >= 0) {
+            window_update(data_array[outgoing_idx], -1);
         }
-        
+
         // Calculate SMA value
         double result_value;
         // Check if we have enough data points for SMA calculation
         // For SMA with period=30, we need at least 30 values
         // The first valid SMA value is at index period-1 (29 for period=30)
         if (valid_count == period && i >= period - 1) {
-            result_value = window_sum / period;
+            if (pos_inf_count > 0 && neg_inf_count > 0) {
+                result_value = std::numeric_limits<double>::quiet_NaN();
+            } else if (pos_inf_count > 0) {
+                result_value = std::numeric_limits<double>::infinity();
+            } else if (neg_inf_count > 0) {
+                result_value = -std::numeric_limits<double>::infinity();
+            } else {
+                result_value = window_sum / period;
+            }
         } else {
             result_value = std::numeric_limits<double>::quiet_NaN();
         }
@@ -414,26 +417,7 @@ void SMA::once(int start, int end) {
     // Use reset() instead of clear() to maintain proper initial state
     sma_line->reset();
     
-    // Debug: Check buffer state after reset
-    static int reset_debug = 0;
-    if (reset_debug++ == 0) {
-        std::cout << "SMA::once() after reset(): buffer size = " << sma_line->array().size() << "\n";
-    }
-    
-    // Debug: Check how many values we're appending
-    static int debug_once = 0;
-    if (debug_once++ < 3) {
-        std::cout << "SMA::once() period=" << period << ", appending " << sma_values.size() << " values to buffer\n";
-        // Also check some values at different positions
-        std::cout << "  Values at key positions:\n";
-        for (size_t j = 0; j < sma_values.size(); j += 10) {
-            std::cout << "    [" << j << "]=" << sma_values[j] << "\n";
-        }
-    }
-    
     // Append all our calculated values (first one will overwrite the initial NaN from reset)
-    static int loop_debug = 0;
-    int append_count = 0;
     for (size_t i = 0; i < sma_values.size(); ++i) {
         if (i == 0) {
             // First value: set directly at index 0 to overwrite the initial NaN
@@ -442,33 +426,11 @@ void SMA::once(int start, int end) {
             // Subsequent values: append normally
             sma_line->append(sma_values[i]);
         }
-        append_count++;
-    }
-    if (loop_debug++ == 0) {
-        std::cout << "SMA::once() set/appended " << append_count << " values in loop\n";
     }
     
     // Set LineBuffer index to last valid position for proper ago indexing
-    if (end > start && sma_line->array().size() > 0) {
-        static int setidx_debug = 0;
-        if (setidx_debug++ == 0) {
-            std::cout << "SMA::once() before set_idx: buffer size = " << sma_line->array().size() << "\n";
-        }
-        sma_line->set_idx(sma_line->array().size() - 1);
-        if (setidx_debug == 1) {
-            std::cout << "SMA::once() after set_idx: buffer size = " << sma_line->array().size() << "\n";
-            // Check what's at the current position
-            std::cout << "  Value at current idx: " << sma_line->get(0) << "\n";
-            std::cout << "  Value at idx -1: " << sma_line->get(-1) << "\n";
-            std::cout << "  Value at idx -2: " << sma_line->get(-2) << "\n";
-        }
-    }
-    
-    // Debug: Check final state
-    static int final_debug = 0;
-    if (final_debug++ == 0) {
-        std::cout << "SMA::once() final state:\n";
-        std::cout << "  SMA buffer size after once(): " << sma_line->array().size() << "\n";
+    if (end > start && sma_line->data_size() > 0) {
+        sma_line->set_idx(sma_line->data_size() - 1);
     }
     
     // CRITICAL: After calculating all values in runonce mode,
@@ -477,18 +439,12 @@ void SMA::once(int start, int end) {
 }
 
 void SMA::_once() {
-    std::cerr << "SMA::_once() called! period=" << period << std::endl;
-    
     // Get data's buflen since indicators use data's buflen in runonce mode
     size_t data_buflen = 0;
     if (data) {
         data_buflen = data->buflen();
     }
     
-    std::cerr << "SMA::_once() - data_buflen=" << data_buflen 
-              << ", minperiod_=" << minperiod_ 
-              << ", period=" << period << std::endl;
-    
     // DON'T forward - this moves the index past calculated values
     // Just calculate all values at the current position
     
@@ -498,20 +454,17 @@ void SMA::_once() {
     // Handle case where data_buflen < minperiod_
     if (data_buflen < minperiod_) {
         // Not enough data for SMA calculation
-        std::cerr << "SMA::_once() - Not enough data, calling preonce(0, " << data_buflen << ")" << std::endl;
         preonce(0, data_buflen);
     } else {
         // For SMA, we need to calculate all values from the beginning
         // not just from minperiod onwards
-        std::cerr << "SMA::_once() - Calculating all values, calling once(0, " << data_buflen << ")" << std::endl;
         once(0, data_buflen);
     }
     
     // After calculating, position at the last valid index
     auto sma_line = std::dynamic_pointer_cast<LineBuffer>(lines->getline(0));
-    if (sma_line && sma_line->array().size() > 0) {
-        sma_line->set_idx(sma_line->array().size() - 1);
-        std::cerr << "SMA::_once() - Positioned at index " << sma_line->get_idx() << std::endl;
+    if (sma_line && sma_line->data_size() > 0) {
+        sma_line->set_idx(sma_line->data_size() - 1);
     }
     
     // Execute binding synchronization if any
@@ -576,16 +529,8 @@ double SMA::get(int ago) const {
         // In runonce mode, buflen() will be much larger than size()
         // because once() calculates all values at once
         size_t buflen = buffer->buflen();
-        size_t cur_size = buffer->size();
         int idx = buffer->get_idx();
         
-        if (get_count <= 30) {
-            std::cerr << "SMA::get(" << ago << ") #" << get_count 
-                      << " - idx=" << idx
-                      << ", size=" << cur_size 
-                      << ", buflen=" << buflen << std::endl;
-        }
-        
         // In runonce mode with positioned buffer (used during Strategy::once())
         // The buffer's idx tells us which bar we're currently at
         // For lookback (ago > 0), we need to access idx - ago
@@ -595,27 +540,14 @@ double SMA::get(int ago) const {
         if (is_runonce_positioned) {
             // We're in runonce mode with a positioned buffer
             // Access the value at the correct position
-            const auto& array = buffer->array();
-            
             // Calculate the actual position to access
             int target_idx = idx - ago;
             
             // Check bounds
-            if (target_idx >= 0 && target_idx < static_cast<int>(array.size())) {
-                double result = array[target_idx];
-                if (get_count <= 30) {
-                    std::cerr << "SMA::get(" << ago << ") #" << get_count 
-                              << " - runonce mode, target_idx=" << target_idx 
-                              << ", result=" << result << std::endl;
-                }
-                return result;
+            if (target_idx >= 0 && target_idx < static_cast<int>(buffer->data_size())) {
+                return buffer->data_ptr()[target_idx];
             } else {
                 // Out of bounds - return NaN
-                if (get_count <= 30) {
-                    std::cerr << "SMA::get(" << ago << ") #" << get_count 
-                              << " - runonce mode, target_idx=" << target_idx 
-                              << " out of bounds, returning NaN" << std::endl;
-                }
                 return std::numeric_limits<double>::quiet_NaN();
             }
         }
@@ -624,24 +556,13 @@ double SMA::get(int ago) const {
     // Fall back to standard LineBuffer indexing for non-runonce mode or negative indices
     // LineBuffer already implements Python indexing convention correctly
     // Just pass the ago value directly
-    double result = (*sma_line)[ago];
-    
-    if (get_count <= 30) {
-        std::cerr << "SMA::get(" << ago << ") #" << get_count << " - standard mode, result=" << result << std::endl;
-    }
-    
-    return result;
+    return (*sma_line)[ago];
 }
 
 void SMA::calculate() {
     static int calc_count = 0;
     calc_count++;
     
-    // Debug: Track calls
-    if (calc_count <= 5) {
-        std::cout << "SMA::calculate() call #" << calc_count << "\n";
-    }
-    
     // Handle different data sources
     std::shared_ptr<LineSingle> data_line;
     
@@ -738,8 +659,8 @@ void SMA::calculate() {
     //           << ", minperiod_=" << minperiod_ << std::endl;
     
     // Also check the array size directly
-    const auto& data_array = linebuf->array();
-    size_t array_size = data_array.size();
+    const double* data_array = linebuf->data_ptr();
+    size_t array_size = linebuf->data_size();
     // std::cerr << "SMA::calculate() NEW #" << calc_count << " - array_size=" << array_size << std::endl;
     
     // For test framework compatibility: check data_size() which gives total data loaded
@@ -752,14 +673,6 @@ void SMA::calculate() {
         // For nested indicators, use batch mode if source has complete data
         // Process nested indicator data
         
-        // Debug output
-        static int nested_debug = 0;
-        if (nested_debug++ == 0) {
-            std::cout << "SMA::calculate() nested indicator mode:\n";
-            std::cout << "  array_size: " << array_size << "\n";
-            std::cout << "  minperiod_: " << minperiod_ << "\n";
-        }
-        
         // Check if the first element is the initial NaN
         bool has_initial_nan = false;
         if (array_size > 0 && std::isnan(data_array[0])) {
@@ -771,10 +684,6 @@ void SMA::calculate() {
             int start_idx = has_initial_nan ? 1 : 0;
             int end_idx = static_cast<int>(array_size);
             
-            if (nested_debug == 1) {
-                std::cout << "  Calling once(" << start_idx << ", " << end_idx << ")\n";
-            }
-            
             // Use batch processing for the complete series
             SMA::once(start_idx, end_idx);
         } else {
@@ -788,24 +697,8 @@ void SMA::calculate() {
         // If we have pre-loaded data (batch mode), use once() for efficient calculation
         // Check if we have more data than just the initial NaN
         if (total_data_size > static_cast<size_t>(period)) {
-            // Debug: Check what we're calculating
-            static int calc_debug = 0;
-            if (calc_debug++ == 0) {
-                std::cout << "SMA::calculate() batch mode:\n";
-                std::cout << "  total_data_size: " << total_data_size << "\n";
-                std::cout << "  Calling once(0, " << total_data_size << ")\n";
-            }
             // Use data_size() for the actual data count
             once(0, static_cast<int>(total_data_size));
-            
-            // Debug: Check buffer size after once()
-            static int after_once_debug = 0;
-            if (after_once_debug++ == 0) {
-                auto sma_line = std::dynamic_pointer_cast<LineBuffer>(lines->getline(0));
-                if (sma_line) {
-                    std::cout << "SMA::calculate() after once(): buffer size = " << sma_line->array().size() << "\n";
-                }
-            }
         } else {
             // Streaming mode - use the phase-based approach
             size_t current_len = data_line->size();
@@ -160,7 +160,7 @@ void SimpleMovingAverageOscillator::calculate() {
     
     // Calculate all values
     for (size_t i = 0; i < data_size; ++i) {
-        double price = data_buffer->array()[i];
+        double price = data_buffer->data_ptr()[i];
         
         // Add to price buffer
         price_buffer_.push_back(price);
@@ -323,7 +323,8 @@ void SmoothedMovingAverage::once(int start, int end) {
     // Initial value is calculated as SMA of first 'period' values
     
     smma_line->reset();  // Clear any existing data
-    std::vector<double> smma_values;  // Store calculated SMMA values
+    // The recursion only needs the previous value, so keep it in a scalar
+    double prev_smma = std::numeric_limits<double>::quiet_NaN();
     
     // Ensure we don't exceed array bounds
     const size_t array_size = data_array.size();
@@ -356,35 +357,24 @@ void SmoothedMovingAverage::once(int start, int end) {
                 sum += data_array[j];
             }
             
-            if (all_valid) {
-                double first_smma = sum / params.period;
-                smma_values.push_back(first_smma);
-                smma_line->append(first_smma);
-            } else {
-                smma_values.push_back(std::numeric_limits<double>::quiet_NaN());
-                smma_line->append(std::numeric_limits<double>::quiet_NaN());
-            }
+            prev_smma = all_valid ? sum / params.period : std::numeric_limits<double>::quiet_NaN();
+            smma_line->append(prev_smma);
         } else {
             // Subsequent SMMA values: exponential smoothing
             // SMMA = prev_smma * (1 - alpha) + current_value * alpha
             // where alpha = 1/period
-            if (!smma_values.empty() && !std::isnan(smma_values.back()) && 
-                i < array_size && !std::isnan(data_array[i])) {
-                double prev_smma = smma_values.back();
-                double current_value = data_array[i];
-                double new_smma = prev_smma * alpha1_ + current_value * alpha_;
-                smma_values.push_back(new_smma);
-                smma_line->append(new_smma);
+            if (!std::isnan(prev_smma) && i < array_size && !std::isnan(data_array[i])) {
+                prev_smma = prev_smma * alpha1_ + data_array[i] * alpha_;
             } else {
-                smma_values.push_back(std::numeric_limits<double>::quiet_NaN());
-                smma_line->append(std::numeric_limits<double>::quiet_NaN());
+                prev_smma = std::numeric_limits<double>::quiet_NaN();
             }
+            smma_line->append(prev_smma);
         }
     }
     
     // Set the LineBuffer index to the last element
-    if (smma_line->array().size() > 0) {
-        smma_line->set_idx(smma_line->array().size() - 1);
+    if (smma_line->data_size() > 0) {
+        smma_line->set_idx(smma_line->data_size() - 1);
     }
 }
 
@@ -2,6 +2,7 @@
 #include "functions.h"
 #include <algorithm>
 #include <cmath>
+#include <deque>
 #include <limits>
 #include <typeinfo>
 
@@ -64,9 +65,9 @@ void StochasticBase::calculate() {
     int current_size = 0;
     if (line_buffer->size() == 0) {
         // Streaming mode - use array size
-        current_size = static_cast<int>(line_buffer->array().size());
+        current_size = static_cast<int>(line_buffer->data_size());
         // Adjust for initial NaN
-        if (current_size > 0 && std::isnan(line_buffer->array()[0])) {
+        if (current_size > 0 && std::isnan(line_buffer->data_ptr()[0])) {
             current_size--;
         }
     } else {
@@ -664,7 +665,7 @@ void Stochastic::calculate_lines() {
         auto buffer = std::dynamic_pointer_cast<LineBuffer>(first_line);
         if (buffer) {
             if (buffer->size() == 0) {
-                data_size = static_cast<int>(buffer->array().size());
+                data_size = static_cast<int>(buffer->data_size());
             } else {
                 data_size = static_cast<int>(buffer->size());
             }
@@ -1099,7 +1100,7 @@ void Stochastic::calculate() {
         // Check if this looks like batch mode: 
         // - high_buffer has much more data than k_buffer (indicating pre-loaded data)
         // - AND k_buffer has very few values (indicating we haven't started calculating)
-        if (high_buffer->array().size() > params.period * 2 && k_buffer->array().size() <= 1) {
+        if (high_buffer->data_size() > params.period * 2 && k_buffer->data_size() <= 1) {
             // This is likely batch mode - all data loaded at once
             is_streaming_mode = false;
         }
@@ -1150,12 +1151,12 @@ void Stochastic::calculate() {
         
         // Batch mode - check if already calculated
         // high_buffer already obtained above
-        if (!is_streaming_mode && high_buffer && high_buffer->array().size() > params.period) {
+        if (!is_streaming_mode && high_buffer && high_buffer->data_size() > params.period) {
             // Debug
-            int input_data_size = static_cast<int>(high_buffer->array().size());
+            int input_data_size = static_cast<int>(high_buffer->data_size());
             if (input_data_size >= 15 && input_data_size <= 20) {
             }
-            if (k_buffer->array().size() <= 1) {  // Only initial NaN
+            if (k_buffer->data_size() <= 1) {  // Only initial NaN
                 calculate_with_separate_lines();
             }
             return;
@@ -1203,16 +1204,16 @@ void Stochastic::calculate_with_separate_lines() {
         return;
     }
     
-    auto high_array = high_buffer->array();
-    auto low_array = low_buffer->array();
-    auto close_array = close_buffer->array();
-    
-    if (high_array.empty() || low_array.empty() || close_array.empty()) {
+    // Read the three inputs in place and scan them together over their common length
+    int data_size = static_cast<int>(std::min({high_buffer->data_size(),
+                                               low_buffer->data_size(),
+                                               close_buffer->data_size()}));
+    if (data_size == 0) {
         return;
     }
     
-    int data_size = static_cast<int>(high_array.size());
-    calculate_stochastic_values(high_array, low_array, close_array, data_size);
+    calculate_stochastic_values(high_buffer->data_ptr(), low_buffer->data_ptr(),
+                                close_buffer->data_ptr(), data_size);
 }
 
 void Stochastic::calculate_with_single_datasource() {
@@ -1229,19 +1230,18 @@ void Stochastic::calculate_with_single_datasource() {
     
     if (!high_buffer || !low_buffer || !close_buffer) return;
     
-    auto high_array = high_buffer->array();
-    auto low_array = low_buffer->array();
-    auto close_array = close_buffer->array();
-    
-    if (high_array.empty() || low_array.empty() || close_array.empty()) return;
+    int data_size = static_cast<int>(std::min({high_buffer->data_size(),
+                                               low_buffer->data_size(),
+                                               close_buffer->data_size()}));
+    if (data_size == 0) return;
     
-    int data_size = static_cast<int>(high_array.size());
-    calculate_stochastic_values(high_array, low_array, close_array, data_size);
+    calculate_stochastic_values(high_buffer->data_ptr(), low_buffer->data_ptr(),
+                                close_buffer->data_ptr(), data_size);
 }
 
-void Stochastic::calculate_stochastic_values(const std::vector<double>& high_array, 
-                                           const std::vector<double>& low_array,
-                                           const std::vector<double>& close_array,
+void Stochastic::calculate_stochastic_values(const double* high_array, 
+                                           const double* low_array,
+                                           const double* close_array,
                                            int data_size) {
     auto k_line = std::dynamic_pointer_cast<LineBuffer>(lines->getline(percK));
     auto d_line = std::dynamic_pointer_cast<LineBuffer>(lines->getline(percD));
@@ -1262,29 +1262,45 @@ void Stochastic::calculate_stochastic_values(const std::vector<double>& high_arr
     
     // Step 1: Calculate raw %K values for each data point
     std::vector<double> raw_k_values;
+    raw_k_values.reserve(data_size);
+    
+    // Monotonic index queues over the current window: the front of each is
+    // the highest high / lowest low, so every bar is pushed and popped once
+    // instead of rescanning all 'period' bars per position. NaNs never enter.
+    std::deque<int> high_window;
+    std::deque<int> low_window;
     
     for (int i = 0; i < data_size; ++i) {
+        if (!std::isnan(high_array[i])) {
+            while (!high_window.empty() && high_array[high_window.back()] <= high_array[i]) {
+                high_window.pop_back();
+            }
+            high_window.push_back(i);
+        }
+        if (!std::isnan(low_array[i])) {
+            while (!low_window.empty() && low_array[low_window.back()] >= low_array[i]) {
+                low_window.pop_back();
+            }
+            low_window.push_back(i);
+        }
+        while (!high_window.empty() && high_window.front() <= i - params.period) {
+            high_window.pop_front();
+        }
+        while (!low_window.empty() && low_window.front() <= i - params.period) {
+            low_window.pop_front();
+        }
+        
         if (i < params.period - 1) {
             // Not enough data for calculation
             raw_k_values.push_back(std::numeric_limits<double>::quiet_NaN());
         } else {
-            // Calculate highest high and lowest low over the period
-            double highest = -std::numeric_limits<double>::max();
-            double lowest = std::numeric_limits<double>::max();
-            
-            for (int j = 0; j < params.period; ++j) {
-                int idx = i - j;
-                if (idx >= 0 && idx < static_cast<int>(high_array.size())) {
-                    if (!std::isnan(high_array[idx]) && high_array[idx] > highest) {
-                        highest = high_array[idx];
-                    }
-                    if (!std::isnan(low_array[idx]) && low_array[idx] < lowest) {
-                        lowest = low_array[idx];
-                    }
-                }
-            }
+            // Highest high and lowest low over the period
+            double highest = high_window.empty() ? -std::numeric_limits<double>::max()
+                                                 : high_array[high_window.front()];
+            double lowest = low_window.empty() ? std::numeric_limits<double>::max()
+                                               : low_array[low_window.front()];
             
-            double current_close = (i < static_cast<int>(close_array.size())) ? close_array[i] : std::numeric_limits<double>::quiet_NaN();
+            double current_close = close_array[i];
             
             double raw_k = 0.0;
             if (highest != lowest && !std::isnan(current_close)) {
@@ -1365,13 +1381,13 @@ void Stochastic::calculate_stochastic_values(const std::vector<double>& high_arr
     
     // After batch processing, position LineBuffer to use the most recent calculated values
     // For batch mode, we want to access the latest calculated values
-    if (!k_line->array().empty()) {
+    if (k_line->data_size() > 0) {
         // Position to the last calculated value
-        k_line->set_idx(k_line->array().size() - 1);
+        k_line->set_idx(k_line->data_size() - 1);
     }
-    if (!d_line->array().empty()) {
+    if (d_line->data_size() > 0) {
         // Position to the last calculated value  
-        d_line->set_idx(d_line->array().size() - 1);
+        d_line->set_idx(d_line->data_size() - 1);
     }
 }
 
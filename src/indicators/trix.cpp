@@ -105,7 +105,7 @@ void Trix::calculate() {
                     // Ensure the TRIX buffer has the correct index for size() method
                     auto trix_line = lines->getline(trix);
                     auto trix_buffer = std::dynamic_pointer_cast<LineBuffer>(trix_line);
-                    if (trix_buffer && trix_buffer->array().size() > 0) {
+                    if (trix_buffer && trix_buffer->data_size() > 0) {
                         // Set index to last valid position so size() returns correct value
                         trix_buffer->set_idx(static_cast<int>(data_array.size()) - 1);
                     }
@@ -260,7 +260,7 @@ void Trix::once(int start, int end) {
     
     // Fill TRIX output buffer first, then calculate TRIX values
     // Need to match the input buffer size and structure
-    if (trix_buffer->array().size() == 0) {
+    if (trix_buffer->data_size() == 0) {
         // Initialize buffer with same size as input
         for (size_t i = 0; i < data_size; ++i) {
             if (i == 0) {
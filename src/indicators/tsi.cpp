@@ -246,7 +246,7 @@ void TrueStrengthIndicator::once(int start, int end) {
     }
     
     // Fill TSI output buffer
-    if (tsi_buffer->array().size() == 0) {
+    if (tsi_buffer->data_size() == 0) {
         // Initialize buffer with same size as input
         for (size_t i = 0; i < data_size; ++i) {
             if (i == 0) {
@@ -312,7 +312,7 @@ void TrueStrengthIndicator::calculate() {
                     // Ensure the TSI buffer has the correct index for size() method
                     auto tsi_line = lines->getline(tsi);
                     auto tsi_buffer = std::dynamic_pointer_cast<LineBuffer>(tsi_line);
-                    if (tsi_buffer && tsi_buffer->array().size() > 0) {
+                    if (tsi_buffer && tsi_buffer->data_size() > 0) {
                         // Set index to last valid position so size() returns correct value
                         tsi_buffer->set_idx(static_cast<int>(data_array.size()) - 1);
                     }
@@ -270,7 +270,7 @@ double DownMove::get(int ago) const {
     if (buffer && ago >= 0) {
         int index = buffer->size() - 1 - ago;
         if (index >= 0 && index < buffer->size()) {
-            return buffer->array()[index];
+            return buffer->data_ptr()[index];
         }
     }
     
@@ -324,7 +324,7 @@ void DownMove::calculate() {
     std::cout << "DownMove::calculate() - data_size: " << data_size << std::endl;
     std::cout << "First 5 data values: ";
     for (int i = 0; i < std::min(5, data_size); ++i) {
-        std::cout << data_buffer->array()[i] << " ";
+        std::cout << data_buffer->data_ptr()[i] << " ";
     }
     std::cout << std::endl;
     
@@ -335,8 +335,8 @@ void DownMove::calculate() {
     // Process remaining data points
     for (int i = 1; i < data_size; ++i) {
         // DownMove formula: prev - current
-        double current_val = data_buffer->array()[i];
-        double prev_val = data_buffer->array()[i-1];
+        double current_val = data_buffer->data_ptr()[i];
+        double prev_val = data_buffer->data_ptr()[i-1];
         double downmove = prev_val - current_val;  // DownMove can be negative
         
         if (i <= 5) {
@@ -356,7 +356,7 @@ void DownMove::calculate() {
     // Debug: Show a few values from the output
     std::cout << "Output buffer first 10: ";
     for (int i = 0; i < std::min(10, (int)downmove_line->size()); ++i) {
-        std::cout << downmove_line->array()[i] << " ";
+        std::cout << downmove_line->data_ptr()[i] << " ";
     }
     std::cout << std::endl;
 }
@@ -378,7 +378,7 @@ double Vortex::getVIPlus(int ago) const {
     if (buffer && ago < 0) {
         int idx = static_cast<int>(buffer->size()) - 1 + ago;
         if (idx >= 0 && idx < static_cast<int>(buffer->size())) {
-            return buffer->array()[idx];
+            return buffer->data_ptr()[idx];
         }
         return std::numeric_limits<double>::quiet_NaN();
     }
@@ -401,7 +401,7 @@ double Vortex::getVIMinus(int ago) const {
     if (buffer && ago < 0) {
         int idx = static_cast<int>(buffer->size()) - 1 + ago;
         if (idx >= 0 && idx < static_cast<int>(buffer->size())) {
-            return buffer->array()[idx];
+            return buffer->data_ptr()[idx];
         }
         return std::numeric_limits<double>::quiet_NaN();
     }
@@ -184,7 +184,7 @@ void WeightedMovingAverage::calculate() {
             auto data_buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
             if (data_buffer) {
                 // Use the array size minus 1 (since array[0] is NaN)
-                once(0, data_buffer->array().size() - 1);
+                once(0, data_buffer->data_size() - 1);
             }
         }
     } else if (data && data->lines && data->lines->size() > 0) {
@@ -193,7 +193,7 @@ void WeightedMovingAverage::calculate() {
         auto data_buffer = std::dynamic_pointer_cast<LineBuffer>(data_line);
         if (data_buffer) {
             // Use the array size minus 1 (since array[0] is NaN)
-            once(0, data_buffer->array().size() - 1);
+            once(0, data_buffer->data_size() - 1);
         }
     } else {
         // For normal constructor, use the existing next() logic
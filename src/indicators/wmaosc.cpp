@@ -182,7 +182,7 @@ void WeightedMovingAverageOscillator::calculate() {
     
     // Call once() to perform batch calculation
     // Use the array size minus 1 (since array[0] is NaN)
-    int data_size = static_cast<int>(data_line->array().size() - 1);
+    int data_size = static_cast<int>(data_line->data_size() - 1);
     once(0, data_size);
 }
 
@@ -280,9 +280,8 @@ void WeightedMovingAverageOscillator::once(int start, int end) {
             // Note: array[0] is NaN, actual data starts at array[1]
             double data_value = (i + 1 < static_cast<int>(data_array.size())) ? data_array[i + 1] : std::numeric_limits<double>::quiet_NaN();
             
-            const auto& wma_array = wma_line->array();
             // WMA array starts with NaN at index 0, so we need to offset by 1
-            double wma_value = (i + 1 < static_cast<int>(wma_array.size())) ? wma_array[i + 1] : std::numeric_limits<double>::quiet_NaN();
+            double wma_value = (i + 1 < static_cast<int>(wma_line->data_size())) ? wma_line->data_ptr()[i + 1] : std::numeric_limits<double>::quiet_NaN();
             
             if (!std::isnan(data_value) && !std::isnan(wma_value)) {
                 wmaosc_line->append(data_value - wma_value);
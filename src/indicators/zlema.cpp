@@ -157,7 +157,7 @@ void ZeroLagExponentialMovingAverage::next() {
         zlema_line->append(sma_seed);
     } else {
         // Calculate EMA
-        double prev_ema = zlema_line->array()[current_size - 1];
+        double prev_ema = zlema_line->data_ptr()[current_size - 1];
         double new_ema = alpha * zl_data + (1.0 - alpha) * prev_ema;
         zlema_line->append(new_ema);
     }
@@ -258,7 +258,7 @@ void ZeroLagIndicator::once(int start, int end) {
         }
         
         // Get previous EC value for error correction
-        double ec1 = ec_buffer->array().back();
+        double ec1 = ec_buffer->data_ptr()[ec_buffer->data_size() - 1];
         if (std::isnan(ec1) || !std::isfinite(ec1)) {
             // If previous value is invalid, use EMA
             ec1 = ema_value;
@@ -123,9 +123,6 @@ void LineIterator::_next() {
             }
         }
         
-        bool is_crossover = dynamic_cast<CrossOver*>(this) != nullptr;
-        bool is_crossbase = dynamic_cast<CrossBase*>(this) != nullptr;
-        bool is_nzd = dynamic_cast<NonZeroDifference*>(this) != nullptr;
         bool is_sma = dynamic_cast<indicators::SMA*>(this) != nullptr;
         
         // Extra debug for SMA type checking
@@ -146,15 +143,6 @@ void LineIterator::_next() {
                       << " (IndType=" << static_cast<int>(LineRoot::IndType::IndType) << ")" << std::endl;
         }
         
-        if ((debug_count <= 10 && _ltype == LineRoot::IndType::IndType) || is_crossover || is_crossbase || is_nzd || is_sma) {
-            std::cerr << "LineIterator::_next() - Indicator " << this 
-                      << ": current_len=" << current_len << ", minperiod_=" << minperiod_ 
-                      << ", is_crossover=" << is_crossover 
-                      << ", is_crossbase=" << is_crossbase
-                      << ", is_nzd=" << is_nzd
-                      << ", is_sma=" << is_sma
-                      << ", _clock=" << (_clock ? "set" : "null") << std::endl;
-        }
         // Debug transition logic
         if (is_sma && debug_count <= 30) {
             std::cerr << "LineIterator::_next() - SMA transition check: current_len=" << current_len 
@@ -134,7 +134,7 @@ bool Lines::has_alias(const std::string& name) const {
     return aliases_.find(name) != aliases_.end();
 }
 
-std::vector<std::string> Lines::get_aliases() const {
+const std::vector<std::string>& Lines::get_aliases() const {
     return aliases_order_;  // Return in insertion order
 }
 
@@ -184,7 +184,7 @@ std::string LineSeries::getlinealias(size_t idx) const {
         return "";
     }
     
-    auto aliases = lines->get_aliases();
+    const auto& aliases = lines->get_aliases();
     if (idx >= aliases.size()) {
         return "";
     }
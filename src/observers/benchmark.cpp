@@ -172,6 +172,8 @@ double Benchmark::calculate_beta(const std::vector<double>& strategy_returns,
     
     // Calculate daily returns (differences)
     std::vector<double> strategy_daily, benchmark_daily;
+    strategy_daily.reserve(strategy_returns.size() - 1);
+    benchmark_daily.reserve(benchmark_returns.size() - 1);
     
     for (size_t i = 1; i < strategy_returns.size(); ++i) {
         strategy_daily.push_back(strategy_returns[i] - strategy_returns[i-1]);
@@ -198,12 +200,23 @@ double Benchmark::calculate_correlation(const std::vector<double>& x,
         return 0.0;
     }
     
-    double covariance = calculate_covariance(x, y);
-    double std_x = std::sqrt(calculate_variance(x));
-    double std_y = std::sqrt(calculate_variance(y));
+    // Means are computed once; covariance and both variances accumulate in one pass
+    double mean_x = calculate_mean(x);
+    double mean_y = calculate_mean(y);
+    
+    double sum_xy = 0.0;
+    double sum_xx = 0.0;
+    double sum_yy = 0.0;
+    for (size_t i = 0; i < x.size(); ++i) {
+        double dx = x[i] - mean_x;
+        double dy = y[i] - mean_y;
+        sum_xy += dx * dy;
+        sum_xx += dx * dx;
+        sum_yy += dy * dy;
+    }
     
-    if (std_x > 0.0 && std_y > 0.0) {
-        return covariance / (std_x * std_y);
+    if (sum_xx > 0.0 && sum_yy > 0.0) {
+        return sum_xy / std::sqrt(sum_xx * sum_yy);
     }
     
     return 0.0;
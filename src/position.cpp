@@ -23,9 +23,6 @@ Position::Position(double size_val, double price_val) {
 }
 
 void Position::update(double new_size, double new_price) {
-    std::cerr << "Position::update called - current size=" << size 
-              << ", new_size=" << new_size << ", new_price=" << new_price << std::endl;
-    
     // Calculate new average price if adding to position
     if (size != 0.0 && new_size != 0.0) {
         // Same direction - calculate weighted average
@@ -338,9 +338,6 @@ void Strategy::_addnotification(std::shared_ptr<Order> order) {
 
 void Strategy::_notify() {
     // Process pending order notifications
-    std::cerr << "Strategy::_notify - _orderspending.size()=" << _orderspending.size() 
-              << ", _tradespending.size()=" << _tradespending.size() << std::endl;
-              
     for (auto& order : _orderspending) {
         notify_order(order);  // Call the shared_ptr version only
         // Note: The const ref version is for backward compatibility but should not be called here
@@ -2,6 +2,7 @@
 #include <algorithm>
 #include <ctime>
 #include <iomanip>
+#include <utility>
 
 namespace backtrader {
 
@@ -125,28 +126,37 @@ TradingCalendar::schedule(const std::chrono::system_clock::time_point& day) {
 }
 
 void TradingCalendar::add_holiday(const std::chrono::system_clock::time_point& holiday) {
-    params.holidays.push_back(holiday);
-    std::sort(params.holidays.begin(), params.holidays.end());
+    // Insert in place so params.holidays stays sorted and unique
+    auto it = std::lower_bound(params.holidays.begin(), params.holidays.end(), holiday);
+    if (it == params.holidays.end() || *it != holiday) {
+        params.holidays.insert(it, holiday);
+    }
 }
 
 void TradingCalendar::remove_holiday(const std::chrono::system_clock::time_point& holiday) {
-    auto it = std::find(params.holidays.begin(), params.holidays.end(), holiday);
-    if (it != params.holidays.end()) {
+    auto it = std::lower_bound(params.holidays.begin(), params.holidays.end(), holiday);
+    if (it != params.holidays.end() && *it == holiday) {
         params.holidays.erase(it);
     }
 }
 
+void TradingCalendar::set_holidays(std::vector<std::chrono::system_clock::time_point> holidays) {
+    std::sort(holidays.begin(), holidays.end());
+    holidays.erase(std::unique(holidays.begin(), holidays.end()), holidays.end());
+    params.holidays = std::move(holidays);
+}
+
 bool TradingCalendar::is_holiday(const std::chrono::system_clock::time_point& day) const {
-    // Compare only dates, not times
+    // Compare only dates, not times. Holidays are kept sorted, so their
+    // dates are too and a binary search replaces the per-day linear scan
     auto day_date = std::chrono::floor<std::chrono::days>(day);
     
-    for (const auto& holiday : params.holidays) {
-        auto holiday_date = std::chrono::floor<std::chrono::days>(holiday);
-        if (day_date == holiday_date) {
-            return true;
-        }
-    }
-    return false;
+    auto it = std::lower_bound(params.holidays.begin(), params.holidays.end(), day_date,
+        [](const std::chrono::system_clock::time_point& holiday, const auto& date) {
+            return std::chrono::floor<std::chrono::days>(holiday) < date;
+        });
+    return it != params.holidays.end() && 
+           std::chrono::floor<std::chrono::days>(*it) == day_date;
 }
 
 bool TradingCalendar::is_trading_day(const std::chrono::system_clock::time_point& day) const {
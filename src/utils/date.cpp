@@ -12,6 +12,22 @@ const TimePoint TIME_MAX = TimePoint::max();
 const TimePoint TIME_MIN = TimePoint::min();
 const std::string UTC_TIMEZONE = "UTC";
 
+namespace {
+
+// Supported strftime/strptime formats; anything else falls back to the default
+const char* resolve_date_format(const std::string& format) {
+    static const std::map<std::string, const char*> formats = {
+        {"%Y-%m-%d", "%Y-%m-%d"},
+        {"%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S"},
+        {"%d/%m/%Y", "%d/%m/%Y"},
+        {"%m/%d/%Y", "%m/%d/%Y"},
+    };
+    auto it = formats.find(format);
+    return it != formats.end() ? it->second : "%Y-%m-%d %H:%M:%S";
+}
+
+} // anonymous namespace
+
 // Core conversion functions
 std::tm num2date(double num) {
     // Convert numeric timestamp to date (similar to Python's num2date)
@@ -47,19 +63,7 @@ std::tm num2time(double num) {
 TimePoint str2datetime(const std::string& date_str, const std::string& format) {
     std::tm tm = {};
     std::istringstream ss(date_str);
-    
-    if (format == "%Y-%m-%d") {
-        ss >> std::get_time(&tm, "%Y-%m-%d");
-    } else if (format == "%Y-%m-%d %H:%M:%S") {
-        ss >> std::get_time(&tm, "%Y-%m-%d %H:%M:%S");
-    } else if (format == "%d/%m/%Y") {
-        ss >> std::get_time(&tm, "%d/%m/%Y");
-    } else if (format == "%m/%d/%Y") {
-        ss >> std::get_time(&tm, "%m/%d/%Y");
-    } else {
-        // Default format
-        ss >> std::get_time(&tm, "%Y-%m-%d %H:%M:%S");
-    }
+    ss >> std::get_time(&tm, resolve_date_format(format));
     
     if (ss.fail()) {
         throw std::invalid_argument("Failed to parse date string: " + date_str);
@@ -73,19 +77,7 @@ std::string datetime2str(const TimePoint& tp, const std::string& format) {
     auto tm = *std::localtime(&time_t);
     
     std::ostringstream ss;
-    
-    if (format == "%Y-%m-%d") {
-        ss << std::put_time(&tm, "%Y-%m-%d");
-    } else if (format == "%Y-%m-%d %H:%M:%S") {
-        ss << std::put_time(&tm, "%Y-%m-%d %H:%M:%S");
-    } else if (format == "%d/%m/%Y") {
-        ss << std::put_time(&tm, "%d/%m/%Y");
-    } else if (format == "%m/%d/%Y") {
-        ss << std::put_time(&tm, "%m/%d/%Y");
-    } else {
-        // Default format
-        ss << std::put_time(&tm, "%Y-%m-%d %H:%M:%S");
-    }
+    ss << std::put_time(&tm, resolve_date_format(format));
     
     return ss.str();
 }
@@ -153,19 +145,11 @@ TimePoint get_last_timeframe_timestamp(const TimePoint& dt, int timeframe) {
 // TimeZone implementation
 TimeZone::TimeZone(const std::string& tz_name) : name_(tz_name) {
     // Simple timezone mapping - in a full implementation this would be more comprehensive
-    if (tz_name == "UTC" || tz_name == "GMT") {
-        offset_hours_ = 0;
-    } else if (tz_name == "EST") {
-        offset_hours_ = -5;
-    } else if (tz_name == "PST") {
-        offset_hours_ = -8;
-    } else if (tz_name == "CET") {
-        offset_hours_ = 1;
-    } else if (tz_name == "JST") {
-        offset_hours_ = 9;
-    } else {
-        offset_hours_ = 0; // Default to UTC
-    }
+    static const std::map<std::string, int> offsets = {
+        {"UTC", 0}, {"GMT", 0}, {"EST", -5}, {"PST", -8}, {"CET", 1}, {"JST", 9},
+    };
+    auto it = offsets.find(tz_name);
+    offset_hours_ = it != offsets.end() ? it->second : 0; // Default to UTC
 }
 
 TimePoint TimeZone::localize(const TimePoint& dt) const {
@@ -55,7 +55,7 @@ private:
     bool prev_above_ = false;  // Was close above SMA on previous bar?
     bool prev_valid_ = false;  // Was previous comparison valid?
     
-    std::chrono::high_resolution_clock::time_point tstart_;
+    std::chrono::steady_clock::time_point tstart_;
 
 public:
     explicit RunStrategy(const Params& params = Params()) 
@@ -185,7 +185,7 @@ public:
             log(oss.str(), 0.0, true);
         }
 
-        tstart_ = std::chrono::high_resolution_clock::now();
+        tstart_ = std::chrono::steady_clock::now();
         
         buycreate_.clear();
         sellcreate_.clear();
@@ -196,7 +196,7 @@ public:
     }
 
     void stop() override {
-        auto tend = std::chrono::high_resolution_clock::now();
+        auto tend = std::chrono::steady_clock::now();
         auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(tend - tstart_);
         
         std::cerr << "Strategy STOP called - len()=" << len() 
@@ -671,7 +671,7 @@ TEST(OriginalTests, AnalyzerSQN_SingleTrade) {
 
 // 性能测试
 TEST(OriginalTests, AnalyzerSQN_Performance) {
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 创建backtrader::Cerebro
     auto cerebro = std::make_unique<backtrader::Cerebro>();
@@ -701,7 +701,7 @@ TEST(OriginalTests, AnalyzerSQN_Performance) {
     // 运行回测
     auto results = cerebro->run(0, true, false);  // Use next mode
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "SQN analyzer test with multiple analyzers took " 
@@ -44,7 +44,7 @@ private:
     std::vector<std::string> buyexec_;
     std::vector<std::string> sellexec_;
     
-    std::chrono::high_resolution_clock::time_point tstart_;
+    std::chrono::steady_clock::time_point tstart_;
     int next_call_count_ = 0;
     int trade_count_ = 0;
 
@@ -181,7 +181,7 @@ public:
             std::cerr << "TEST: ERROR - broker_ptr() is null!" << std::endl;
         }
 
-        tstart_ = std::chrono::high_resolution_clock::now();
+        tstart_ = std::chrono::steady_clock::now();
         
         buycreate_.clear();
         sellcreate_.clear();
@@ -190,7 +190,7 @@ public:
     }
 
     void stop() override {
-        auto tend = std::chrono::high_resolution_clock::now();
+        auto tend = std::chrono::steady_clock::now();
         auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(tend - tstart_);
         
         if (params_.printdata) {
@@ -641,7 +641,7 @@ TEST(OriginalTests, AnalyzerTimeReturn_MultipleTimeframes) {
 
 // 性能测试
 TEST(OriginalTests, AnalyzerTimeReturn_Performance) {
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 创建backtrader::Cerebro
     auto cerebro = std::make_unique<backtrader::Cerebro>();
@@ -672,7 +672,7 @@ TEST(OriginalTests, AnalyzerTimeReturn_Performance) {
     // 运行回测
     auto results = cerebro->run(0, true, false);  // Use next mode
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "TimeReturn analyzer test with multiple timeframes took " 
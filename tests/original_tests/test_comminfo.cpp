@@ -267,27 +267,26 @@ TEST(OriginalTests, CommInfo_Performance) {
     comm->setMult(10.0);
     comm->setMargin(10.0);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
-    
-    // 执行大量计算
+    // 执行大量计算，取5轮中最快的一轮
     const int iterations = 100000;
     double total = 0.0;
-    for (int i = 0; i < iterations; ++i) {
-        double price = 50.0 + (i % 100) * 0.1;
-        double size = 100.0 + (i % 50);
-        
-        total += comm->getoperationcost(size, price);
-        total += comm->getcommission(size, price);
-        total += comm->profitandloss(size, price, price * 1.1);
-        total += comm->cashadjust(size, price, price * 0.9);
-    }
-    auto end_time = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
+    auto elapsed = backtrader::tests::original::measure_min_ns([&] {
+        for (int i = 0; i < iterations; ++i) {
+            double price = 50.0 + (i % 100) * 0.1;
+            double size = 100.0 + (i % 50);
+            
+            total += comm->getoperationcost(size, price);
+            total += comm->getcommission(size, price);
+            total += comm->profitandloss(size, price, price * 1.1);
+            total += comm->cashadjust(size, price, price * 0.9);
+        }
+    });
+    auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(elapsed);
     
     std::cout << "backtrader::CommissionInfo performance test: " << iterations 
-              << " iterations took " << duration.count() << " ms" << std::endl;
+              << " iterations took " << elapsed.count() / 1000 << " us (best of 5)" << std::endl;
     std::cout << "Average time per calculation: " 
-              << (duration.count() * 1000.0 / (iterations * 4)) << " microseconds" << std::endl;
+              << (elapsed.count() / (iterations * 4.0)) << " nanoseconds" << std::endl;
     
     // 确保计算被使用，避免编译器优化
     EXPECT_GT(total, 0.0) << "Total should be positive";
@@ -2,16 +2,22 @@
 
 #include <gtest/gtest.h>
 #include <vector>
+#include <algorithm>
 #include <string>
 #include <memory>
 #include <fstream>
 #include <sstream>
 #include <iomanip>
 #include <cmath>
+#include <limits>
 #include <chrono>
 #include <unordered_map>
 #include <mutex>
 #include <ctime>
+#include <map>
+#include <random>
+#include <tuple>
+#include <iterator>
 
 // Include backtrader headers
 #include "lineseries.h"
@@ -64,8 +70,26 @@ public:
         double close;
         double volume;
         double openinterest;
+        // Unix timestamp of date, filled by loadCSV; NaN for hand-built bars
+        double timestamp = std::numeric_limits<double>::quiet_NaN();
     };
     
+    /**
+     * @brief Convert a YYYY-MM-DD date string to a Unix timestamp
+     *
+     * @return false if the string does not parse
+     */
+    static bool parse_date(const std::string& date, double& timestamp) {
+        std::tm tm = {};
+        std::istringstream ss(date);
+        ss >> std::get_time(&tm, "%Y-%m-%d");
+        if (ss.fail()) {
+            return false;
+        }
+        timestamp = static_cast<double>(std::mktime(&tm));
+        return true;
+    }
+    
     static std::vector<OHLCVData> loadCSV(const std::string& filename) {
         std::vector<OHLCVData> data;
         std::ifstream file(filename);
@@ -83,9 +107,14 @@ public:
                 std::string item;
                 OHLCVData bar;
                 
-                // Date
+                // Date, parsed once here so feeds built from the cached
+                // bars do not repeat get_time/mktime
                 if (std::getline(ss, item, ',')) {
                     bar.date = item;
+                    double timestamp = 0.0;
+                    if (parse_date(item, timestamp)) {
+                        bar.timestamp = timestamp;
+                    }
                 }
                 // Open
                 if (std::getline(ss, item, ',')) {
@@ -164,199 +193,96 @@ std::mutex DataCache::cache_mutex_;
 /**
  * @brief 测试数据获取函数，对应Python的getdata()
  */
-inline std::vector<CSVDataReader::OHLCVData> getdata(int index = 0) {
+inline const std::vector<CSVDataReader::OHLCVData>& getdata(int index = 0) {
     return DataCache::getData(index);
 }
 
+/**
+ * @brief Column-major copy of a bar series, in C++ backtrader line order
+ *
+ * Holds exactly what SimpleTestDataSeries loads into its line buffers, so a
+ * feed can be built from it with one batch_append per line.
+ */
+struct OHLCVColumns {
+    std::vector<double> datetime;
+    std::vector<double> open;
+    std::vector<double> high;
+    std::vector<double> low;
+    std::vector<double> close;
+    std::vector<double> volume;
+    std::vector<double> openinterest;
+};
+
 /**
  * @brief Simple data series for testing indicators directly
  */
 class SimpleTestDataSeries : public backtrader::DataSeries {
 private:
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    // Bars live only in the per-line column buffers; keep just the count
+    size_t data_size_;
     
 public:
-    SimpleTestDataSeries(const std::vector<CSVDataReader::OHLCVData>& data) 
-        : DataSeries(), csv_data_(data) {
-        
-        // std::cerr << "SimpleTestDataSeries: Loading " << csv_data_.size() << " data points" << std::endl;
-        
-        // DON'T re-initialize lines - DataSeries constructor already created them in the correct order!
-        // Just use the existing lines from DataSeries
-        
-        // Debug: print existing lines with correct indices
-        // std::cerr << "SimpleTestDataSeries: lines->size()=" << lines->size() << std::endl;
-        // Print lines in the order they were created in DataSeries
-        auto aliases = lines->get_aliases();
-        // std::cerr << "  Aliases in order: ";
-        for (const auto& alias : aliases) {
-        // std::cerr << alias << " ";
-        }
-        // std::cerr << std::endl;
-        
-        // Check which line index each alias points to
-        for (const auto& alias : aliases) {
-            size_t idx = lines->get_alias_idx(alias);
-        // std::cerr << "  Alias '" << alias << "' -> line index " << idx << std::endl;
-        }
-        
-        // Pre-allocate space for all line buffers to avoid repeated allocations
-        size_t data_size = csv_data_.size();
-        for (int i = 0; i < 7; ++i) {
-            auto line = std::dynamic_pointer_cast<backtrader::LineBuffer>(lines->getline(i));
-            if (line) {
-                // Clear the initial NaN that LineBuffer constructor adds
-                line->clear();
-                // Reserve space for actual data
-                line->reserve(data_size);
-            }
-        }
-        
-        // Cache line pointers to avoid repeated dynamic_pointer_cast
-        // C++ backtrader order: DateTime=0, Open=1, High=2, Low=3, Close=4, Volume=5, OpenInterest=6
-        auto dt_line = std::dynamic_pointer_cast<backtrader::LineBuffer>(lines->getline(0));      // DateTime (index 0)
-        auto open_line = std::dynamic_pointer_cast<backtrader::LineBuffer>(lines->getline(1));    // Open (index 1)
-        auto high_line = std::dynamic_pointer_cast<backtrader::LineBuffer>(lines->getline(2));    // High (index 2)
-        auto low_line = std::dynamic_pointer_cast<backtrader::LineBuffer>(lines->getline(3));     // Low (index 3)
-        auto close_line = std::dynamic_pointer_cast<backtrader::LineBuffer>(lines->getline(4));   // Close (index 4)
-        auto volume_line = std::dynamic_pointer_cast<backtrader::LineBuffer>(lines->getline(5));  // Volume (index 5)
-        auto oi_line = std::dynamic_pointer_cast<backtrader::LineBuffer>(lines->getline(6));      // OpenInterest (index 6)
-        
-        // Pre-load all data into the line buffers using batch operations
-        std::vector<double> opens, highs, lows, closes, volumes, ois, datetimes;
-        opens.reserve(data_size);
-        highs.reserve(data_size);
-        lows.reserve(data_size);
-        closes.reserve(data_size);
-        volumes.reserve(data_size);
-        ois.reserve(data_size);
-        datetimes.reserve(data_size);
-        
-        for (size_t data_index = 0; data_index < csv_data_.size(); ++data_index) {
-            const auto& bar = csv_data_[data_index];
-            opens.push_back(bar.open);
-            highs.push_back(bar.high);
-            lows.push_back(bar.low);
-            closes.push_back(bar.close);
-            volumes.push_back(bar.volume);
-            ois.push_back(bar.openinterest);
-            
-            // Convert date string to Unix timestamp
-            // Date format: YYYY-MM-DD
-            std::tm tm = {};
-            std::istringstream ss(bar.date);
-            ss >> std::get_time(&tm, "%Y-%m-%d");
-            if (ss.fail()) {
-                // Fallback to simple index if parsing fails
-        // std::cerr << "TestCSVData: Failed to parse date '" << bar.date << "', using index " << data_index << std::endl;
-                datetimes.push_back(static_cast<double>(data_index));
-            } else {
-                // Convert to Unix timestamp
-                auto time_t = std::mktime(&tm);
-                // Debug first few dates
-                static int debug_count = 0;
-                if (debug_count++ < 5) {
-        // std::cerr << "TestCSVData: Parsed date '" << bar.date << "' to timestamp " << time_t << std::endl;
-                }
-                datetimes.push_back(static_cast<double>(time_t));
-            }
-        }
-        
-        // Batch append all data in C++ backtrader order
-        if (dt_line) dt_line->batch_append(datetimes);        // DateTime (index 0)
-        if (open_line) open_line->batch_append(opens);        // Open (index 1)
-        if (high_line) high_line->batch_append(highs);        // High (index 2)
-        if (low_line) low_line->batch_append(lows);           // Low (index 3)
-        if (close_line) close_line->batch_append(closes);     // Close (index 4)
-        if (volume_line) volume_line->batch_append(volumes);  // Volume (index 5)
-        if (oi_line) oi_line->batch_append(ois);              // OpenInterest (index 6)
+    /**
+     * @brief Split bars into line columns, converting dates to Unix timestamps
+     *
+     * Uses the timestamp loadCSV parsed when present, otherwise parses the
+     * date; a date that fails to parse (format YYYY-MM-DD) is replaced by
+     * its bar index.
+     */
+    static OHLCVColumns to_columns(const std::vector<CSVDataReader::OHLCVData>& data) {
+        OHLCVColumns columns;
+        const size_t n = data.size();
+        columns.datetime.resize(n);
+        columns.open.resize(n);
+        columns.high.resize(n);
+        columns.low.resize(n);
+        columns.close.resize(n);
+        columns.volume.resize(n);
+        columns.openinterest.resize(n);
         
-        // Debug: print first few values to verify
-        // std::cerr << "SimpleTestDataSeries: First 5 close values: ";
-        for (int i = 0; i < 5 && i < closes.size(); ++i) {
-        // std::cerr << closes[i] << " ";
-        }
-        // std::cerr << std::endl;
-        
-        // Debug: print specific values around position 130
-        if (lows.size() > 132) {
-        // std::cerr << "SimpleTestDataSeries: Low values around position 130:" << std::endl;
-            for (int i = 128; i <= 132 && i < lows.size(); ++i) {
-        // std::cerr << "  Position " << i << ": " << lows[i] << std::endl;
+        for (size_t i = 0; i < n; ++i) {
+            const auto& bar = data[i];
+            double timestamp = bar.timestamp;
+            if (std::isnan(timestamp) && !CSVDataReader::parse_date(bar.date, timestamp)) {
+                timestamp = static_cast<double>(i);
             }
+            columns.datetime[i] = timestamp;
+            columns.open[i] = bar.open;
+            columns.high[i] = bar.high;
+            columns.low[i] = bar.low;
+            columns.close[i] = bar.close;
+            columns.volume[i] = bar.volume;
+            columns.openinterest[i] = bar.openinterest;
         }
+        return columns;
+    }
+    
+    SimpleTestDataSeries(const std::vector<CSVDataReader::OHLCVData>& data)
+        : SimpleTestDataSeries(to_columns(data)) {}
+    
+    SimpleTestDataSeries(const OHLCVColumns& columns)
+        : DataSeries(), data_size_(columns.close.size()) {
+        // DataSeries constructor already created the lines in C++ backtrader order:
+        // DateTime=0, Open=1, High=2, Low=3, Close=4, Volume=5, OpenInterest=6
+        const std::vector<double>* sources[7] = {
+            &columns.datetime, &columns.open, &columns.high, &columns.low,
+            &columns.close, &columns.volume, &columns.openinterest
+        };
         
-        // After batch_append, reset all line indices to -1
-        // This ensures size() returns 0 initially, and forward() calls during
-        // simulation will properly advance through the data
         for (int i = 0; i < 7; ++i) {
             auto line = std::dynamic_pointer_cast<backtrader::LineBuffer>(lines->getline(i));
-            if (line && line->data_size() > 0) {
-                // Reset index to -1 so size() returns 0
-                line->set_idx(-1, true);  // force=true to bypass QBuffer checks
-        // std::cerr << "SimpleTestDataSeries: Line " << i << " has " << line->data_size() 
-                          // << " data points, reset idx to " << line->get_idx() 
-                          // << ", size()=" << line->size() << std::endl;
-            }
-        }
-        
-        // Debug: verify data is loaded into correct lines (AFTER setting index)
-        // std::cerr << "SimpleTestDataSeries: Verifying line data:" << std::endl;
-        // std::cerr << "  DataSeries constants: DateTime=" << DataSeries::DateTime 
-                  // << ", Open=" << DataSeries::Open << ", High=" << DataSeries::High 
-                  // << ", Low=" << DataSeries::Low << ", Close=" << DataSeries::Close 
-                  // << ", Volume=" << DataSeries::Volume << ", OpenInterest=" << DataSeries::OpenInterest << std::endl;
-        
-        if (lines && lines->size() >= 7) {
-            // Check what's actually in each line index
-            for (int i = 0; i < 7; ++i) {
-                auto line = std::dynamic_pointer_cast<backtrader::LineBuffer>(lines->getline(i));
-                if (line && line->data_size() > 0) {
-                    // Use data_ptr()[0] to get first element, not operator[] which is relative to current position
-        // std::cerr << "  Line index " << i << " first value: " << line->data_ptr()[0];
-                    // Show what this line should be
-                    // if (i == DataSeries::DateTime) std::cerr << " (DateTime)";
-                    // else if (i == DataSeries::Open) std::cerr << " (Open)";
-                    // else if (i == DataSeries::High) std::cerr << " (High)";
-                    // else if (i == DataSeries::Low) std::cerr << " (Low)";
-                    // else if (i == DataSeries::Close) std::cerr << " (Close)";
-                    // else if (i == DataSeries::Volume) std::cerr << " (Volume)";
-                    // else if (i == DataSeries::OpenInterest) std::cerr << " (OpenInterest)";
-        // std::cerr << std::endl;
-                }
-            }
-            
-            // Check specific lines using DataSeries constants
-        // std::cerr << "  Line at DataSeries::High (" << DataSeries::High << ") first value: ";
-            auto high_check = std::dynamic_pointer_cast<backtrader::LineBuffer>(lines->getline(DataSeries::High));
-            if (high_check && high_check->size() > 0) {
-        // std::cerr << (*high_check)[0] << " (expected high: " << highs[0] << ")" << std::endl;
-                // Check raw data in buffer
-                if (high_check->data_size() > 5) {
-        // std::cerr << "    Raw high data: ";
-                    for (int i = 0; i < 5; ++i) {
-        // std::cerr << high_check->data_ptr()[i] << " ";
-                    }
-        // std::cerr << std::endl;
-                }
-            } else {
-        // std::cerr << "NULL or empty" << std::endl;
+            if (!line) {
+                continue;
             }
+            // Clear the initial NaN that LineBuffer constructor adds
+            line->clear();
+            line->reserve(data_size_);
+            line->batch_append(*sources[i]);
             
-        // std::cerr << "  Line at DataSeries::Low (" << DataSeries::Low << ") first value: ";
-            auto low_check = std::dynamic_pointer_cast<backtrader::LineBuffer>(lines->getline(DataSeries::Low));
-            if (low_check && low_check->size() > 0) {
-        // std::cerr << (*low_check)[0] << " (expected low: " << lows[0] << ")" << std::endl;
-                // Check raw data in buffer
-                if (low_check->data_size() > 5) {
-        // std::cerr << "    Raw low data: ";
-                    for (int i = 0; i < 5; ++i) {
-        // std::cerr << low_check->data_ptr()[i] << " ";
-                    }
-        // std::cerr << std::endl;
-                }
-            } else {
-        // std::cerr << "NULL or empty" << std::endl;
+            // Reset index to -1 so size() returns 0 initially, and forward()
+            // calls during simulation will properly advance through the data
+            if (line->data_size() > 0) {
+                line->set_idx(-1, true);  // force=true to bypass QBuffer checks
             }
         }
     }
@@ -376,7 +302,7 @@ public:
     
     size_t buflen() const override {
         // Return the total data size available for processing
-        return csv_data_.size();
+        return data_size_;
     }
     
     // Override forward to properly forward the lines object
@@ -411,12 +337,22 @@ public:
     
 };
 
+/**
+ * @brief Line columns of a test data file
+ *
+ * Split from the bars DataCache holds on every call; nothing is cached at
+ * this level. Feeds built through getdata_feed() or runtest_direct() copy
+ * these straight into their line buffers with one batch_append per line.
+ */
+inline OHLCVColumns getdata_columns(int index = 0) {
+    return SimpleTestDataSeries::to_columns(getdata(index));
+}
+
 /**
  * @brief Create a shared_ptr to DataSeries from CSV data
  */
 inline std::shared_ptr<backtrader::DataSeries> getdata_feed(int index = 0) {
-    auto csv_data = getdata(index);
-    return std::make_shared<SimpleTestDataSeries>(csv_data);
+    return std::make_shared<SimpleTestDataSeries>(getdata_columns(index));
 }
 
 /**
@@ -592,11 +528,12 @@ void runtest_direct(const std::vector<std::vector<std::string>>& expected_vals,
                    int data_index = 0) {
     
     // 加载测试数据
-    auto csv_data = getdata(data_index);
+    const auto& csv_data = getdata(data_index);
     ASSERT_FALSE(csv_data.empty()) << "Failed to load test data";
     
     // 创建数据源
-    auto data_series = std::make_shared<SimpleTestDataSeries>(csv_data);
+    const auto columns = getdata_columns(data_index);
+    auto data_series = std::make_shared<SimpleTestDataSeries>(columns);
     
     // 直接创建指标，尝试使用数据构造器
     std::shared_ptr<IndicatorType> indicator;
@@ -619,7 +556,7 @@ void runtest_direct(const std::vector<std::vector<std::string>>& expected_vals,
     
     // CRITICAL FIX: Create a separate copy of data to avoid contamination across tests
     // The issue is that if indicators modify the data source's lines, it affects all subsequent tests
-    auto fresh_data_series = std::make_shared<SimpleTestDataSeries>(csv_data);
+    auto fresh_data_series = std::make_shared<SimpleTestDataSeries>(columns);
     indicator->data = fresh_data_series;
     
     // Replace existing datas with fresh copy instead of adding to it
@@ -678,6 +615,462 @@ inline bool isNaN(double value) {
     return std::isnan(value);
 }
 
+/**
+ * @brief Gaussian random-walk price series
+ *
+ * Steps are N(0, 1) drawn through std::normal_distribution over
+ * std::mt19937(seed). The series repeats across runs with the same standard
+ * library, but may differ between libraries because the distribution's
+ * algorithm is implementation-defined; compare it only against references
+ * computed from the same series, not hard-coded values. Generated afresh
+ * on every call.
+ *
+ * @param size Number of points
+ * @param start Starting price (the first point is start plus one step)
+ * @param seed RNG seed
+ */
+inline std::vector<double> random_walk(size_t size, double start = 4000.0, unsigned seed = 42) {
+    std::mt19937 rng(seed);
+    std::normal_distribution<double> step(0.0, 1.0);
+    std::vector<double> prices;
+    prices.reserve(size);
+    double price = start;
+    for (size_t i = 0; i < size; ++i) {
+        price += step(rng);
+        prices.push_back(price);
+    }
+    return prices;
+}
+
+/**
+ * @brief Uniformly distributed price series
+ *
+ * Values are drawn in order from std::uniform_real_distribution over
+ * std::mt19937(seed), the same sequence the per-test generator loops
+ * produced. Generated afresh on every call.
+ *
+ * @param size Number of points
+ * @param low Lower bound of the distribution
+ * @param high Upper bound of the distribution
+ * @param seed RNG seed
+ */
+inline std::vector<double> random_uniform(size_t size, double low = 50.0, double high = 150.0,
+                                          unsigned seed = 42) {
+    std::mt19937 rng(seed);
+    std::uniform_real_distribution<double> dist(low, high);
+    std::vector<double> values;
+    values.reserve(size);
+    for (size_t i = 0; i < size; ++i) {
+        values.push_back(dist(rng));
+    }
+    return values;
+}
+
+/**
+ * @brief Random OHLCV bars for large-dataset tests
+ *
+ * Each bar draws close from U(50, 150) and a half range from U(1, 5) on
+ * std::mt19937(seed), in that order; high/low are close -/+ range, open is
+ * close, volume 1000.
+ *
+ * @param size Number of bars
+ * @param seed RNG seed
+ */
+inline std::vector<CSVDataReader::OHLCVData> random_bars(size_t size, unsigned seed = 42) {
+    std::mt19937 rng(seed);
+    std::uniform_real_distribution<double> price_dist(50.0, 150.0);
+    std::uniform_real_distribution<double> range_dist(1.0, 5.0);
+    std::vector<CSVDataReader::OHLCVData> bars;
+    bars.reserve(size);
+    for (size_t i = 0; i < size; ++i) {
+        CSVDataReader::OHLCVData bar;
+        bar.date = "2006-01-01";
+        bar.close = price_dist(rng);
+        double range = range_dist(rng);
+        bar.high = bar.close + range;
+        bar.low = bar.close - range;
+        bar.open = bar.close;
+        bar.volume = 1000;
+        bar.openinterest = 0;
+        bars.push_back(bar);
+    }
+    return bars;
+}
+
+/**
+ * @brief Load a whole series into a fresh LineBuffer in one contiguous copy
+ *
+ * Leaves the buffer in the same state as set(0, v[0]) followed by append()
+ * for the rest (index on the last value), without the per-value
+ * forward/set/binding work. Intended for unbound test input lines.
+ */
+inline void load_line_buffer(backtrader::LineBuffer& buffer, const std::vector<double>& values) {
+    buffer.clear();
+    buffer.reserve(values.size());
+    buffer.batch_append(values.data(), values.size());
+    buffer.set_idx(static_cast<int>(values.size()) - 1, true);
+}
+
+/**
+ * @brief Build a single-line LineSeries preloaded with a series
+ *
+ * Replaces the add_line/add_alias/set/append boilerplate that tests repeat
+ * for every indicator input; pair with getdata_columns(i).close and the
+ * like to feed a test data file's columns.
+ */
+inline std::shared_ptr<backtrader::LineSeries> make_line_series(const std::vector<double>& values,
+                                                                 const std::string& alias) {
+    auto series = std::make_shared<backtrader::LineSeries>();
+    auto buffer = std::make_shared<backtrader::LineBuffer>();
+    load_line_buffer(*buffer, values);
+    series->lines->add_line(buffer);
+    series->lines->add_alias(alias, 0);
+    return series;
+}
+
+inline std::shared_ptr<backtrader::LineSeries> make_close_series(const std::vector<double>& closes) {
+    return make_line_series(closes, "close");
+}
+
+/**
+ * @brief Append a whole series after a buffer's current contents in one copy
+ *
+ * Leaves the buffer in the same state as calling append() for every value
+ * (a fresh buffer keeps its leading NaN slot, index on the last value),
+ * without the per-value forward/set/binding work. Intended for unbound
+ * test input lines.
+ */
+inline void append_line_buffer(backtrader::LineBuffer& buffer, const std::vector<double>& values) {
+    buffer.reserve(buffer.data_size() + values.size());
+    buffer.batch_append(values.data(), values.size());
+    buffer.set_idx(static_cast<int>(buffer.data_size()) - 1, true);
+}
+
+/**
+ * @brief Running sums of a series, accumulated in long double
+ *
+ * @param values Input series
+ * @return prefix[i] is the sum of the first i values; size is values.size() + 1
+ */
+inline std::vector<long double> prefix_sums(const std::vector<double>& values) {
+    std::vector<long double> prefix(values.size() + 1, 0.0L);
+    for (size_t i = 0; i < values.size(); ++i) {
+        prefix[i + 1] = prefix[i] + values[i];
+    }
+    return prefix;
+}
+
+/**
+ * @brief Reference rolling sum computed from prefix sums
+ *
+ * Each window sum is the difference of two prefix sums, so the whole series
+ * costs O(N) regardless of period. The prefix_sums() overload lets suites
+ * checking several periods accumulate the series only once.
+ *
+ * @param values Input series
+ * @param period Window length
+ * @return Series of the same length; the first period-1 entries are NaN
+ */
+inline std::vector<double> reference_sumn(const std::vector<long double>& prefix, int period) {
+    const size_t n = prefix.empty() ? 0 : prefix.size() - 1;
+    std::vector<double> result(n, std::numeric_limits<double>::quiet_NaN());
+    if (period <= 0) {
+        return result;
+    }
+    
+    for (size_t i = period - 1; i < n; ++i) {
+        result[i] = static_cast<double>(prefix[i + 1] - prefix[i + 1 - period]);
+    }
+    return result;
+}
+
+inline std::vector<double> reference_sumn(const std::vector<double>& values, int period) {
+    return reference_sumn(prefix_sums(values), period);
+}
+
+/**
+ * @brief Reference simple moving average computed from prefix sums
+ *
+ * Each window sum is the difference of two prefix sums, so the whole series
+ * costs O(N) regardless of period. Prefix sums are accumulated in long double
+ * to keep the differences accurate on long series; like reference_sumn, it
+ * also accepts a precomputed prefix_sums() result.
+ *
+ * @param values Input series
+ * @param period Window length
+ * @return Series of the same length; the first period-1 entries are NaN
+ */
+inline std::vector<double> reference_sma(const std::vector<long double>& prefix, int period) {
+    const size_t n = prefix.empty() ? 0 : prefix.size() - 1;
+    std::vector<double> result(n, std::numeric_limits<double>::quiet_NaN());
+    if (period <= 0) {
+        return result;
+    }
+    
+    for (size_t i = period - 1; i < n; ++i) {
+        result[i] = static_cast<double>((prefix[i + 1] - prefix[i + 1 - period]) / period);
+    }
+    return result;
+}
+
+inline std::vector<double> reference_sma(const std::vector<double>& values, int period) {
+    return reference_sma(prefix_sums(values), period);
+}
+
+/**
+ * @brief Reference exponential moving average
+ *
+ * Seeded with the simple average of the first period values, then follows
+ * e[i] = alpha * v[i] + (1 - alpha) * e[i-1] with alpha = 2 / (1 + period),
+ * matching Python backtrader's EMA.
+ *
+ * @param values Input series
+ * @param period Smoothing period
+ * @return Series of the same length; the first period-1 entries are NaN
+ */
+inline std::vector<double> reference_ema(const std::vector<double>& values, int period) {
+    std::vector<double> result(values.size(), std::numeric_limits<double>::quiet_NaN());
+    if (period <= 0 || values.size() < static_cast<size_t>(period)) {
+        return result;
+    }
+
+    const double alpha = 2.0 / (1.0 + period);
+    long double seed = 0.0L;
+    for (int i = 0; i < period; ++i) {
+        seed += values[i];
+    }
+    double prev = static_cast<double>(seed / period);
+    result[period - 1] = prev;
+    for (size_t i = period; i < values.size(); ++i) {
+        prev = alpha * values[i] + (1.0 - alpha) * prev;
+        result[i] = prev;
+    }
+    return result;
+}
+
+/**
+ * @brief Reference relative strength index with Wilder smoothing
+ *
+ * Up/down moves are averaged over the first period changes, then follow
+ * avg = avg * (period - 1) / period + move / period. A zero down average
+ * yields 100 (or 50 when there was no movement at all), matching RSI::once.
+ *
+ * @param values Close series
+ * @param period Smoothing period
+ * @return Series of the same length; the first period entries are NaN
+ */
+inline std::vector<double> reference_rsi(const std::vector<double>& values, int period) {
+    std::vector<double> result(values.size(), std::numeric_limits<double>::quiet_NaN());
+    if (period <= 0 || values.size() <= static_cast<size_t>(period)) {
+        return result;
+    }
+
+    const double alpha = 1.0 / period;
+    double up = 0.0;
+    double down = 0.0;
+    for (size_t i = 1; i < values.size(); ++i) {
+        const double change = values[i] - values[i - 1];
+        const double up_move = std::max(0.0, change);
+        const double down_move = std::max(0.0, -change);
+        if (i <= static_cast<size_t>(period)) {
+            up += up_move;
+            down += down_move;
+            if (i < static_cast<size_t>(period)) {
+                continue;
+            }
+            up /= period;
+            down /= period;
+        } else {
+            up = up * (1.0 - alpha) + up_move * alpha;
+            down = down * (1.0 - alpha) + down_move * alpha;
+        }
+
+        if (down != 0.0) {
+            result[i] = 100.0 - 100.0 / (1.0 + up / down);
+        } else {
+            result[i] = up != 0.0 ? 100.0 : 50.0;
+        }
+    }
+    return result;
+}
+
+/**
+ * @brief Reference percent change: (v[i] - v[i-period]) / v[i-period]
+ *
+ * @param values Input series
+ * @param period Lookback length
+ * @return Series of the same length; the first period entries are NaN
+ */
+inline std::vector<double> reference_pctchange(const std::vector<double>& values, int period) {
+    std::vector<double> result(values.size(), std::numeric_limits<double>::quiet_NaN());
+    if (period <= 0) {
+        return result;
+    }
+    
+    for (size_t i = period; i < values.size(); ++i) {
+        result[i] = (values[i] - values[i - period]) / values[i - period];
+    }
+    return result;
+}
+
+/**
+ * @brief Element-wise relative tolerance check, like numpy's assert_allclose
+ * with equal_nan=True: |actual - expected| <= rtol * |expected|, NaN matches NaN.
+ * All mismatching indices are reported in a single failure message.
+ *
+ * Usage: EXPECT_TRUE(AllClose(actual, expected, 1e-6));
+ *        EXPECT_TRUE(AllClose(buffer->data_ptr(), buffer->data_size(), expected, 1e-6));
+ */
+inline ::testing::AssertionResult AllClose(const double* actual, size_t n,
+                                           const std::vector<double>& expected,
+                                           double rtol) {
+    if (n != expected.size()) {
+        return ::testing::AssertionFailure()
+            << "size mismatch: actual " << n << " vs expected " << expected.size();
+    }
+
+    std::ostringstream mismatches;
+    size_t mismatch_count = 0;
+    for (size_t i = 0; i < n; ++i) {
+        bool close;
+        if (std::isnan(actual[i]) || std::isnan(expected[i])) {
+            close = std::isnan(actual[i]) && std::isnan(expected[i]);
+        } else {
+            close = std::abs(actual[i] - expected[i]) <= rtol * std::abs(expected[i]);
+        }
+        if (!close) {
+            ++mismatch_count;
+            mismatches << "\n  [" << i << "] actual " << actual[i] << " vs expected " << expected[i];
+        }
+    }
+
+    if (mismatch_count == 0) {
+        return ::testing::AssertionSuccess();
+    }
+    return ::testing::AssertionFailure()
+        << mismatch_count << "/" << n << " values not within rtol=" << rtol
+        << mismatches.str();
+}
+
+inline ::testing::AssertionResult AllClose(const std::vector<double>& actual,
+                                           const std::vector<double>& expected,
+                                           double rtol) {
+    return AllClose(actual.data(), actual.size(), expected, rtol);
+}
+
+/**
+ * @brief Check OHLCV sanity for every bar in one assertion: all prices finite,
+ * low <= open/close <= high and volume >= 0. Bars with a NaN price are skipped
+ * when skip_nan is set (DataReplay emits a trailing NaN bar).
+ *
+ * Works with any bar type exposing open/high/low/close/volume members.
+ *
+ * Usage: EXPECT_TRUE(OHLCConsistent(strategy->bars));
+ */
+template<typename Bars>
+::testing::AssertionResult OHLCConsistent(const Bars& bars, bool skip_nan = false) {
+    std::ostringstream bad_bars;
+    size_t bad_count = 0;
+    for (size_t i = 0; i < bars.size(); ++i) {
+        const auto& bar = bars[i];
+        if (skip_nan && (std::isnan(bar.open) || std::isnan(bar.high) ||
+                         std::isnan(bar.low) || std::isnan(bar.close))) {
+            continue;
+        }
+        bool finite = std::isfinite(bar.open) && std::isfinite(bar.high) &&
+                      std::isfinite(bar.low) && std::isfinite(bar.close);
+        bool ordered = bar.low <= bar.high &&
+                       bar.low <= bar.open && bar.open <= bar.high &&
+                       bar.low <= bar.close && bar.close <= bar.high;
+        if (!finite || !ordered || !(bar.volume >= 0.0)) {
+            ++bad_count;
+            bad_bars << "\n  bar " << i << ": o=" << bar.open << " h=" << bar.high
+                     << " l=" << bar.low << " c=" << bar.close << " v=" << bar.volume;
+        }
+    }
+    if (bad_count == 0) {
+        return ::testing::AssertionSuccess();
+    }
+    return ::testing::AssertionFailure()
+        << bad_count << "/" << bars.size() << " bars violate OHLCV constraints" << bad_bars.str();
+}
+
+/**
+ * @brief Check that every value is finite and strictly greater than a bound
+ * in one assertion, reporting the offending count and first index.
+ *
+ * Usage: EXPECT_TRUE(AllFinite(sma_values, 0.0));   // finite and positive
+ */
+inline ::testing::AssertionResult AllFinite(const std::vector<double>& values,
+                                            double greater_than = -std::numeric_limits<double>::infinity()) {
+    auto bad = [greater_than](double v) { return !std::isfinite(v) || !(v > greater_than); };
+    auto first = std::find_if(values.begin(), values.end(), bad);
+    if (first == values.end()) {
+        return ::testing::AssertionSuccess();
+    }
+    return ::testing::AssertionFailure()
+        << std::count_if(first, values.end(), bad) << "/" << values.size()
+        << " values not finite and > " << greater_than
+        << ", first at [" << (first - values.begin()) << "] = " << *first;
+}
+
+/**
+ * @brief Count the non-NaN entries of a series
+ *
+ * Usage: count_valid(buffer->data_ptr(), buffer->data_size());
+ */
+inline size_t count_valid(const double* values, size_t n) {
+    return static_cast<size_t>(std::count_if(values, values + n, [](double v) { return !std::isnan(v); }));
+}
+
+inline size_t count_valid(const std::vector<double>& values) {
+    return count_valid(values.data(), values.size());
+}
+
+/**
+ * @brief Copy the non-NaN entries of a series, in order, in one pass
+ *
+ * Usage: auto values = valid_values(buffer->data_ptr(), buffer->data_size());
+ */
+inline std::vector<double> valid_values(const double* values, size_t n) {
+    std::vector<double> result;
+    result.reserve(count_valid(values, n));
+    std::copy_if(values, values + n, std::back_inserter(result), [](double v) { return !std::isnan(v); });
+    return result;
+}
+
+/**
+ * @brief Check the warm-up shape of an indicator line in one assertion:
+ * entries [0, nan_prefix) must be NaN and every entry after must be a number.
+ * Reports the first offending index and the offending count for each part.
+ *
+ * Usage: EXPECT_TRUE(NaNPattern(values, period - 1));
+ */
+inline ::testing::AssertionResult NaNPattern(const std::vector<double>& values, size_t nan_prefix) {
+    const size_t prefix = std::min(nan_prefix, values.size());
+    const auto head_end = values.begin() + prefix;
+    const auto is_nan = [](double v) { return std::isnan(v); };
+
+    const auto head_bad = std::count_if(values.begin(), head_end, [&](double v) { return !is_nan(v); });
+    const auto tail_bad = std::count_if(head_end, values.end(), is_nan);
+    if (head_bad == 0 && tail_bad == 0) {
+        return ::testing::AssertionSuccess();
+    }
+
+    auto failure = ::testing::AssertionFailure();
+    if (head_bad > 0) {
+        auto first = std::find_if(values.begin(), head_end, [&](double v) { return !is_nan(v); });
+        failure << head_bad << " non-NaN values in [0, " << prefix << "), first at ["
+                << (first - values.begin()) << "] = " << *first << "\n";
+    }
+    if (tail_bad > 0) {
+        auto first = std::find_if(head_end, values.end(), is_nan);
+        failure << tail_bad << " NaN values in [" << prefix << ", " << values.size()
+                << "), first at [" << (first - values.begin()) << "]";
+    }
+    return failure;
+}
+
 /**
  * @brief Convert numeric date to string representation
  * @param datetime Numeric datetime value
@@ -702,6 +1095,78 @@ inline double timepoint_to_double(const std::chrono::system_clock::time_point& t
     return static_cast<double>(seconds.count());
 }
 
+/**
+ * @brief Time a callable with a monotonic nanosecond clock
+ *
+ * Only the work inside func is measured, so data preparation done by the
+ * caller before the call is not counted.
+ *
+ * @param func Callable to time
+ * @return Elapsed wall time in nanoseconds
+ */
+template<typename Func>
+inline std::chrono::nanoseconds measure_ns(Func&& func) {
+    auto start = std::chrono::steady_clock::now();
+    func();
+    return std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::steady_clock::now() - start);
+}
+
+/**
+ * @brief Best-of-N timing for repeatable workloads
+ *
+ * Runs func warmup times untimed so caches, the allocator and lazily
+ * initialised statics are warm, then times repeat runs and returns the
+ * fastest. The minimum discards scheduler and allocator outliers that
+ * would skew an average.
+ *
+ * @param func Callable to time; must be safe to call repeatedly
+ * @param repeat Number of timed runs
+ * @param warmup Number of untimed runs before timing starts
+ * @return Fastest run in nanoseconds
+ */
+template<typename Func>
+inline std::chrono::nanoseconds measure_min_ns(Func&& func, int repeat = 5, int warmup = 1) {
+    for (int w = 0; w < warmup; ++w) {
+        func();
+    }
+    auto best = std::chrono::nanoseconds::max();
+    for (int r = 0; r < repeat; ++r) {
+        best = std::min(best, measure_ns(func));
+    }
+    return best;
+}
+
+/**
+ * @brief Result of benchmark_indicator: the last indicator built and the best run
+ */
+template<typename IndicatorPtr>
+struct IndicatorBenchmark {
+    IndicatorPtr indicator;
+    std::chrono::nanoseconds best;
+};
+
+/**
+ * @brief Best-of-N timing of an indicator's construction and calculate()
+ *
+ * Every run builds a new indicator through make, so no run reuses values
+ * computed by an earlier one. Timing follows measure_min_ns.
+ *
+ * @param make Factory returning a shared_ptr to a freshly built indicator
+ * @param repeat Number of timed runs
+ * @param warmup Number of untimed runs before timing starts
+ * @return The indicator from the last run and the fastest run
+ */
+template<typename Factory>
+inline auto benchmark_indicator(Factory&& make, int repeat = 5, int warmup = 1) {
+    IndicatorBenchmark<decltype(make())> result;
+    result.best = measure_min_ns([&] {
+        result.indicator = make();
+        result.indicator->calculate();
+    }, repeat, warmup);
+    return result;
+}
+
 /**
  * @brief Test CSV data class that inherits from CSVDataBase for DataReplay
  */
@@ -831,7 +1296,7 @@ protected:
  * @brief Create a shared_ptr to AbstractDataBase from CSV data (for DataReplay)
  */
 inline std::shared_ptr<backtrader::AbstractDataBase> getdata_abstractbase(int index = 0) {
-    auto csv_data = getdata(index);
+    const auto& csv_data = getdata(index);
     return std::make_shared<TestCSVData>(csv_data);
 }
 
@@ -269,40 +269,8 @@ TEST(OriginalTests, DataReplay_OHLCIntegrity) {
     
     // 验证OHLC数据完整性
     EXPECT_FALSE(strategy->bars.empty()) << "Should have bar data";
-    for (size_t i = 0; i < strategy->bars.size(); ++i) {
-        const auto& bar = strategy->bars[i];
-        
-        // Skip bars with NaN values (DataReplay adds an extra NaN bar at the end)
-        if (std::isnan(bar.open) || std::isnan(bar.high) || 
-            std::isnan(bar.low) || std::isnan(bar.close)) {
-            std::cerr << "Skipping bar " << i << " with NaN values" << std::endl;
-            continue;
-        }
-        
-        // 验证基本OHLC关系
-        EXPECT_LE(bar.low, bar.high) 
-            << "Low should be <= High at bar " << i;
-        EXPECT_GE(bar.open, bar.low) 
-            << "Open should be >= Low at bar " << i;
-        EXPECT_LE(bar.open, bar.high) 
-            << "Open should be <= High at bar " << i;
-        EXPECT_GE(bar.close, bar.low) 
-            << "Close should be >= Low at bar " << i;
-        EXPECT_LE(bar.close, bar.high) 
-            << "Close should be <= High at bar " << i;
-        
-        // 验证数据有效性
-        EXPECT_TRUE(std::isfinite(bar.open)) 
-            << "Open should be finite at bar " << i;
-        EXPECT_TRUE(std::isfinite(bar.high)) 
-            << "High should be finite at bar " << i;
-        EXPECT_TRUE(std::isfinite(bar.low)) 
-            << "Low should be finite at bar " << i;
-        EXPECT_TRUE(std::isfinite(bar.close)) 
-            << "Close should be finite at bar " << i;
-        EXPECT_GE(bar.volume, 0.0) 
-            << "Volume should be non-negative at bar " << i;
-    }
+    // 验证基本OHLC关系和数据有效性, 跳过DataReplay末尾附加的NaN bar
+    EXPECT_TRUE(OHLCConsistent(strategy->bars, true));
 }
 
 // 测试重放数据的时间顺序
@@ -521,7 +489,7 @@ TEST(OriginalTests, DataReplay_DataUpdates) {
 
 // 性能测试
 TEST(OriginalTests, DataReplay_Performance) {
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 创建backtrader::Cerebro
     auto cerebro = std::make_unique<backtrader::Cerebro>();
@@ -568,7 +536,7 @@ TEST(OriginalTests, DataReplay_Performance) {
     // 运行回测
     auto results = cerebro->run();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "Data replay performance test took " 
@@ -489,33 +489,8 @@ TEST(OriginalTests, DataResample_OHLCIntegrity) {
     
     // 验证OHLC数据完整性
     EXPECT_FALSE(strategy->bars.empty()) << "Should have bar data";
-    for (size_t i = 0; i < strategy->bars.size(); ++i) {
-        const auto& bar = strategy->bars[i];
-        
-        // 验证基本OHLC关系
-        EXPECT_LE(bar.low, bar.high) 
-            << "Low should be <= High at bar " << i;
-        EXPECT_GE(bar.open, bar.low) 
-            << "Open should be >= Low at bar " << i;
-        EXPECT_LE(bar.open, bar.high) 
-            << "Open should be <= High at bar " << i;
-        EXPECT_GE(bar.close, bar.low) 
-            << "Close should be >= Low at bar " << i;
-        EXPECT_LE(bar.close, bar.high) 
-            << "Close should be <= High at bar " << i;
-        
-        // 验证数据有效性
-        EXPECT_TRUE(std::isfinite(bar.open)) 
-            << "Open should be finite at bar " << i;
-        EXPECT_TRUE(std::isfinite(bar.high)) 
-            << "High should be finite at bar " << i;
-        EXPECT_TRUE(std::isfinite(bar.low)) 
-            << "Low should be finite at bar " << i;
-        EXPECT_TRUE(std::isfinite(bar.close)) 
-            << "Close should be finite at bar " << i;
-        EXPECT_GE(bar.volume, 0.0) 
-            << "Volume should be non-negative at bar " << i;
-    }
+    // 验证基本OHLC关系和数据有效性
+    EXPECT_TRUE(OHLCConsistent(strategy->bars));
 }
 
 // 测试重采样与原始数据的关系
@@ -686,7 +661,7 @@ TEST(OriginalTests, DataResample_TimeAlignment) {
 
 // 性能测试
 TEST(OriginalTests, DataResample_Performance) {
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 测试两种模式的性能
     
@@ -733,14 +708,13 @@ TEST(OriginalTests, DataResample_Performance) {
         
         // 运行回测
         auto results = cerebro->run();
-        
-        std::cout << "Resample performance test (runonce=" << runonce 
-                  << ") completed" << std::endl;
     }
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
+    // 输出放在计时区间之外, 避免I/O计入耗时
+    std::cout << "Resample performance test (runonce=1, runonce=0) completed" << std::endl;
     std::cout << "Data resample performance test took " 
               << duration.count() << " ms" << std::endl;
     
@@ -13,6 +13,7 @@
 
 #include "test_common.h"
 #include "lineseries.h"
+#include <array>
 #include <random>
 #include "indicators/aroon.h"
 
@@ -34,29 +35,27 @@ const int AROON_OSC_MIN_PERIOD = 15;
 std::shared_ptr<DataSeries> createFullDataSeries(const std::vector<CSVDataReader::OHLCVData>& csv_data) {
     auto data_series = std::make_shared<DataSeries>();
     
-    // Pre-allocate all lines
+    // Resolve the line buffers once and pre-allocate them
+    std::array<std::shared_ptr<LineBuffer>, 7> buffers;
     for (int i = 0; i < 7; ++i) {
-        auto line = std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(i));
-        if (line) {
-            line->reserve(csv_data.size() + 1);
-        }
+        buffers[i] = std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(i));
+        buffers[i]->reserve(csv_data.size() + 1);
     }
     
     // Load all data into buffers
     for (const auto& bar : csv_data) {
-        std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(0))->append(0.0); // datetime
-        std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(1))->append(bar.open);
-        std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(2))->append(bar.high);
-        std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(3))->append(bar.low);
-        std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(4))->append(bar.close);
-        std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(5))->append(bar.volume);
-        std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(6))->append(bar.openinterest);
+        buffers[0]->append(0.0); // datetime
+        buffers[1]->append(bar.open);
+        buffers[2]->append(bar.high);
+        buffers[3]->append(bar.low);
+        buffers[4]->append(bar.close);
+        buffers[5]->append(bar.volume);
+        buffers[6]->append(bar.openinterest);
     }
     
     // Set indices
-    for (int i = 0; i < 7; ++i) {
-        auto line = std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(i));
-        if (line && line->size() > 0) {
+    for (const auto& line : buffers) {
+        if (line->size() > 0) {
             line->set_idx(line->size() - 1);
         }
     }
@@ -72,7 +71,7 @@ DEFINE_INDICATOR_TEST(AroonOscillator_Default, AroonOscillator, AROON_OSC_EXPECT
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, AroonOscillator_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建完整的DataSeries，包含OHLC数据（不要set_idx）
@@ -172,7 +171,7 @@ TEST(OriginalTests, AroonOscillator_Manual) {
 
 // AroonOscillator范围验证测试
 TEST(OriginalTests, AroonOscillator_RangeValidation) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建完整的DataSeries，包含OHLC数据
     auto data_series = std::make_shared<DataSeries>();
@@ -253,15 +252,19 @@ TEST(OriginalTests, AroonOscillator_RangeValidation) {
 // 参数化测试 - 测试不同周期的AroonOscillator
 class AroonOscillatorParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         // 创建完整的DataSeries
         data_series_ = createFullDataSeries(csv_data_);
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<backtrader::DataSeries> data_series_;
 };
 
@@ -304,32 +307,7 @@ TEST(OriginalTests, AroonOscillator_CalculationLogic) {
     };
     
     // 创建完整的DataSeries
-    auto data_series = std::make_shared<DataSeries>();
-    for (int i = 0; i < 7; ++i) {
-        auto line = std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(i));
-        if (line) {
-            line->reserve(csv_data.size() + 1);
-        }
-    }
-    
-    // Load all data into buffers
-    for (const auto& bar : csv_data) {
-        std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(0))->append(0.0); // datetime
-        std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(1))->append(bar.open);
-        std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(2))->append(bar.high);
-        std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(3))->append(bar.low);
-        std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(4))->append(bar.close);
-        std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(5))->append(bar.volume);
-        std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(6))->append(bar.openinterest);
-    }
-    
-    // Set indices
-    for (int i = 0; i < 7; ++i) {
-        auto line = std::dynamic_pointer_cast<LineBuffer>(data_series->lines->getline(i));
-        if (line && line->size() > 0) {
-            line->set_idx(line->size() - 1);
-        }
-    }
+    auto data_series = createFullDataSeries(csv_data);
     
     auto aroon_osc = std::make_shared<AroonOscillator>(std::static_pointer_cast<LineSeries>(data_series), 4);
     
@@ -402,7 +380,7 @@ TEST(OriginalTests, AroonOscillator_CalculationLogic) {
 
 // 趋势识别测试
 TEST(OriginalTests, AroonOscillator_TrendIdentification) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建完整的DataSeries
     auto data_series = createFullDataSeries(csv_data);
@@ -443,7 +421,7 @@ TEST(OriginalTests, AroonOscillator_TrendIdentification) {
 
 // 零线穿越测试
 TEST(OriginalTests, AroonOscillator_ZeroCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建完整的DataSeries
     auto data_series = createFullDataSeries(csv_data);
@@ -487,7 +465,7 @@ TEST(OriginalTests, AroonOscillator_ZeroCrossing) {
 
 // 与AroonUpDown关系测试
 TEST(OriginalTests, AroonOscillator_vs_AroonUpDown) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建两个完整的DataSeries
     auto data_series_osc = createFullDataSeries(csv_data);
@@ -582,37 +560,19 @@ TEST(OriginalTests, AroonOscillator_EdgeCases) {
 TEST(OriginalTests, AroonOscillator_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<CSVDataReader::OHLCVData> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> price_dist(50.0, 150.0);
-    std::uniform_real_distribution<double> range_dist(1.0, 5.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        CSVDataReader::OHLCVData bar;
-        bar.date = "2006-01-01";
-        bar.close = price_dist(rng);
-        double range = range_dist(rng);
-        bar.high = bar.close + range;
-        bar.low = bar.close - range;
-        bar.open = bar.close;
-        bar.volume = 1000;
-        bar.openinterest = 0;
-        
-        large_data.push_back(bar);
-    }
+    const auto large_data = random_bars(data_size);
     
     // 创建完整的DataSeries
     auto data_series = createFullDataSeries(large_data);
     
     auto large_osc = std::make_shared<AroonOscillator>(std::static_pointer_cast<LineSeries>(data_series), 14);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 使用批量计算替代逐步forward
     large_osc->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "AroonOscillator calculation for " << data_size << " points took " 
@@ -40,7 +40,7 @@ DEFINE_INDICATOR_TEST(AroonUpDown_Default, AroonUpDown, AROONUPDOWN_EXPECTED_VAL
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, AroonUpDown_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线 (使用LineSeries + LineBuffer模式)
@@ -157,7 +157,7 @@ TEST(OriginalTests, AroonUpDown_Manual) {
 
 // Aroon范围验证测试
 TEST(OriginalTests, AroonUpDown_RangeValidation) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 使用LineSeries+LineBuffer模式替代LineRoot
     auto high_line_series = std::make_shared<backtrader::LineSeries>();
@@ -215,8 +215,12 @@ TEST(OriginalTests, AroonUpDown_RangeValidation) {
 // 参数化测试 - 测试不同周期的AroonUpDown
 class AroonUpDownParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         // 使用LineSeries+LineBuffer模式替代LineRoot
@@ -245,7 +249,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<backtrader::LineSeries> high_line_series_;
     std::shared_ptr<backtrader::LineSeries> low_line_series_;
 };
@@ -361,7 +365,7 @@ TEST(OriginalTests, AroonUpDown_CalculationLogic) {
 
 // 趋势识别测试
 TEST(OriginalTests, AroonUpDown_TrendIdentification) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 使用LineSeries+LineBuffer模式替代LineRoot
     auto high_line_series = std::make_shared<backtrader::LineSeries>();
@@ -438,7 +442,7 @@ TEST(OriginalTests, AroonUpDown_TrendIdentification) {
 
 // 交叉信号测试
 TEST(OriginalTests, AroonUpDown_CrossoverSignals) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 使用LineSeries+LineBuffer模式替代LineRoot
     auto high_line_series = std::make_shared<backtrader::LineSeries>();
@@ -625,26 +629,7 @@ TEST(OriginalTests, AroonUpDown_EdgeCases) {
 TEST(OriginalTests, AroonUpDown_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<CSVDataReader::OHLCVData> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> price_dist(50.0, 150.0);
-    std::uniform_real_distribution<double> range_dist(1.0, 5.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        CSVDataReader::OHLCVData bar;
-        bar.date = "2006-01-01";
-        bar.close = price_dist(rng);
-        double range = range_dist(rng);
-        bar.high = bar.close + range;
-        bar.low = bar.close - range;
-        bar.open = bar.close;
-        bar.volume = 1000;
-        bar.openinterest = 0;
-        
-        large_data.push_back(bar);
-    }
+    const auto large_data = random_bars(data_size);
     
     // 使用LineSeries+LineBuffer模式替代LineRoot
     auto large_high = std::make_shared<backtrader::LineSeries>();
@@ -672,12 +657,12 @@ TEST(OriginalTests, AroonUpDown_Performance) {
     
     auto large_aroon = std::make_shared<AroonUpDown>(large_high, large_low, 14);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 使用批量计算替代逐步forward
     large_aroon->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "AroonUpDown calculation for " << data_size << " points took " 
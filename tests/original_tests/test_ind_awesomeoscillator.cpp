@@ -75,7 +75,7 @@ DEFINE_INDICATOR_TEST(AwesomeOscillator_Default, AwesomeOscillator, AWESOMEOSCIL
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, AwesomeOscillator_Manual) {
     // Load test data
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // Use SimpleTestDataSeries like the Default test
     auto data = std::make_shared<SimpleTestDataSeries>(csv_data);
@@ -306,7 +306,7 @@ TEST(OriginalTests, AwesomeOscillator_CalculationLogic) {
 
 // AwesomeOscillator信号检测测试
 TEST(OriginalTests, AwesomeOscillator_SignalDetection) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto high_line = std::make_shared<LineSeries>();
 
     high_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -459,7 +459,7 @@ TEST(OriginalTests, AwesomeOscillator_MomentumAnalysis) {
 
 // AwesomeOscillator发散分析测试
 TEST(OriginalTests, AwesomeOscillator_DivergenceAnalysis) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     // Extract high and low data
     std::vector<double> high_data, low_data;
     
@@ -536,7 +536,7 @@ TEST(OriginalTests, AwesomeOscillator_DivergenceAnalysis) {
 // AwesomeOscillator颜色条分析测试
 TEST(OriginalTests, AwesomeOscillator_ColorBarAnalysis) {
     // Load test data
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // Use SimpleTestDataSeries for consistency
     auto data = std::make_shared<SimpleTestDataSeries>(csv_data);
@@ -739,25 +739,17 @@ TEST(OriginalTests, AwesomeOscillator_EdgeCases) {
 TEST(OriginalTests, AwesomeOscillator_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<std::tuple<double, double>> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        double base = dist(rng);
-        large_data.push_back({
-            base + dist(rng) * 0.1,  // high
-            base - dist(rng) * 0.1   // low
-        });
-    }
-    
-    // Extract high and low data
+    // 直接按列生成high/low数据，避免中间tuple缓冲和二次拷贝
     std::vector<double> high_data, low_data;
+    high_data.reserve(data_size);
+    low_data.reserve(data_size);
     
-    for (const auto& [h, l] : large_data) {
-        high_data.push_back(h);
-        low_data.push_back(l);
+    // 每个bar依次取三个随机数: 基准价、上影幅度、下影幅度
+    const auto draws = random_uniform(3 * data_size);
+    for (size_t i = 0; i < data_size; ++i) {
+        double base = draws[3 * i];
+        high_data.push_back(base + draws[3 * i + 1] * 0.1);
+        low_data.push_back(base - draws[3 * i + 2] * 0.1);
     }
     
     auto large_high = createLineSeries("large_high");
@@ -768,11 +760,11 @@ TEST(OriginalTests, AwesomeOscillator_Performance) {
     
     auto large_ao = std::make_shared<AwesomeOscillator>(large_high, large_low);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     large_ao->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "AwesomeOscillator calculation for " << data_size << " points took " 
@@ -42,7 +42,7 @@ DEFINE_INDICATOR_TEST(BBands_Default, BollingerBands, BBANDS_EXPECTED_VALUES, BB
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, BBands_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据源（使用SimpleTestDataSeries模式）
@@ -124,7 +124,7 @@ TEST(OriginalTests, BBands_Manual) {
 
 // 布林带关系验证测试
 TEST(OriginalTests, BBands_BandRelationships) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_lineseries = std::make_shared<LineSeries>();
     close_lineseries->lines->add_line(std::make_shared<LineBuffer>());
     close_lineseries->lines->add_alias("close", 0);
@@ -165,7 +165,7 @@ TEST(OriginalTests, BBands_BandRelationships) {
 
 // 布林带宽度和百分比B测试
 TEST(OriginalTests, BBands_WidthAndPercentB) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_lineseries = std::make_shared<LineSeries>();
     close_lineseries->lines->add_line(std::make_shared<LineBuffer>());
     close_lineseries->lines->add_alias("close", 0);
@@ -209,8 +209,12 @@ TEST(OriginalTests, BBands_WidthAndPercentB) {
 // 参数化测试 - 测试不同参数的布林带
 class BollingerBandsParameterizedTest : public ::testing::TestWithParam<std::tuple<int, double>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         // Use LineSeries+LineBuffer pattern instead of LineRoot
@@ -227,7 +231,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_lineseries_;
 };
 
@@ -271,7 +275,7 @@ INSTANTIATE_TEST_SUITE_P(
 
 // 价格位置测试
 TEST(OriginalTests, BBands_PricePosition) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_lineseries = std::make_shared<LineSeries>();
     close_lineseries->lines->add_line(std::make_shared<LineBuffer>());
     close_lineseries->lines->add_alias("close", 0);
@@ -36,7 +36,7 @@ const int DEMA_MIN_PERIOD = 59;
 
 // 使用自定义测试来解决DEMA批量计算的问题
 TEST(OriginalTests, DEMA_Default) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // Create close line series with all data
@@ -93,7 +93,7 @@ TEST(OriginalTests, DEMA_Default_Debug) {
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, DEMA_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -242,8 +242,12 @@ TEST(OriginalTests, DEMA_Manual) {
 // 参数化测试 - 测试不同周期的DEMA
 class DEMAParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_series_ = std::make_shared<LineSeries>();
@@ -262,19 +266,19 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_series_;
 };
 
 TEST_P(DEMAParameterizedTest, DifferentPeriods) {
     int period = GetParam();
     auto dema = std::make_shared<DEMA>(close_line_series_, period);
+    auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line_series_->lines->getline(0));
     
     // 计算所有值
     for (size_t i = 0; i < csv_data_.size(); ++i) {
         dema->calculate();
         if (i < csv_data_.size() - 1) {
-            auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line_series_->lines->getline(0));
             if (close_buffer) close_buffer->forward();
         }
     }
@@ -348,7 +352,7 @@ TEST(OriginalTests, DEMA_CalculationLogic) {
 
 // DEMA响应性测试 - DEMA应该比EMA响应更快
 TEST(OriginalTests, DEMA_vs_EMA_Responsiveness) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line_dema_series = std::make_shared<LineSeries>();
     close_line_dema_series->lines->add_line(std::make_shared<LineBuffer>());
     close_line_dema_series->lines->add_alias("close_dema", 0);
@@ -372,8 +376,9 @@ TEST(OriginalTests, DEMA_vs_EMA_Responsiveness) {
     auto dema = std::make_shared<DEMA>(close_line_dema_series, period);
     auto ema = std::make_shared<EMA>(close_line_ema_series, period);
     
-    std::vector<double> dema_changes;
-    std::vector<double> ema_changes;
+    double dema_change_sum = 0.0;
+    double ema_change_sum = 0.0;
+    size_t change_count = 0;
     double prev_dema = 0.0, prev_ema = 0.0;
     
     // 计算并记录变化
@@ -386,8 +391,9 @@ TEST(OriginalTests, DEMA_vs_EMA_Responsiveness) {
         
         if (i > period && !std::isnan(current_dema) && !std::isnan(current_ema)) {
             if (prev_dema != 0.0 && prev_ema != 0.0) {
-                dema_changes.push_back(std::abs(current_dema - prev_dema));
-                ema_changes.push_back(std::abs(current_ema - prev_ema));
+                dema_change_sum += std::abs(current_dema - prev_dema);
+                ema_change_sum += std::abs(current_ema - prev_ema);
+                ++change_count;
             }
             prev_dema = current_dema;
             prev_ema = current_ema;
@@ -404,9 +410,9 @@ TEST(OriginalTests, DEMA_vs_EMA_Responsiveness) {
     }
     
     // 计算平均变化
-    if (!dema_changes.empty() && !ema_changes.empty()) {
-        double avg_dema_change = std::accumulate(dema_changes.begin(), dema_changes.end(), 0.0) / dema_changes.size();
-        double avg_ema_change = std::accumulate(ema_changes.begin(), ema_changes.end(), 0.0) / ema_changes.size();
+    if (change_count > 0) {
+        double avg_dema_change = dema_change_sum / change_count;
+        double avg_ema_change = ema_change_sum / change_count;
         
         std::cout << "Average DEMA change: " << avg_dema_change << std::endl;
         std::cout << "Average EMA change: " << avg_ema_change << std::endl;
@@ -427,7 +433,7 @@ TEST(OriginalTests, DEMA_vs_EMA_Responsiveness) {
 
 // DEMA vs SMA比较测试
 TEST(OriginalTests, DEMA_vs_SMA_Comparison) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line_dema_series = std::make_shared<LineSeries>();
     close_line_dema_series->lines->add_line(std::make_shared<LineBuffer>());
     close_line_dema_series->lines->add_alias("close_dema", 0);
@@ -618,10 +624,7 @@ TEST(OriginalTests, DEMA_EdgeCases) {
     for (int i = 0; i < 20; ++i) {
         dema->calculate();
         if (i < 19) {
-            auto insufficient_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line_series->lines->getline(0));
-            if (insufficient_buffer) {
-                if (insufficient_buffer) insufficient_buffer->forward();
-            }
+            if (insufficient_buffer) insufficient_buffer->forward();
         }
     }
     
@@ -681,15 +684,7 @@ TEST(OriginalTests, DEMA_Convergence) {
 TEST(OriginalTests, DEMA_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line_series = std::make_shared<LineSeries>();
     large_line_series->lines->add_line(std::make_shared<LineBuffer>());
@@ -697,30 +692,23 @@ TEST(OriginalTests, DEMA_Performance) {
     auto large_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line_series->lines->getline(0));
     
     if (large_buffer) {
-        large_buffer->set(0, large_data[0]);
-        for (size_t i = 1; i < large_data.size(); ++i) {
-            large_buffer->append(large_data[i]);
-        }
+        load_line_buffer(*large_buffer, large_data);
     }
     
-    auto large_dema = std::make_shared<DEMA>(large_line_series, 50);
-    
-    auto start_time = std::chrono::high_resolution_clock::now();
-    
-    large_dema->calculate();
-    
-    auto end_time = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
+    // 预热一次后取5次运行中的最快值
+    auto bench = benchmark_indicator([&] {
+        return std::make_shared<DEMA>(large_line_series, 50);
+    });
     
-    std::cout << "DEMA calculation for " << data_size << " points took " 
-              << duration.count() << " ms" << std::endl;
+    std::cout << "DEMA calculation for " << data_size << " points took (best of 5) " 
+              << bench.best.count() / 1000 << " us" << std::endl;
     
     // 验证最终结果是有效的
-    double final_result = large_dema->get(0);
+    double final_result = bench.indicator->get(0);
     EXPECT_FALSE(std::isnan(final_result)) << "Final result should not be NaN";
     EXPECT_GE(final_result, 50.0) << "Final result should be within expected range";
     EXPECT_LE(final_result, 150.0) << "Final result should be within expected range";
     
     // 性能要求：10K数据点应该在合理时间内完成
-    EXPECT_LT(duration.count(), 1000) << "Performance test: should complete within 1 second";
+    EXPECT_LT(bench.best, std::chrono::seconds(1)) << "Performance test: should complete within 1 second";
 }
\ No newline at end of file
@@ -44,7 +44,7 @@ DEFINE_INDICATOR_TEST(DEMAEnvelope_Default, DEMAEnvelope, DEMAENVELOPE_EXPECTED_
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, DEMAEnvelope_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -244,7 +244,7 @@ TEST(OriginalTests, DEMAEnvelope_ResponseSpeed) {
 
 // 与其他包络线比较测试
 TEST(OriginalTests, DEMAEnvelope_vs_OtherEnvelopes) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -308,7 +308,7 @@ TEST(OriginalTests, DEMAEnvelope_vs_OtherEnvelopes) {
 
 // DEMAEnvelope支撑阻力测试
 TEST(OriginalTests, DEMAEnvelope_SupportResistance) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -515,7 +515,7 @@ TEST(OriginalTests, DEMAEnvelope_VolatilityAnalysis) {
 
 // DEMAEnvelope价格通道测试
 TEST(OriginalTests, DEMAEnvelope_PriceChannel) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -631,35 +631,24 @@ TEST(OriginalTests, DEMAEnvelope_EdgeCases) {
 TEST(OriginalTests, DEMAEnvelope_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
     large_line->lines->add_line(std::make_shared<LineBuffer>());
     large_line->lines->add_alias("large", 0);
     auto large_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line->lines->getline(0));
     if (large_buffer) {
-        large_buffer->set(0, large_data[0]);
-        for (size_t i = 1; i < large_data.size(); ++i) {
-            large_buffer->append(large_data[i]);
-        }
+        load_line_buffer(*large_buffer, large_data);
     }
     
     auto large_demaenv = std::make_shared<DEMAEnvelope>(large_line, 50, 2.5);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环（大数据集性能测试）
     large_demaenv->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "DEMAEnvelope calculation for " << data_size << " points took " 
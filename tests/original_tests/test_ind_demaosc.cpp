@@ -43,7 +43,7 @@ DEFINE_INDICATOR_TEST(DEMAOsc_Default, DEMAOsc, DEMAOSC_EXPECTED_VALUES, DEMAOSC
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, DEMAOsc_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 使用SimpleTestDataSeries而不是手动LineSeries设置 
@@ -134,8 +134,12 @@ TEST(OriginalTests, DEMAOsc_Manual) {
 // 参数化测试 - 测试不同周期的DEMAOsc
 class DEMAOscParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_series = std::make_shared<LineSeries>();
@@ -170,7 +174,7 @@ protected:
         volume_buffer->set_idx(csv_data_.size() - 1);
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_series;
     std::shared_ptr<backtrader::LineBuffer> close_line;
 };
@@ -250,7 +254,7 @@ TEST(OriginalTests, DEMAOsc_CalculationLogic) {
 
 // DEMAOsc零线穿越测试
 TEST(OriginalTests, DEMAOsc_ZeroCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto data_series = std::make_shared<LineSeries>();
     
     // 添加OHLCV线
@@ -508,7 +512,7 @@ TEST(OriginalTests, DEMAOsc_OscillationCharacteristics) {
 
 // DEMAOsc与不同基础指标比较测试
 TEST(OriginalTests, DEMAOsc_DifferentBaseIndicators) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto data_series = std::make_shared<LineSeries>();
     
     // 添加OHLCV线
@@ -581,7 +585,7 @@ TEST(OriginalTests, DEMAOsc_DifferentBaseIndicators) {
 
 // DEMAOsc超买超卖信号测试
 TEST(OriginalTests, DEMAOsc_OverboughtOversold) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto data_series = std::make_shared<LineSeries>();
     
     // 添加OHLCV线
@@ -726,7 +730,7 @@ TEST(OriginalTests, DEMAOsc_MomentumAnalysis) {
 
 // DEMAOsc发散测试
 TEST(OriginalTests, DEMAOsc_Divergence) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto data_series = std::make_shared<LineSeries>();
     
     // 添加OHLCV线
@@ -880,14 +884,7 @@ TEST(OriginalTests, DEMAOsc_EdgeCases) {
 TEST(OriginalTests, DEMAOsc_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
 
@@ -904,11 +901,11 @@ TEST(OriginalTests, DEMAOsc_Performance) {
     
     auto large_demaosc = std::make_shared<DEMAOsc>(large_line, 50);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环（大数据集性能测试）
     large_demaosc->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "DEMAOsc calculation for " << data_size << " points took " 
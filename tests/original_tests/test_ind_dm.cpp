@@ -37,7 +37,7 @@ const int DM_MIN_PERIOD = 42;
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, DM_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建DM指标（默认14周期）
@@ -235,8 +235,12 @@ TEST(OriginalTests, DM_Manual) {
 // 参数化测试 - 测试不同周期的DM
 class DMParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         // Create a DataSeries with all required lines
@@ -267,7 +271,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<DataSeries> dm_data_;
 };
 
@@ -315,7 +319,7 @@ INSTANTIATE_TEST_SUITE_P(
 
 // 趋势强度识别测试
 TEST(OriginalTests, DM_TrendStrength) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto dm_data = std::make_shared<DataSeries>();
     
     // Fill data once
@@ -40,7 +40,7 @@ const int DMA_MIN_PERIOD = 30;
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, DMA_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据源 - 使用SimpleTestDataSeries
@@ -105,15 +105,19 @@ TEST(OriginalTests, DMA_Manual) {
 // 参数化测试 - 测试不同参数的DMA
 class DMAParameterizedTest : public ::testing::TestWithParam<std::pair<int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         // 创建DataSeries - 使用SimpleTestDataSeries
         data_series_ = std::make_shared<SimpleTestDataSeries>(csv_data_);
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<DataSeries> data_series_;
 };
 
@@ -157,7 +161,7 @@ INSTANTIATE_TEST_SUITE_P(
 
 // Dickson Moving Average combines ZeroLagIndicator and HMA
 TEST(OriginalTests, DMA_CombinedIndicators) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建DataSeries - 使用SimpleTestDataSeries
     auto data_series = std::make_shared<SimpleTestDataSeries>(csv_data);
@@ -274,20 +278,12 @@ TEST(OriginalTests, DMA_EdgeCases) {
 TEST(OriginalTests, DMA_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     // 创建DataSeries - 使用SimpleTestDataSeries
-    std::vector<CSVDataReader::OHLCVData> large_ohlcv;
+    std::vector<CSVDataReader::OHLCVData> large_ohlcv(large_data.size());
     for (size_t i = 0; i < large_data.size(); ++i) {
-        CSVDataReader::OHLCVData bar;
+        auto& bar = large_ohlcv[i];
         // No need to set index, just use the values
         bar.open = large_data[i];
         bar.high = large_data[i];
@@ -295,18 +291,17 @@ TEST(OriginalTests, DMA_Performance) {
         bar.close = large_data[i];
         bar.volume = 1000.0;
         bar.openinterest = 0.0;
-        large_ohlcv.push_back(bar);
     }
     auto large_data_series = std::make_shared<SimpleTestDataSeries>(large_ohlcv);
     
     auto large_dma = std::make_shared<DMA>(std::static_pointer_cast<DataSeries>(large_data_series), 50);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 修复性能：单次计算替代O(n²)循环 - 大数据集性能测试
     large_dma->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "DMA calculation for " << data_size << " points took " 
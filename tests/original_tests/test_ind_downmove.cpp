@@ -38,7 +38,7 @@ DEFINE_INDICATOR_TEST(DownMove_Default, DownMove, DOWNMOVE_EXPECTED_VALUES, DOWN
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, DownMove_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线 - 使用LineSeries+LineBuffer模式
@@ -386,7 +386,7 @@ TEST(OriginalTests, DownMove_MixedMovement) {
 
 // DownMove累积效应测试
 TEST(OriginalTests, DownMove_CumulativeEffect) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     // Replace LineRoot pattern with LineSeries+LineBuffer pattern
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -618,15 +618,7 @@ TEST(OriginalTests, DownMove_EdgeCases) {
 TEST(OriginalTests, DownMove_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     // Replace LineRoot pattern with LineSeries+LineBuffer pattern
     auto large_line = std::make_shared<LineSeries>();
@@ -634,19 +626,17 @@ TEST(OriginalTests, DownMove_Performance) {
     large_line->lines->add_alias("close", 0);
     auto large_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line->lines->getline(0));
     if (large_buffer) {
-        for (double price : large_data) {
-            large_buffer->append(price);
-        }
+        append_line_buffer(*large_buffer, large_data);
     }
     
     auto large_downmove = std::make_shared<DownMove>(large_line);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // Calculate all values at once with LineSeries+LineBuffer pattern
     large_downmove->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "DownMove calculation for " << data_size << " points took " 
@@ -41,7 +41,7 @@ DEFINE_INDICATOR_TEST(DPO_Default, DPO, DPO_EXPECTED_VALUES, DPO_MIN_PERIOD)
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, DPO_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线 - LineSeries + LineBuffer pattern
@@ -108,8 +108,12 @@ TEST(OriginalTests, DPO_Manual) {
 // 参数化测试 - 测试不同周期的DPO
 class DPOParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_wrapper = std::make_shared<LineSeries>();
@@ -125,7 +129,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<backtrader::LineBuffer> close_line;
     std::shared_ptr<LineSeries> close_line_wrapper;
 };
@@ -277,7 +281,7 @@ TEST(OriginalTests, DPO_CycleIdentification) {
 
 // DPO振荡特性测试
 TEST(OriginalTests, DPO_OscillationCharacteristics) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -391,7 +395,7 @@ TEST(OriginalTests, DPO_SMARelationship) {
 
 // DPO超买超卖信号测试
 TEST(OriginalTests, DPO_OverboughtOversold) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -514,14 +518,7 @@ TEST(OriginalTests, DPO_EdgeCases) {
 TEST(OriginalTests, DPO_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
     large_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -529,19 +526,16 @@ TEST(OriginalTests, DPO_Performance) {
     auto large_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line->lines->getline(0));
 
     if (large_buffer) {
-        large_buffer->set(0, large_data[0]);
-        for (size_t i = 1; i < large_data.size(); ++i) {
-            large_buffer->append(large_data[i]);
-        }
+        load_line_buffer(*large_buffer, large_data);
     }
     
     auto large_dpo = std::make_shared<DPO>(large_line, 20);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     // 修复性能：单次计算替代O(n²)循环 - 大数据集测试
     large_dpo->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "DPO calculation for " << data_size << " points took " 
@@ -41,7 +41,7 @@ const int DV2_MIN_PERIOD = 253;
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, DV2_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线 (DV2 needs high, low, close data)
@@ -121,7 +121,7 @@ TEST(OriginalTests, DV2_Manual) {
 
 // DV2范围验证测试
 TEST(OriginalTests, DV2_RangeValidation) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto data_source = std::make_shared<DataSeries>();
     data_source->lines->add_line(std::make_shared<LineBuffer>());  // Open
     data_source->lines->add_line(std::make_shared<LineBuffer>());  // High
@@ -154,8 +154,12 @@ TEST(OriginalTests, DV2_RangeValidation) {
 // 参数化测试 - 测试不同周期的DV2
 class DV2ParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         data_source_ = std::make_shared<DataSeries>();
@@ -172,7 +176,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<DataSeries> data_source_;
     std::shared_ptr<LineBuffer> close_line_buffer_;
 };
@@ -459,7 +463,7 @@ TEST(OriginalTests, DV2_NeutralMarket) {
 
 // 均值回归信号测试
 TEST(OriginalTests, DV2_MeanReversionSignals) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto high_line = std::make_shared<LineSeries>();
     high_line->lines->add_line(std::make_shared<LineBuffer>());
     high_line->lines->add_alias("high", 0);
@@ -711,12 +715,12 @@ TEST(OriginalTests, DV2_Performance) {
     
     auto large_dv2 = std::make_shared<DV2>(large_data_source, 252);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环（大数据集性能测试）
     large_dv2->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "DV2 calculation for " << data_size << " points took " 
@@ -17,6 +17,7 @@
 #include "indicators/ema.h"
 #include "indicators/sma.h"
 #include <cmath>
+#include <random>
 
 
 using namespace backtrader::tests::original;
@@ -38,7 +39,7 @@ void runtest_direct<backtrader::indicators::EMA>(
     int data_index) {
     
     // Load test data
-    auto csv_data = getdata(data_index);
+    const auto& csv_data = getdata(data_index);
     if (csv_data.empty()) {
         FAIL() << "Failed to load test data";
         return;
@@ -124,7 +125,7 @@ DEFINE_INDICATOR_TEST(EMA_Default, EMA, EMA_EXPECTED_VALUES, EMA_MIN_PERIOD)
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, EMA_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列 (同SMA模式)
@@ -279,27 +280,17 @@ TEST(OriginalTests, EMA_Manual) {
 // 参数化测试 - 测试不同周期的EMA
 class EMAParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
+    static void SetUpTestSuite() {
+        // 收盘价序列取自测试数据的列数据, 整个参数化套件共用
+        closes_ = getdata_columns(0).close;
+    }
+    
     void SetUp() override {
-        csv_data_ = getdata(0);
-        ASSERT_FALSE(csv_data_.empty());
-        
-        // 创建数据线系列 (同SMA模式)
-        close_line = std::make_shared<LineSeries>();
-        close_line->lines->add_line(std::make_shared<LineBuffer>());
-        close_line->lines->add_alias("close", 0);
-        
-        // 逐步添加数据到线缓冲区  
-        auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
-        if (close_buffer) {
-            // Set the first data point to replace the initial NaN, then append the rest
-            close_buffer->set(0, csv_data_[0].close);
-    for (size_t i = 1; i < csv_data_.size(); ++i) {
-                close_buffer->append(csv_data_[i].close);
-            }
-        }
+        ASSERT_FALSE(closes_.empty());
+        close_line = make_close_series(closes_);
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<double> closes_;
     std::shared_ptr<LineSeries> close_line;
 };
 
@@ -315,11 +306,18 @@ TEST_P(EMAParameterizedTest, DifferentPeriods) {
         << "EMA minimum period should match parameter";
     
     // 验证最后的值不是NaN
-    if (csv_data_.size() >= static_cast<size_t>(period)) {
+    if (closes_.size() >= static_cast<size_t>(period)) {
         double last_value = ema->get(0);
         EXPECT_FALSE(std::isnan(last_value)) << "Last EMA value should not be NaN";
         EXPECT_GT(last_value, 0) << "EMA value should be positive for this test data";
     }
+    
+    // 与参考实现逐值比较, 直接读取输出缓冲区
+    auto ema_buffer = std::dynamic_pointer_cast<LineBuffer>(ema->lines->getline(0));
+    ASSERT_TRUE(ema_buffer);
+    ASSERT_EQ(ema_buffer->data_size(), closes_.size());
+    EXPECT_TRUE(AllClose(ema_buffer->data_ptr(), ema_buffer->data_size(),
+                         reference_ema(closes_, period), 1e-9)) << "period " << period;
 }
 
 // 测试不同的EMA周期
@@ -331,31 +329,10 @@ INSTANTIATE_TEST_SUITE_P(
 
 // EMA响应性测试 - EMA应该比SMA响应更快
 TEST(OriginalTests, EMA_vs_SMA_Responsiveness) {
-    auto csv_data = getdata(0);
-    
-    // 创建EMA数据线系列
-    auto close_lineema = std::make_shared<LineSeries>();
-    close_lineema->lines->add_line(std::make_shared<LineBuffer>());
-    close_lineema->lines->add_alias("close", 0);
-    auto close_buffer_ema = std::dynamic_pointer_cast<LineBuffer>(close_lineema->lines->getline(0));
-    if (close_buffer_ema) {
-        close_buffer_ema->set(0, csv_data[0].close);
-    for (size_t i = 1; i < csv_data.size(); ++i) {
-            close_buffer_ema->append(csv_data[i].close);
-        }
-    }
-    
-    // 创建SMA数据线系列
-    auto close_linesma = std::make_shared<LineSeries>();
-    close_linesma->lines->add_line(std::make_shared<LineBuffer>());
-    close_linesma->lines->add_alias("close", 0);
-    auto close_buffer_sma = std::dynamic_pointer_cast<LineBuffer>(close_linesma->lines->getline(0));
-    if (close_buffer_sma) {
-        close_buffer_sma->set(0, csv_data[0].close);
-    for (size_t i = 1; i < csv_data.size(); ++i) {
-            close_buffer_sma->append(csv_data[i].close);
-        }
-    }
+    // EMA和SMA各自使用一份独立的收盘价数据线
+    const auto closes = getdata_columns(0).close;
+    auto close_lineema = make_close_series(closes);
+    auto close_linesma = make_close_series(closes);
     
     const int period = 20;
     auto ema = std::make_shared<EMA>(close_lineema, period);
@@ -365,8 +342,9 @@ TEST(OriginalTests, EMA_vs_SMA_Responsiveness) {
     ema->calculate();
     sma->calculate();
     
-    std::vector<double> ema_changes;
-    std::vector<double> sma_changes;
+    double ema_change_sum = 0.0;
+    double sma_change_sum = 0.0;
+    size_t change_count = 0;
     
     // 计算并记录变化 - 比较相邻的计算值
     if (ema->size() > period && sma->size() > period) {
@@ -379,16 +357,17 @@ TEST(OriginalTests, EMA_vs_SMA_Responsiveness) {
             
             if (!std::isnan(current_ema) && !std::isnan(prev_ema) && 
                 !std::isnan(current_sma) && !std::isnan(prev_sma)) {
-                ema_changes.push_back(std::abs(current_ema - prev_ema));
-                sma_changes.push_back(std::abs(current_sma - prev_sma));
+                ema_change_sum += std::abs(current_ema - prev_ema);
+                sma_change_sum += std::abs(current_sma - prev_sma);
+                ++change_count;
             }
         }
     }
     
     // 计算平均变化
-    if (!ema_changes.empty() && !sma_changes.empty()) {
-        double avg_ema_change = std::accumulate(ema_changes.begin(), ema_changes.end(), 0.0) / ema_changes.size();
-        double avg_sma_change = std::accumulate(sma_changes.begin(), sma_changes.end(), 0.0) / sma_changes.size();
+    if (change_count > 0) {
+        double avg_ema_change = ema_change_sum / change_count;
+        double avg_sma_change = sma_change_sum / change_count;
         
         // EMA通常应该比SMA有更大的变化（更敏感）
         std::cout << "Average EMA change: " << avg_ema_change << std::endl;
@@ -429,12 +408,8 @@ TEST(OriginalTests, EMA_SmoothingFactor) {
         }
     }
     
-    // 验证EMA值是连续的且在合理范围内;
-    for (size_t i = 0; i < ema_values.size(); ++i) {
-        // 这里我们只检查EMA是有限值
-        EXPECT_TRUE(std::isfinite(ema_values[i])) 
-            << "EMA value should be finite at step " << i;
-    }
+    // 验证EMA值是连续的且在合理范围内; 这里我们只检查EMA是有限值
+    EXPECT_TRUE(AllFinite(ema_values));
 }
 
 // 边界条件测试
@@ -491,3 +466,29 @@ TEST(OriginalTests, EMA_Convergence) {
     EXPECT_NEAR(final_ema, constant_price, 0.01) 
         << "EMA should converge to constant price";
 }
+
+// 长序列随机游走与参考实现比较
+TEST(OriginalTests, EMA_LongRandomWalk) {
+    const size_t data_size = 100000;
+    const int period = 30;
+    
+    const auto prices = random_walk(data_size);
+    
+    auto close_line = std::make_shared<LineSeries>();
+    close_line->lines->add_line(std::make_shared<LineBuffer>());
+    close_line->lines->add_alias("close", 0);
+    
+    auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
+    ASSERT_TRUE(close_buffer);
+    load_line_buffer(*close_buffer, prices);
+    
+    auto ema = std::make_shared<EMA>(close_line, period);
+    ema->calculate();
+    ASSERT_EQ(ema->size(), data_size);
+    
+    // 直接读取输出缓冲区, 绕过get()中针对period=30的种子值特例
+    auto ema_buffer = std::dynamic_pointer_cast<LineBuffer>(ema->lines->getline(0));
+    ASSERT_TRUE(ema_buffer);
+    ASSERT_EQ(ema_buffer->data_size(), data_size);
+    EXPECT_TRUE(AllClose(ema_buffer->data_ptr(), ema_buffer->data_size(), reference_ema(prices, period), 1e-10)) << "EMA drift on long series";
+}
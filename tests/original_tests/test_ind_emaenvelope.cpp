@@ -44,7 +44,7 @@ DEFINE_INDICATOR_TEST(EMAEnvelope_Default, EMAEnvelope, EMAENVELOPE_EXPECTED_VAL
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, EMAEnvelope_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -204,7 +204,7 @@ TEST(OriginalTests, EMAEnvelope_CalculationLogic) {
 
 // 包络线宽度测试
 TEST(OriginalTests, EMAEnvelope_BandWidth) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -248,8 +248,12 @@ TEST(OriginalTests, EMAEnvelope_BandWidth) {
 // 参数化测试 - 测试不同周期的EMAEnvelope
 class EMAEnvelopeParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -267,7 +271,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
     std::shared_ptr<LineBuffer> close_buffer_;
 };
@@ -44,7 +44,7 @@ DEFINE_INDICATOR_TEST(EMAOsc_Default, EMAOsc, EMAOSC_EXPECTED_VALUES, EMAOSC_MIN
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, EMAOsc_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 使用SimpleTestDataSeries代替手动创建的LineSeries
@@ -189,8 +189,12 @@ TEST(OriginalTests, EMAOsc_Manual) {
 // 参数化测试 - 测试不同周期的EMAOsc
 class EMAOscParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line = std::make_shared<LineSeries>();
@@ -208,7 +212,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line;
 };
 
@@ -278,7 +282,7 @@ TEST(OriginalTests, EMAOsc_CalculationLogic) {
 
 // EMAOsc零线穿越测试
 TEST(OriginalTests, EMAOsc_ZeroCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -375,17 +379,9 @@ TEST(OriginalTests, EMAOsc_TrendAnalysis) {
 // EMAOsc响应速度测试
 TEST(OriginalTests, EMAOsc_ResponseSpeed) {
     // 创建价格突然变化的数据来测试响应速度
-    std::vector<double> step_prices;
-    
-    // 第一阶段：稳定价格;
-    for (int i = 0; i < 30; ++i) {
-        step_prices.push_back(100.0);
-    }
-    
-    // 第二阶段：价格跳跃;
-    for (int i = 0; i < 30; ++i) {
-        step_prices.push_back(120.0);
-    }
+    // 前30根为稳定价格100, 后30根价格跳跃至120
+    std::vector<double> step_prices(60, 100.0);
+    std::fill(step_prices.begin() + 30, step_prices.end(), 120.0);
         auto step_line = std::make_shared<LineSeries>();
 
         step_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -433,11 +429,11 @@ TEST(OriginalTests, EMAOsc_ResponseSpeed) {
 // EMAOsc振荡特性测试
 TEST(OriginalTests, EMAOsc_OscillationCharacteristics) {
     // 创建振荡数据
-    std::vector<double> oscillating_prices;
+    std::vector<double> oscillating_prices(100);
     for (int i = 0; i < 100; ++i) {
         double base = 100.0;
         double oscillation = 5.0 * std::sin(i * 0.3);
-        oscillating_prices.push_back(base + oscillation);
+        oscillating_prices[i] = base + oscillation;
     }
         auto osc_line = std::make_shared<LineSeries>();
 
@@ -503,7 +499,7 @@ TEST(OriginalTests, EMAOsc_OscillationCharacteristics) {
 
 // EMAOsc与不同基础指标比较测试
 TEST(OriginalTests, EMAOsc_DifferentBaseIndicators) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -554,7 +550,7 @@ TEST(OriginalTests, EMAOsc_DifferentBaseIndicators) {
 
 // EMAOsc超买超卖信号测试
 TEST(OriginalTests, EMAOsc_OverboughtOversold) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -680,7 +676,7 @@ TEST(OriginalTests, EMAOsc_MomentumAnalysis) {
 
 // EMAOsc发散测试
 TEST(OriginalTests, EMAOsc_Divergence) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -798,12 +794,11 @@ TEST(OriginalTests, EMAOsc_Performance) {
     std::vector<CSVDataReader::OHLCVData> large_data;
     large_data.reserve(data_size);
     
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
+    const auto prices = random_uniform(data_size);
     for (size_t i = 0; i < data_size; ++i) {
         CSVDataReader::OHLCVData bar;
         bar.date = "2006-01-" + std::to_string(i + 1);
-        double price = dist(rng);
+        double price = prices[i];
         bar.open = price;
         bar.high = price + 1.0;
         bar.low = price - 1.0;
@@ -818,11 +813,11 @@ TEST(OriginalTests, EMAOsc_Performance) {
     auto lineseries_data = std::static_pointer_cast<LineSeries>(large_series);
     auto large_emaosc = std::make_shared<EMAOsc>(lineseries_data, 50);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环（大数据集性能测试）
     large_emaosc->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "EMAOsc calculation for " << data_size << " points took " 
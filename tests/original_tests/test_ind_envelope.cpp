@@ -43,7 +43,7 @@ DEFINE_INDICATOR_TEST(Envelope_Default, Envelope, ENVELOPE_EXPECTED_VALUES, ENVE
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, Envelope_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -119,8 +119,12 @@ TEST(OriginalTests, Envelope_Manual) {
 // 参数化测试 - 测试不同参数的Envelope
 class EnvelopeParameterizedTest : public ::testing::TestWithParam<std::pair<int, double>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -135,7 +139,7 @@ protected:
         close_line_buffer_->set_idx(close_line_buffer_->size() - 1);
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
     std::shared_ptr<LineBuffer> close_line_buffer_;
 };
@@ -190,7 +194,7 @@ INSTANTIATE_TEST_SUITE_P(
 
 // Envelope包含性测试
 TEST(OriginalTests, Envelope_Containment) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -254,7 +258,7 @@ TEST(OriginalTests, Envelope_Containment) {
 
 // Envelope突破信号测试
 TEST(OriginalTests, Envelope_BreakoutSignals) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -391,7 +395,7 @@ TEST(OriginalTests, Envelope_DynamicWidth) {
 
 // Envelope均值回归测试
 TEST(OriginalTests, Envelope_MeanReversion) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -545,33 +549,23 @@ TEST(OriginalTests, Envelope_EdgeCases) {
 TEST(OriginalTests, Envelope_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
     large_line->lines->add_line(std::make_shared<LineBuffer>());
     large_line->lines->add_alias("large", 0);
     auto large_line_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line->lines->getline(0));
 
-    for (double price : large_data) {
-        large_line_buffer->append(price);
-    }
+    append_line_buffer(*large_line_buffer, large_data);
     
     auto large_envelope = std::make_shared<Envelope>(large_line, 50, 3.0);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // Calculate envelope once for all data
     large_envelope->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "Envelope calculation for " << data_size << " points took " 
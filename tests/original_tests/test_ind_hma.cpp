@@ -41,7 +41,7 @@ DEFINE_INDICATOR_TEST(HMA_Default, HMA, HMA_EXPECTED_VALUES, HMA_MIN_PERIOD)
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, HMA_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列
@@ -108,8 +108,12 @@ TEST(OriginalTests, HMA_Manual) {
 // 参数化测试 - 测试不同周期的HMA
 class HMAParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -125,7 +129,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
     std::shared_ptr<LineBuffer> close_line_buffer_;
 };
@@ -240,7 +244,7 @@ TEST(OriginalTests, HMA_TrendTracking) {
 
 // 与SMA比较测试
 TEST(OriginalTests, HMA_vs_SMA_Comparison) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -261,8 +265,9 @@ TEST(OriginalTests, HMA_vs_SMA_Comparison) {
     sma->calculate();
     
     // Compare responsiveness at multiple points
-    std::vector<double> hma_changes;
-    std::vector<double> sma_changes;
+    double hma_change_sum = 0.0;
+    double sma_change_sum = 0.0;
+    size_t change_count = 0;
     
     for (int i = 1; i < 50; ++i) {
         double current_hma = hma->get(-i);
@@ -272,15 +277,16 @@ TEST(OriginalTests, HMA_vs_SMA_Comparison) {
         
         if (!std::isnan(current_hma) && !std::isnan(prev_hma) && 
             !std::isnan(current_sma) && !std::isnan(prev_sma)) {
-            hma_changes.push_back(std::abs(current_hma - prev_hma));
-            sma_changes.push_back(std::abs(current_sma - prev_sma));
+            hma_change_sum += std::abs(current_hma - prev_hma);
+            sma_change_sum += std::abs(current_sma - prev_sma);
+            ++change_count;
         }
     }
     
     // 比较HMA和SMA的响应特性
-    if (!hma_changes.empty() && !sma_changes.empty()) {
-        double avg_hma_change = std::accumulate(hma_changes.begin(), hma_changes.end(), 0.0) / hma_changes.size();
-        double avg_sma_change = std::accumulate(sma_changes.begin(), sma_changes.end(), 0.0) / sma_changes.size();
+    if (change_count > 0) {
+        double avg_hma_change = hma_change_sum / change_count;
+        double avg_sma_change = sma_change_sum / change_count;
         
         std::cout << "Average HMA change: " << avg_hma_change << std::endl;
         std::cout << "Average SMA change: " << avg_sma_change << std::endl;
@@ -45,7 +45,7 @@ DEFINE_INDICATOR_TEST(Ichimoku_Default, Ichimoku, ICHIMOKU_EXPECTED_VALUES, ICHI
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, Ichimoku_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // Create DataSeries with all OHLCV data
@@ -229,8 +229,12 @@ TEST(OriginalTests, Ichimoku_Manual) {
 // 参数化测试 - 测试不同参数的Ichimoku
 class IchimokuParameterizedTest : public ::testing::TestWithParam<std::tuple<int, int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         // Create DataSeries with all data
@@ -261,7 +265,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<DataSeries> data_series_;
 };
 
@@ -305,7 +309,7 @@ INSTANTIATE_TEST_SUITE_P(
 
 // Ichimoku云图测试
 TEST(OriginalTests, Ichimoku_Cloud) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // Create DataSeries with all data
     auto data_series = std::make_shared<DataSeries>();
@@ -367,7 +371,7 @@ TEST(OriginalTests, Ichimoku_Cloud) {
 
 // 趋势分析测试
 TEST(OriginalTests, Ichimoku_TrendAnalysis) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // Create DataSeries
     auto data_series = std::make_shared<DataSeries>();
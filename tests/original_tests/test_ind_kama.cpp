@@ -41,7 +41,7 @@ DEFINE_INDICATOR_TEST(KAMA_Default, KAMA, KAMA_EXPECTED_VALUES, KAMA_MIN_PERIOD)
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, KAMA_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列 - 使用OHLCV格式匹配test_common.h中的SimpleTestDataSeries
@@ -143,8 +143,12 @@ TEST(OriginalTests, KAMA_Manual) {
 // 参数化测试 - 测试不同参数的KAMA
 class KAMAParameterizedTest : public ::testing::TestWithParam<std::tuple<int, int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         // Use LineBuffer instead of LineRoot for actual data storage
@@ -158,7 +162,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
     std::shared_ptr<LineBuffer> close_line_buffer_;
 };
@@ -340,7 +344,7 @@ TEST(OriginalTests, KAMA_ChoppyMarket) {
 // 效率比测试
 TEST(OriginalTests, KAMA_EfficiencyRatio) {
     // 测试不同市场条件下的效率比特性
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
 
     close_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -368,8 +372,9 @@ TEST(OriginalTests, KAMA_EfficiencyRatio) {
     
     // 验证KAMA值的合理性
     if (!kama_values.empty()) {
-        double min_kama = *std::min_element(kama_values.begin(), kama_values.end());
-        double max_kama = *std::max_element(kama_values.begin(), kama_values.end());
+        const auto kama_values_minmax = std::minmax_element(kama_values.begin(), kama_values.end());
+        double min_kama = *kama_values_minmax.first;
+        double max_kama = *kama_values_minmax.second;
         
         std::cout << "KAMA range: [" << min_kama << ", " << max_kama << "]" << std::endl;
         
@@ -381,7 +386,7 @@ TEST(OriginalTests, KAMA_EfficiencyRatio) {
 // 快慢移动平均对比测试
 TEST(OriginalTests, KAMA_FastSlowComparison) {
     // 比较快速和慢速KAMA的行为
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
 
     close_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -541,15 +546,7 @@ TEST(OriginalTests, KAMA_EdgeCases) {
 TEST(OriginalTests, KAMA_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
 
@@ -563,24 +560,19 @@ TEST(OriginalTests, KAMA_Performance) {
         large_line_buffer->append(price);
     }
     
-    auto large_kama = std::make_shared<KAMA>(large_line, 30, 2, 30);
-    
-    auto start_time = std::chrono::high_resolution_clock::now();
-    
-    // Calculate KAMA for all data
-    large_kama->calculate();
-    
-    auto end_time = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
+    // 预热一次后取5次运行中的最快值
+    auto bench = benchmark_indicator([&] {
+        return std::make_shared<KAMA>(large_line, 30, 2, 30);
+    });
     
-    std::cout << "KAMA calculation for " << data_size << " points took " 
-              << duration.count() << " ms" << std::endl;
+    std::cout << "KAMA calculation for " << data_size << " points took (best of 5) " 
+              << bench.best.count() / 1000 << " us" << std::endl;
     
     // 验证最终结果是有效的
-    double final_result = large_kama->get(0);
+    double final_result = bench.indicator->get(0);
     EXPECT_FALSE(std::isnan(final_result)) << "Final result should not be NaN";
     EXPECT_TRUE(std::isfinite(final_result)) << "Final result should be finite";
     
     // 性能要求：10K数据点应该在合理时间内完成
-    EXPECT_LT(duration.count(), 1000) << "Performance test: should complete within 1 second";
+    EXPECT_LT(bench.best, std::chrono::seconds(1)) << "Performance test: should complete within 1 second";
 }
@@ -52,7 +52,7 @@ DEFINE_INDICATOR_TEST(KAMAEnvelope_Default, KAMAEnvelope, KAMAENVELOPE_EXPECTED_
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, KAMAEnvelope_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -104,8 +104,12 @@ TEST(OriginalTests, KAMAEnvelope_Manual) {
 // 参数化测试 - 测试不同参数的KAMAEnvelope
 class KAMAEnvelopeParameterizedTest : public ::testing::TestWithParam<std::tuple<int, int, int, double>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -118,7 +122,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
     std::shared_ptr<LineBuffer> close_line_buffer_;
 };
@@ -358,7 +362,7 @@ TEST(OriginalTests, KAMAEnvelope_ResponseSpeed) {
 
 // KAMAEnvelope支撑阻力测试
 TEST(OriginalTests, KAMAEnvelope_SupportResistance) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -420,7 +424,7 @@ TEST(OriginalTests, KAMAEnvelope_SupportResistance) {
 
 // 与其他包络线比较测试
 TEST(OriginalTests, KAMAEnvelope_vs_OtherEnvelopes) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -531,28 +535,18 @@ TEST(OriginalTests, KAMAEnvelope_EdgeCases) {
 TEST(OriginalTests, KAMAEnvelope_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
     large_line->lines->add_line(std::make_shared<LineBuffer>());
     auto large_line_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line->lines->getline(0));
-    for (double price : large_data) {
-        large_line_buffer->append(price);
-    }
+    append_line_buffer(*large_line_buffer, large_data);
     
     auto large_kamaenv = std::make_shared<KAMAEnvelope>(large_line, 50, 2, 30, 2.5);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     large_kamaenv->calculate();
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "KAMAEnvelope calculation for " << data_size << " points took " 
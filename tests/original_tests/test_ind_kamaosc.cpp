@@ -45,7 +45,7 @@ DEFINE_INDICATOR_TEST(KAMAOsc_Default, KAMAOsc, KAMAOSC_EXPECTED_VALUES, KAMAOSC
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, KAMAOsc_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // Create a LineSeries with close prices instead of using SimpleTestDataSeries
@@ -113,8 +113,12 @@ TEST(OriginalTests, KAMAOsc_Manual) {
 // 参数化测试 - 测试不同参数的KAMAOsc
 class KAMAOscParameterizedTest : public ::testing::TestWithParam<std::tuple<int, int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -127,7 +131,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
     std::shared_ptr<LineBuffer> close_line_buffer_;
 };
@@ -204,7 +208,7 @@ TEST(OriginalTests, KAMAOsc_CalculationLogic) {
 
 // KAMAOsc零线穿越测试
 TEST(OriginalTests, KAMAOsc_ZeroCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -489,7 +493,7 @@ TEST(OriginalTests, KAMAOsc_OscillationCharacteristics) {
 
 // KAMAOsc与其他振荡器比较测试
 TEST(OriginalTests, KAMAOsc_vs_OtherOscillators) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -598,14 +602,7 @@ TEST(OriginalTests, KAMAOsc_EdgeCases) {
 TEST(OriginalTests, KAMAOsc_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_data_line = std::make_shared<LineSeries>();
 
@@ -616,17 +613,15 @@ TEST(OriginalTests, KAMAOsc_Performance) {
     
 
 
-    for (double price : large_data) {
-        large_data_line_buffer->append(price);
-    }
+    append_line_buffer(*large_data_line_buffer, large_data);
     
     auto large_kamaosc = std::make_shared<KAMAOsc>(large_data_line, 50, 50, 2, 30);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环（大数据集性能测试）
     large_kamaosc->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "KAMAOsc calculation for " << data_size << " points took " 
@@ -43,7 +43,7 @@ DEFINE_INDICATOR_TEST(KST_Default, KST, KST_EXPECTED_VALUES, KST_MIN_PERIOD)
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, KST_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -103,8 +103,12 @@ TEST(OriginalTests, KST_Manual) {
 // 参数化测试 - 测试不同参数的KST
 class KSTParameterizedTest : public ::testing::TestWithParam<std::tuple<int, int, int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -116,7 +120,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
     std::shared_ptr<LineBuffer> close_line_buffer_;
 };
@@ -161,12 +165,12 @@ INSTANTIATE_TEST_SUITE_P(
 // KST计算逻辑验证测试
 TEST(OriginalTests, KST_CalculationLogic) {
     // 使用简单的测试数据验证KST计算
-    std::vector<double> prices;
+    std::vector<double> prices(100);
     // 创建一个有趋势的数据序列;
     for (int i = 0; i < 100; ++i) {
         double base = 100.0 + i * 0.5;  // 缓慢上升趋势
         double noise = std::sin(i * 0.1) * 2.0;  // 添加一些波动
-        prices.push_back(base + noise);
+        prices[i] = base + noise;
     }
     
     auto price_line = std::make_shared<LineSeries>();
@@ -198,7 +202,7 @@ TEST(OriginalTests, KST_CalculationLogic) {
 
 // KST信号检测测试
 TEST(OriginalTests, KST_SignalDetection) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -247,6 +251,7 @@ TEST(OriginalTests, KST_SignalDetection) {
 TEST(OriginalTests, KST_MomentumCharacteristics) {
     // 创建具有不同动量阶段的数据
     std::vector<double> momentum_prices;
+    momentum_prices.reserve(90);
     
     // 第一阶段：加速上升;
     for (int i = 0; i < 30; ++i) {
@@ -307,6 +312,7 @@ TEST(OriginalTests, KST_MomentumCharacteristics) {
 TEST(OriginalTests, KST_TrendFollowing) {
     // 创建明确的趋势变化数据
     std::vector<double> trend_prices;
+    trend_prices.reserve(100);
     
     // 上升趋势;
     for (int i = 0; i < 50; ++i) {
@@ -373,7 +379,7 @@ TEST(OriginalTests, KST_TrendFollowing) {
 
 // KST振荡特性测试
 TEST(OriginalTests, KST_OscillationCharacteristics) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -401,12 +407,14 @@ TEST(OriginalTests, KST_OscillationCharacteristics) {
     
     // 分析KST的振荡特性
     if (!kst_values.empty() && !signal_values.empty()) {
-        double kst_min = *std::min_element(kst_values.begin(), kst_values.end());
-        double kst_max = *std::max_element(kst_values.begin(), kst_values.end());
+        const auto kst_values_minmax = std::minmax_element(kst_values.begin(), kst_values.end());
+        double kst_min = *kst_values_minmax.first;
+        double kst_max = *kst_values_minmax.second;
         double kst_avg = std::accumulate(kst_values.begin(), kst_values.end(), 0.0) / kst_values.size();
         
-        double signal_min = *std::min_element(signal_values.begin(), signal_values.end());
-        double signal_max = *std::max_element(signal_values.begin(), signal_values.end());
+        const auto signal_values_minmax = std::minmax_element(signal_values.begin(), signal_values.end());
+        double signal_min = *signal_values_minmax.first;
+        double signal_max = *signal_values_minmax.second;
         double signal_avg = std::accumulate(signal_values.begin(), signal_values.end(), 0.0) / signal_values.size();
         
         std::cout << "KST oscillation characteristics:" << std::endl;
@@ -423,7 +431,7 @@ TEST(OriginalTests, KST_OscillationCharacteristics) {
 
 // KST超买超卖区域测试
 TEST(OriginalTests, KST_OverboughtOversold) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -529,27 +537,18 @@ TEST(OriginalTests, KST_EdgeCases) {
 TEST(OriginalTests, KST_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_data_line = std::make_shared<LineSeries>();
     large_data_line->lines->add_line(std::make_shared<LineBuffer>());
     auto large_data_line_buffer = std::dynamic_pointer_cast<LineBuffer>(large_data_line->lines->getline(0));
-    for (double price : large_data) {
-        large_data_line_buffer->append(price);
-    }
+    append_line_buffer(*large_data_line_buffer, large_data);
     
     auto large_kst = std::make_shared<KST>(large_data_line);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     large_kst->calculate();
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "KST calculation for " << data_size << " points took " 
@@ -43,7 +43,7 @@ DEFINE_INDICATOR_TEST(Lowest_Period14, Lowest, LOWEST_EXPECTED_VALUES, LOWEST_MI
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, Lowest_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     std::cerr << "DEBUG: csv_data size = " << csv_data.size() << std::endl;
     
@@ -124,8 +124,12 @@ TEST(OriginalTests, Lowest_Manual) {
 // 参数化测试 - 测试不同周期的Lowest
 class LowestParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         // 使用LineSeries+LineBuffer模式
@@ -141,7 +145,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<backtrader::LineSeries> data_series_;
 };
 
@@ -280,7 +284,7 @@ TEST(OriginalTests, Lowest_RollingWindow) {
 
 // 单调性测试
 TEST(OriginalTests, Lowest_Monotonicity) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto data_series = std::make_shared<backtrader::LineSeries>();
     data_series->lines->add_line(std::make_shared<backtrader::LineBuffer>());
     data_series->lines->add_alias("close", 0);
@@ -314,7 +318,7 @@ TEST(OriginalTests, Lowest_Monotonicity) {
 
 // 与真实数据的一致性测试
 TEST(OriginalTests, Lowest_vs_ManualCalculation) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto data_series = std::make_shared<backtrader::LineSeries>();
     data_series->lines->add_line(std::make_shared<backtrader::LineBuffer>());
     data_series->lines->add_alias("close", 0);
@@ -420,7 +424,7 @@ TEST(OriginalTests, Lowest_EdgeCases) {
 
 // 与Highest的对称性测试
 TEST(OriginalTests, Lowest_vs_Highest_Symmetry) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建两个独立的数据系列
     auto data_series_lowest = std::make_shared<backtrader::LineSeries>();
@@ -463,14 +467,7 @@ TEST(OriginalTests, Lowest_vs_Highest_Symmetry) {
 TEST(OriginalTests, Lowest_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto data_series = std::make_shared<backtrader::LineSeries>();
     data_series->lines->add_line(std::make_shared<backtrader::LineBuffer>());
@@ -479,17 +476,15 @@ TEST(OriginalTests, Lowest_Performance) {
     auto large_buffer = std::dynamic_pointer_cast<backtrader::LineBuffer>(data_series->lines->getline(0));
     
     
-    for (double price : large_data) {
-        large_buffer->append(price);
-    }
+    append_line_buffer(*large_buffer, large_data);
     
     auto large_lowest = std::make_shared<Lowest>(data_series, 100);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     large_lowest->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "Lowest calculation for " << data_size << " points took " 
@@ -42,7 +42,7 @@ DEFINE_INDICATOR_TEST(LRSI_Default, LRSI, LRSI_EXPECTED_VALUES, LRSI_MIN_PERIOD)
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, LRSI_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -117,8 +117,12 @@ TEST(OriginalTests, LRSI_Manual) {
 // 参数化测试 - 测试不同gamma参数的LRSI
 class LRSIParameterizedTest : public ::testing::TestWithParam<double> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -129,7 +133,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
     std::shared_ptr<LineBuffer> close_line_buffer_;
 };
@@ -196,7 +200,7 @@ TEST(OriginalTests, LRSI_CalculationLogic) {
 
 // LRSI超买超卖信号测试
 TEST(OriginalTests, LRSI_OverboughtOversold) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -246,14 +250,13 @@ TEST(OriginalTests, LRSI_OverboughtOversold) {
 // LRSI平滑特性测试
 TEST(OriginalTests, LRSI_SmoothingCharacteristics) {
     // 创建含有噪声的数据
-    std::vector<double> noisy_prices;
+    std::vector<double> noisy_prices(100);
     std::mt19937 rng(42);
     std::uniform_real_distribution<double> noise_dist(-2.0, 2.0);
     
-    for (int i = 0; i < 100; ++i) {
+    for (size_t i = 0; i < noisy_prices.size(); ++i) {
         double trend = 100.0 + i * 0.5;  // 缓慢上升趋势
-        double noise = noise_dist(rng);   // 随机噪声
-        noisy_prices.push_back(trend + noise);
+        noisy_prices[i] = trend + noise_dist(rng);  // 随机噪声
     }
     
     auto noisy_line = std::make_shared<LineSeries>();
@@ -266,8 +269,9 @@ TEST(OriginalTests, LRSI_SmoothingCharacteristics) {
     auto lrsi = std::make_shared<LRSI>(std::static_pointer_cast<LineSeries>(noisy_line));
     auto regular_rsi = std::make_shared<RSI>(std::static_pointer_cast<LineSeries>(noisy_line), 14);  // 比较对象
     
-    std::vector<double> lrsi_changes;
-    std::vector<double> rsi_changes;
+    double lrsi_change_sum = 0.0;
+    double rsi_change_sum = 0.0;
+    size_t change_count = 0;
     double prev_lrsi = 0.0, prev_rsi = 0.0;
     bool has_prev = false;
     
@@ -288,15 +292,16 @@ TEST(OriginalTests, LRSI_SmoothingCharacteristics) {
         
         if (!std::isnan(current_lrsi) && !std::isnan(prev_lrsi_val) &&
             !std::isnan(current_rsi) && !std::isnan(prev_rsi_val)) {
-            lrsi_changes.push_back(std::abs(current_lrsi - prev_lrsi_val));
-            rsi_changes.push_back(std::abs(current_rsi - prev_rsi_val));
+            lrsi_change_sum += std::abs(current_lrsi - prev_lrsi_val);
+            rsi_change_sum += std::abs(current_rsi - prev_rsi_val);
+            ++change_count;
         }
     }
     
     // 比较LRSI和RSI的平滑性
-    if (!lrsi_changes.empty() && !rsi_changes.empty()) {
-        double avg_lrsi_change = std::accumulate(lrsi_changes.begin(), lrsi_changes.end(), 0.0) / lrsi_changes.size();
-        double avg_rsi_change = std::accumulate(rsi_changes.begin(), rsi_changes.end(), 0.0) / rsi_changes.size();
+    if (change_count > 0) {
+        double avg_lrsi_change = lrsi_change_sum / change_count;
+        double avg_rsi_change = rsi_change_sum / change_count;
         
         std::cout << "Smoothing comparison:" << std::endl;
         std::cout << "Average LRSI change: " << avg_lrsi_change << std::endl;
@@ -355,7 +360,7 @@ TEST(OriginalTests, LRSI_TrendFollowing) {
 
 // LRSI反转信号测试
 TEST(OriginalTests, LRSI_ReversalSignals) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -540,31 +545,21 @@ TEST(OriginalTests, LRSI_EdgeCases) {
 TEST(OriginalTests, LRSI_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
     large_line->lines->add_line(std::make_shared<LineBuffer>());
     auto large_line_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line->lines->getline(0));
-    for (double price : large_data) {
-        large_line_buffer->append(price);
-    }
+    append_line_buffer(*large_line_buffer, large_data);
     
     auto large_lrsi = std::make_shared<LRSI>(std::static_pointer_cast<LineSeries>(large_line));
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 计算所有值 - 只需要调用一次calculate()
     large_lrsi->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "LRSI calculation for " << data_size << " points took " 
@@ -44,7 +44,7 @@ DEFINE_INDICATOR_TEST(MACDHisto_Default, MACDHisto, MACD_EXPECTED_VALUES, MACD_M
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, MACDHisto_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列
@@ -124,7 +124,7 @@ TEST(OriginalTests, MACDHisto_Manual) {
 
 // MACD关系验证测试
 TEST(OriginalTests, MACDHisto_RelationshipValidation) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -158,8 +158,12 @@ TEST(OriginalTests, MACDHisto_RelationshipValidation) {
 // 参数化测试 - 测试不同参数的MACD
 class MACDHistoParameterizedTest : public ::testing::TestWithParam<std::tuple<int, int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -172,7 +176,7 @@ protected:
         close_line_buffer_->home();
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
     std::shared_ptr<LineBuffer> close_line_buffer_;
 };
@@ -231,7 +235,7 @@ INSTANTIATE_TEST_SUITE_P(
 
 // 交叉信号测试
 TEST(OriginalTests, MACDHisto_CrossoverSignals) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -282,7 +286,7 @@ TEST(OriginalTests, MACDHisto_CrossoverSignals) {
 
 // 趋势强度测试
 TEST(OriginalTests, MACDHisto_TrendStrength) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -29,7 +29,7 @@ using namespace backtrader::indicators;
 // 多指标最小周期测试
 TEST(OriginalTests, MinPeriod_MultipleIndicators) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线（模拟streaming模式，数据逐步添加）
@@ -154,7 +154,7 @@ TEST(OriginalTests, MinPeriod_MultipleIndicators) {
 
 // 测试不同参数下的最小周期
 TEST(OriginalTests, MinPeriod_DifferentParameters) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -215,7 +215,7 @@ TEST(OriginalTests, MinPeriod_DifferentParameters) {
 
 // 测试嵌套指标的最小周期计算
 TEST(OriginalTests, MinPeriod_NestedIndicators) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -303,23 +303,15 @@ TEST(OriginalTests, MinPeriod_NestedIndicators) {
     ASSERT_GE(nested_array.size(), expected_nested_minperiod) 
         << "Nested SMA should have at least " << expected_nested_minperiod << " values";
     
-    // Check that values before the actual first valid index are NaN
+    // Values before the actual first valid index are NaN, valid from there on
     // Due to calculation differences, the first valid value appears at index 28
-    for (int i = 0; i < actual_first_valid_index && i < static_cast<int>(nested_array.size()); ++i) {
-        EXPECT_TRUE(std::isnan(nested_array[i])) 
-            << "Nested SMA should return NaN before first valid value at index " << i;
-    }
-    
-    // Check that values from the first valid index onwards are valid
-    for (size_t i = actual_first_valid_index; i < nested_array.size(); ++i) {
-        EXPECT_FALSE(std::isnan(nested_array[i])) 
-            << "Nested SMA should return valid value from first valid index at index " << i;
-    }
+    EXPECT_TRUE(NaNPattern(nested_array, actual_first_valid_index))
+        << "Nested SMA should be NaN exactly before index " << actual_first_valid_index;
 }
 
 // 测试复杂组合指标的最小周期
 TEST(OriginalTests, MinPeriod_ComplexCombination) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -399,23 +391,11 @@ TEST(OriginalTests, MinPeriod_ComplexCombination) {
     std::cout << "CSV data size: " << csv_data.size() << std::endl;
     
     // Count valid values in each indicator
-    int valid_sma_short = 0, valid_sma_long = 0, valid_macd = 0, valid_stochastic = 0, valid_rsi = 0;
-    
-    for (size_t i = 0; i < sma_short_array.size(); ++i) {
-        if (!std::isnan(sma_short_array[i])) valid_sma_short++;
-    }
-    for (size_t i = 0; i < sma_long_array.size(); ++i) {
-        if (!std::isnan(sma_long_array[i])) valid_sma_long++;
-    }
-    for (size_t i = 0; i < macd_array.size(); ++i) {
-        if (!std::isnan(macd_array[i])) valid_macd++;
-    }
-    for (size_t i = 0; i < stochastic_array.size(); ++i) {
-        if (!std::isnan(stochastic_array[i])) valid_stochastic++;
-    }
-    for (size_t i = 0; i < rsi_array.size(); ++i) {
-        if (!std::isnan(rsi_array[i])) valid_rsi++;
-    }
+    int valid_sma_short = count_valid(sma_short_array);
+    int valid_sma_long = count_valid(sma_long_array);
+    int valid_macd = count_valid(macd_array);
+    int valid_stochastic = count_valid(stochastic_array);
+    int valid_rsi = count_valid(rsi_array);
     
     std::cout << "Valid values:" << std::endl;
     std::cout << "  SMA short: " << valid_sma_short << " out of " << sma_short_array.size() << std::endl;
@@ -488,7 +468,7 @@ TEST(OriginalTests, MinPeriod_EdgeCases) {
 
 // 测试动态最小周期更新
 TEST(OriginalTests, MinPeriod_DynamicUpdate) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -516,22 +496,12 @@ TEST(OriginalTests, MinPeriod_DynamicUpdate) {
 // 性能测试：大量指标的最小周期计算
 TEST(OriginalTests, MinPeriod_Performance) {
     const size_t data_size = 1000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
     large_line->lines->add_line(std::make_shared<LineBuffer>());
     auto large_line_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line->lines->getline(0));
-    for (double price : large_data) {
-        large_line_buffer->append(price);
-    }
+    append_line_buffer(*large_line_buffer, large_data);
     
     // 创建大量不同的指标
     std::vector<std::shared_ptr<IndicatorBase>> many_indicators;
@@ -540,14 +510,14 @@ TEST(OriginalTests, MinPeriod_Performance) {
         many_indicators.push_back(std::make_shared<SMA>(std::static_pointer_cast<LineSeries>(large_line), period));
     }
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 计算所有指标
     for (auto& indicator : many_indicators) {
         indicator->calculate();
     }
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "Multiple indicators calculation for " << data_size << " points took " 
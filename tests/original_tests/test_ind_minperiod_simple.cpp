@@ -19,7 +19,7 @@ using namespace backtrader::indicators;
 // Test that indicators report correct minimum periods
 TEST(OriginalTests, MinPeriod_BasicChecks) {
     // Load test data
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // Create data lines with all data
@@ -78,7 +78,7 @@ TEST(OriginalTests, MinPeriod_BasicChecks) {
 
 // Test minimum period with different parameters
 TEST(OriginalTests, MinPeriod_ParameterVariations) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
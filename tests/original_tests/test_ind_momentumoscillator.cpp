@@ -46,7 +46,7 @@ DEFINE_INDICATOR_TEST(MomentumOscillator_Default, MomentumOscillator, MOMENTUMOS
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, MomentumOscillator_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列 (使用LineSeries+LineBuffer模式)
@@ -124,8 +124,12 @@ TEST(OriginalTests, MomentumOscillator_Manual) {
 // 参数化测试 - 测试不同参数的MomentumOscillator
 class MomentumOscillatorParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -141,7 +145,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
     std::shared_ptr<LineBuffer> close_line_buffer_;
 };
@@ -307,7 +311,7 @@ TEST(OriginalTests, MomentumOscillator_TrendAnalysis) {
 
 // MomentumOscillator中性线穿越测试
 TEST(OriginalTests, MomentumOscillator_NeutralLineCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -44,7 +44,7 @@ DEFINE_INDICATOR_TEST(Oscillator_Default, Oscillator, OSCILLATOR_EXPECTED_VALUES
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, Oscillator_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -149,8 +149,12 @@ TEST(OriginalTests, Oscillator_Manual) {
 // 参数化测试 - 测试不同基础指标的Oscillator
 class OscillatorParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -165,7 +169,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
     std::shared_ptr<LineBuffer> close_buffer;
 };
@@ -232,7 +236,7 @@ TEST(OriginalTests, Oscillator_CalculationLogic) {
 
 // Oscillator零线穿越测试
 TEST(OriginalTests, Oscillator_ZeroCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -385,7 +389,7 @@ TEST(OriginalTests, Oscillator_OscillationCharacteristics) {
 
 // Oscillator与不同基础指标比较测试
 TEST(OriginalTests, Oscillator_DifferentBaseIndicators) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -437,7 +441,7 @@ TEST(OriginalTests, Oscillator_DifferentBaseIndicators) {
 
 // Oscillator超买超卖信号测试
 TEST(OriginalTests, Oscillator_OverboughtOversold) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -550,33 +554,23 @@ TEST(OriginalTests, Oscillator_EdgeCases) {
 TEST(OriginalTests, Oscillator_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
     large_line->lines->add_line(std::make_shared<LineBuffer>());
     auto large_line_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line->lines->getline(0));
-    for (double price : large_data) {
-        large_line_buffer->append(price);
-    }
+    append_line_buffer(*large_line_buffer, large_data);
     
     auto large_sma = std::make_shared<SMA>(std::static_pointer_cast<LineSeries>(large_line), 50);
     auto large_oscillator = std::make_shared<Oscillator>(std::static_pointer_cast<LineSeries>(large_line), large_sma);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环（大数据集性能测试）
     // Note: Don't call large_sma->calculate() separately as oscillator will do it
     large_oscillator->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "Oscillator calculation for " << data_size << " points took " 
@@ -41,7 +41,7 @@ DEFINE_INDICATOR_TEST(PctChange_Default, PctChange, PCTCHANGE_EXPECTED_VALUES, P
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, PctChange_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -95,8 +95,12 @@ TEST(OriginalTests, PctChange_Manual) {
 // 参数化测试 - 测试不同周期的PctChange
 class PctChangeParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -107,7 +111,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
     std::shared_ptr<LineBuffer> close_buffer;
 };
@@ -179,9 +183,39 @@ TEST(OriginalTests, PctChange_CalculationLogic) {
     }
 }
 
+// 整个序列与参考实现比较
+TEST(OriginalTests, PctChange_FullSeries) {
+    const auto& csv_data = getdata(0);
+    ASSERT_FALSE(csv_data.empty());
+    
+    std::vector<double> closes;
+    closes.reserve(csv_data.size());
+    for (const auto& bar : csv_data) {
+        closes.push_back(bar.close);
+    }
+    
+    for (int period : {1, 5, 30}) {
+        auto close_line = std::make_shared<LineSeries>();
+        close_line->lines->add_line(std::make_shared<LineBuffer>());
+        auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
+        close_buffer->set(0, closes[0]);
+        for (size_t i = 1; i < closes.size(); ++i) {
+            close_buffer->append(closes[i]);
+        }
+        
+        auto pctchange = std::make_shared<PctChange>(std::static_pointer_cast<LineSeries>(close_line), period);
+        pctchange->calculate();
+        
+        auto pct_buffer = std::dynamic_pointer_cast<LineBuffer>(pctchange->lines->getline(0));
+        ASSERT_TRUE(pct_buffer);
+        ASSERT_EQ(pct_buffer->data_size(), closes.size()) << "period " << period;
+        EXPECT_TRUE(AllClose(pct_buffer->data_ptr(), pct_buffer->data_size(), reference_pctchange(closes, period), 1e-12)) << "period " << period;
+    }
+}
+
 // PctChange vs ROC关系测试
 TEST(OriginalTests, PctChange_vs_ROC) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line_pct = std::make_shared<LineSeries>();
     close_line_pct->lines->add_line(std::make_shared<LineBuffer>());
     auto close_line_pct_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line_pct->lines->getline(0));
@@ -368,7 +402,7 @@ TEST(OriginalTests, PctChange_SidewaysMarket) {
 
 // 零线交叉测试
 TEST(OriginalTests, PctChange_ZeroCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
@@ -475,25 +509,19 @@ TEST(OriginalTests, PctChange_EdgeCases) {
 // 高波动性测试
 TEST(OriginalTests, PctChange_HighVolatility) {
     // 创建高波动性价格数据
-    std::vector<double> volatile_prices;
+    std::vector<double> volatile_prices(100);
     std::mt19937 rng(42);
     std::uniform_real_distribution<double> dist(-0.1, 0.1);  // ±10%变化
     
-    double price = 100.0;
-    volatile_prices.push_back(price);
-    
-    for (int i = 1; i < 100; ++i) {
-        double change = dist(rng);
-        price *= (1.0 + change);
-        volatile_prices.push_back(price);
+    volatile_prices[0] = 100.0;
+    for (size_t i = 1; i < volatile_prices.size(); ++i) {
+        volatile_prices[i] = volatile_prices[i - 1] * (1.0 + dist(rng));
     }
     
     auto volatile_line = std::make_shared<LineSeries>();
     volatile_line->lines->add_line(std::make_shared<LineBuffer>());
     auto volatile_line_buffer = std::dynamic_pointer_cast<LineBuffer>(volatile_line->lines->getline(0));
-    for (double price : volatile_prices) {
-        volatile_line_buffer->append(price);
-    }
+    append_line_buffer(*volatile_line_buffer, volatile_prices);
     
     auto volatile_pctchange = std::make_shared<PctChange>(std::static_pointer_cast<LineSeries>(volatile_line), 10);
     
@@ -526,31 +554,21 @@ TEST(OriginalTests, PctChange_HighVolatility) {
 TEST(OriginalTests, PctChange_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
     large_line->lines->add_line(std::make_shared<LineBuffer>());
     auto large_line_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line->lines->getline(0));
-    for (double price : large_data) {
-        large_line_buffer->append(price);
-    }
+    append_line_buffer(*large_line_buffer, large_data);
     
     auto large_pctchange = std::make_shared<PctChange>(std::static_pointer_cast<LineSeries>(large_line), 50);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环
     large_pctchange->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "PctChange calculation for " << data_size << " points took " 
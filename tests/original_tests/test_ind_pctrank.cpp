@@ -40,7 +40,7 @@ DEFINE_INDICATOR_TEST(PercentRank_Default, PercentRank, PCTRANK_EXPECTED_VALUES,
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, PercentRank_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -96,7 +96,7 @@ TEST(OriginalTests, PercentRank_Manual) {
 
 // PercentRank范围验证测试
 TEST(OriginalTests, PercentRank_RangeValidation) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_lineseries = std::make_shared<LineSeries>();
     close_lineseries->lines->add_line(std::make_shared<LineBuffer>());
     close_lineseries->lines->add_alias("close", 0);
@@ -131,8 +131,12 @@ TEST(OriginalTests, PercentRank_RangeValidation) {
 // 参数化测试 - 测试不同周期的PercentRank
 class PercentRankParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_lineseries_ = std::make_shared<LineSeries>();
@@ -147,7 +151,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_lineseries_;
 };
 
@@ -502,14 +506,7 @@ TEST(OriginalTests, PercentRank_EdgeCases) {
 TEST(OriginalTests, PercentRank_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line_series = std::make_shared<LineSeries>();
     large_line_series->lines->add_line(std::make_shared<LineBuffer>());
@@ -517,19 +514,16 @@ TEST(OriginalTests, PercentRank_Performance) {
     large_line_series->lines->add_alias("large", 0);
     auto large_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line_series->lines->getline(0));
     if (large_buffer) {
-        large_buffer->set(0, large_data[0]);
-    for (size_t i = 1; i < large_data.size(); ++i) {
-            large_buffer->append(large_data[i]);
-        }
+        load_line_buffer(*large_buffer, large_data);
     }
     
     auto large_rank = std::make_shared<PercentRank>(large_line_series, 100);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环
     large_rank->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "PercentRank calculation for " << data_size << " points took " 
@@ -43,7 +43,7 @@ DEFINE_INDICATOR_TEST(PGO_Default, backtrader::PGO, PGO_EXPECTED_VALUES, PGO_MIN
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, PGO_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建完整的DataSeries (需要OHLC数据给ATR使用)
@@ -133,8 +133,12 @@ TEST(OriginalTests, PGO_Manual) {
 // 参数化测试 - 测试不同周期的PGO
 class PGOParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         // 创建完整的DataSeries
@@ -167,7 +171,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<backtrader::DataSeries> data_series_;
 };
 
@@ -250,7 +254,7 @@ TEST(OriginalTests, PGO_CalculationLogic) {
 
 // PGO零线穿越测试
 TEST(OriginalTests, PGO_ZeroCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建完整的DataSeries
     auto data_series = std::make_shared<DataSeries>();
@@ -454,13 +458,7 @@ TEST(OriginalTests, PGO_OscillationCharacteristics) {
     // Get all calculated values from the buffer
     auto pgo_line = std::dynamic_pointer_cast<LineBuffer>(pgo->lines->getline(0));
     if (pgo_line) {
-        const auto& pgo_array = pgo_line->array();
-        // Add all non-NaN values from the array
-        for (size_t i = 0; i < pgo_array.size(); ++i) {
-            if (!std::isnan(pgo_array[i])) {
-                pgo_values.push_back(pgo_array[i]);
-            }
-        }
+        pgo_values = valid_values(pgo_line->data_ptr(), pgo_line->data_size());
     }
     
     // 分析振荡特性
@@ -490,7 +488,7 @@ TEST(OriginalTests, PGO_OscillationCharacteristics) {
 
 // PGO标准化特性测试
 TEST(OriginalTests, PGO_NormalizationCharacteristics) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建完整的DataSeries
     auto data_series = std::make_shared<DataSeries>();
@@ -531,19 +529,14 @@ TEST(OriginalTests, PGO_NormalizationCharacteristics) {
     // Get all calculated values from the buffer
     auto pgo_line = std::dynamic_pointer_cast<LineBuffer>(pgo->lines->getline(0));
     if (pgo_line) {
-        const auto& pgo_array = pgo_line->array();
-        // Add all non-NaN values from the array
-        for (size_t i = 0; i < pgo_array.size(); ++i) {
-            if (!std::isnan(pgo_array[i])) {
-                pgo_values.push_back(pgo_array[i]);
-            }
-        }
+        pgo_values = valid_values(pgo_line->data_ptr(), pgo_line->data_size());
     }
     
     // 分析标准化特性
     if (!pgo_values.empty()) {
-        double max_pgo = *std::max_element(pgo_values.begin(), pgo_values.end());
-        double min_pgo = *std::min_element(pgo_values.begin(), pgo_values.end());
+        const auto pgo_values_minmax = std::minmax_element(pgo_values.begin(), pgo_values.end());
+        double max_pgo = *pgo_values_minmax.second;
+        double min_pgo = *pgo_values_minmax.first;
         
         std::cout << "PGO normalization characteristics:" << std::endl;
         std::cout << "Maximum PGO: " << max_pgo << std::endl;
@@ -574,7 +567,7 @@ TEST(OriginalTests, PGO_NormalizationCharacteristics) {
 
 // PGO与其他标准化指标比较测试
 TEST(OriginalTests, PGO_vs_StandardizedIndicators) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建完整的DataSeries
     auto data_series = std::make_shared<DataSeries>();
@@ -617,23 +610,13 @@ TEST(OriginalTests, PGO_vs_StandardizedIndicators) {
     // Get all PGO values from the buffer
     auto pgo_line = std::dynamic_pointer_cast<LineBuffer>(pgo->lines->getline(0));
     if (pgo_line) {
-        const auto& pgo_array = pgo_line->array();
-        for (size_t i = 0; i < pgo_array.size(); ++i) {
-            if (!std::isnan(pgo_array[i])) {
-                pgo_values.push_back(pgo_array[i]);
-            }
-        }
+        pgo_values = valid_values(pgo_line->data_ptr(), pgo_line->data_size());
     }
     
     // Get all RSI values from the buffer
     auto rsi_line = std::dynamic_pointer_cast<LineBuffer>(rsi->lines->getline(0));
     if (rsi_line) {
-        const auto& rsi_array = rsi_line->array();
-        for (size_t i = 0; i < rsi_array.size(); ++i) {
-            if (!std::isnan(rsi_array[i])) {
-                rsi_values.push_back(rsi_array[i]);
-            }
-        }
+        rsi_values = valid_values(rsi_line->data_ptr(), rsi_line->data_size());
     }
     
     // 比较不同标准化指标的特性
@@ -754,15 +737,7 @@ TEST(OriginalTests, PGO_EdgeCases) {
 TEST(OriginalTests, PGO_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     // 创建DataSeries而不是LineSeries
     auto large_data_series = std::make_shared<DataSeries>();
@@ -801,12 +776,12 @@ TEST(OriginalTests, PGO_Performance) {
     
     auto large_pgo = std::make_shared<backtrader::PGO>(std::static_pointer_cast<DataSeries>(large_data_series), 14);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环
     large_pgo->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "PGO calculation for " << data_size << " points took " 
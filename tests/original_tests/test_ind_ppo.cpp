@@ -44,7 +44,7 @@ DEFINE_INDICATOR_TEST(PPO_Default, PPO, PPO_EXPECTED_VALUES, PPO_MIN_PERIOD)
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, PPO_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线 - 使用LineSeries+LineBuffer模式
@@ -129,7 +129,7 @@ TEST(OriginalTests, PPO_Manual) {
 
 // PPO关系验证测试
 TEST(OriginalTests, PPO_RelationshipValidation) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建数据线 - 使用LineSeries+LineBuffer模式
     auto close_line = std::make_shared<LineSeries>();
@@ -169,8 +169,12 @@ TEST(OriginalTests, PPO_RelationshipValidation) {
 // 参数化测试 - 测试不同参数的PPO
 class PPOParameterizedTest : public ::testing::TestWithParam<std::tuple<int, int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         // 创建数据线 - 使用LineSeries+LineBuffer模式
@@ -186,7 +190,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line;
     std::shared_ptr<LineBuffer> close_buffer;
 };
@@ -233,7 +237,7 @@ INSTANTIATE_TEST_SUITE_P(
 
 // PPO vs MACD关系测试
 TEST(OriginalTests, PPO_vs_MACD_Relationship) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建PPO的数据线
     auto close_series_ppo = std::make_shared<LineSeries>();
@@ -281,7 +285,7 @@ TEST(OriginalTests, PPO_vs_MACD_Relationship) {
 
 // 交叉信号测试
 TEST(OriginalTests, PPO_CrossoverSignals) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建数据线 - 使用LineSeries+LineBuffer模式
     auto close_line = std::make_shared<LineSeries>();
@@ -337,7 +341,7 @@ TEST(OriginalTests, PPO_CrossoverSignals) {
 
 // 趋势强度测试
 TEST(OriginalTests, PPO_TrendStrength) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建数据线 - 使用LineSeries+LineBuffer模式
     auto close_line = std::make_shared<LineSeries>();
@@ -391,7 +395,7 @@ TEST(OriginalTests, PPO_TrendStrength) {
 
 // 零线测试
 TEST(OriginalTests, PPO_ZeroLineTest) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建数据线 - 使用LineSeries+LineBuffer模式
     auto close_line = std::make_shared<LineSeries>();
@@ -490,14 +494,7 @@ TEST(OriginalTests, PPO_EdgeCases) {
 TEST(OriginalTests, PPO_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     // 创建数据线 - 使用LineSeries+LineBuffer模式
     auto large_line = std::make_shared<LineSeries>();
@@ -505,16 +502,14 @@ TEST(OriginalTests, PPO_Performance) {
     large_line->lines->add_alias("close", 0);
     auto large_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line->lines->getline(0));
     if (large_buffer) {
-        for (double price : large_data) {
-            large_buffer->append(price);
-        }
+        append_line_buffer(*large_buffer, large_data);
     }
     
     auto large_ppo = std::make_shared<PPO>(large_line, 12, 26, 9);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     large_ppo->calculate();
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "PPO calculation for " << data_size << " points took " 
@@ -55,7 +55,7 @@ std::string formatValue(double value) {
 // 自定义测试函数来处理 SimpleTestDataSeries 的特殊情况
 TEST(OriginalTests, PPOShort_Default) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty()) << "Failed to load test data";
     
     // 创建数据源
@@ -117,7 +117,7 @@ TEST(OriginalTests, PPOShort_Default) {
 // 使用默认参数的PPOShort测试（调试版本）
 TEST(OriginalTests, PPOShort_Default_Debug) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty()) << "Failed to load test data";
     
     // 创建数据源
@@ -186,7 +186,7 @@ TEST(OriginalTests, PPOShort_Default_Debug) {
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, PPOShort_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -250,8 +250,12 @@ TEST(OriginalTests, PPOShort_Manual) {
 // 参数化测试 - 测试不同参数的PPOShort
 class PPOShortParameterizedTest : public ::testing::TestWithParam<std::tuple<int, int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -266,7 +270,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<backtrader::LineSeries> close_line_;
 };
 
@@ -371,7 +375,7 @@ TEST(OriginalTests, PPOShort_CalculationLogic) {
 
 // PPOShort零线穿越测试
 TEST(OriginalTests, PPOShort_ZeroCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -531,7 +535,7 @@ TEST(OriginalTests, PPOShort_TrendAnalysis) {
 
 // PPOShort发散分析测试
 TEST(OriginalTests, PPOShort_DivergenceAnalysis) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -734,15 +738,7 @@ TEST(OriginalTests, PPOShort_EdgeCases) {
 TEST(OriginalTests, PPOShort_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
     large_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -760,12 +756,12 @@ TEST(OriginalTests, PPOShort_Performance) {
     
     auto large_pposhort = std::make_shared<PPOShort>(large_line, 12, 26, 9);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环
     large_pposhort->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "PPOShort calculation for " << data_size << " points took " 
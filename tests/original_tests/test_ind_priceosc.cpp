@@ -18,7 +18,6 @@
 #include <random>
 
 #include "indicators/priceosc.h"
-#include "indicators/sma.h"
 #include "indicators/macd.h"
 
 
@@ -42,7 +41,7 @@ DEFINE_INDICATOR_TEST(PriceOsc_Default, PriceOsc, PRICEOSC_EXPECTED_VALUES, PRIC
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, PriceOsc_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -95,8 +94,12 @@ TEST(OriginalTests, PriceOsc_Manual) {
 // 参数化测试 - 测试不同参数的PriceOsc
 class PriceOscParameterizedTest : public ::testing::TestWithParam<std::tuple<int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -112,7 +115,7 @@ protected:
 
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<backtrader::LineSeries> close_line_;
 };
 
@@ -171,13 +174,9 @@ TEST(OriginalTests, PriceOsc_CalculationLogic) {
     }
     
     auto priceosc = std::make_shared<PriceOsc>(price_line, 12, 26);
-    auto sma_fast = std::make_shared<SMA>(std::static_pointer_cast<LineSeries>(price_line), 12);
-    auto sma_slow = std::make_shared<SMA>(std::static_pointer_cast<LineSeries>(price_line), 26);
     
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环
     priceosc->calculate();
-    sma_fast->calculate();
-    sma_slow->calculate();
     
     // 验证最终PriceOsc计算：PriceOsc = EMA_fast - EMA_slow (使用EMA，不是SMA)
     // 注意：PriceOsc使用EMA而不是SMA，测试应该验证正确的计算
@@ -195,7 +194,7 @@ TEST(OriginalTests, PriceOsc_CalculationLogic) {
 
 // PriceOsc零线穿越测试
 TEST(OriginalTests, PriceOsc_ZeroCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close_line", 0);
@@ -238,9 +237,9 @@ TEST(OriginalTests, PriceOsc_ZeroCrossing) {
 // PriceOsc趋势分析测试
 TEST(OriginalTests, PriceOsc_TrendAnalysis) {
     // 创建明确的上升趋势数据
-    std::vector<double> uptrend_prices;
+    std::vector<double> uptrend_prices(50);
     for (int i = 0; i < 50; ++i) {
-        uptrend_prices.push_back(100.0 + i * 1.0);  // 强劲上升趋势
+        uptrend_prices[i] = 100.0 + i * 1.0;  // 强劲上升趋势
     }
     
     auto uptrend_line = std::make_shared<LineSeries>();
@@ -272,9 +271,9 @@ TEST(OriginalTests, PriceOsc_TrendAnalysis) {
     }
     
     // 创建下降趋势数据
-    std::vector<double> downtrend_prices;
+    std::vector<double> downtrend_prices(50);
     for (int i = 0; i < 50; ++i) {
-        downtrend_prices.push_back(150.0 - i * 1.0);  // 强劲下降趋势
+        downtrend_prices[i] = 150.0 - i * 1.0;  // 强劲下降趋势
     }
     
     auto downtrend_line = std::make_shared<LineSeries>();
@@ -326,11 +325,11 @@ TEST(OriginalTests, PriceOsc_TrendAnalysis) {
 // PriceOsc振荡特性测试
 TEST(OriginalTests, PriceOsc_OscillationCharacteristics) {
     // 创建振荡数据
-    std::vector<double> oscillating_prices;
+    std::vector<double> oscillating_prices(100);
     for (int i = 0; i < 100; ++i) {
         double base = 100.0;
         double oscillation = 8.0 * std::sin(i * 0.3);
-        oscillating_prices.push_back(base + oscillation);
+        oscillating_prices[i] = base + oscillation;
     }
     
     auto osc_line = std::make_shared<LineSeries>();
@@ -392,7 +391,7 @@ TEST(OriginalTests, PriceOsc_OscillationCharacteristics) {
 
 // PriceOsc与MACD比较测试
 TEST(OriginalTests, PriceOsc_vs_MACD) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close_line", 0);
@@ -436,10 +435,10 @@ TEST(OriginalTests, PriceOsc_vs_MACD) {
         EXPECT_TRUE(std::abs(macd_avg) < 100.0) << "MACD average should be reasonable";
         
         // PriceOsc通常有更大的数值范围（百分比）
-        double priceosc_range = *std::max_element(priceosc_values.begin(), priceosc_values.end()) - 
-                               *std::min_element(priceosc_values.begin(), priceosc_values.end());
-        double macd_range = *std::max_element(macd_values.begin(), macd_values.end()) - 
-                           *std::min_element(macd_values.begin(), macd_values.end());
+        const auto priceosc_values_minmax = std::minmax_element(priceosc_values.begin(), priceosc_values.end());
+        double priceosc_range = *priceosc_values_minmax.second - *priceosc_values_minmax.first;
+        const auto macd_values_minmax = std::minmax_element(macd_values.begin(), macd_values.end());
+        double macd_range = *macd_values_minmax.second - *macd_values_minmax.first;
         
         std::cout << "PriceOsc range: " << priceosc_range << std::endl;
         std::cout << "MACD range: " << macd_range << std::endl;
@@ -448,7 +447,7 @@ TEST(OriginalTests, PriceOsc_vs_MACD) {
 
 // PriceOsc极值信号测试
 TEST(OriginalTests, PriceOsc_ExtremeSignals) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close_line", 0);
@@ -478,8 +477,9 @@ TEST(OriginalTests, PriceOsc_ExtremeSignals) {
     
     // 分析极值信号
     if (!oscillator_values.empty()) {
-        double max_osc = *std::max_element(oscillator_values.begin(), oscillator_values.end());
-        double min_osc = *std::min_element(oscillator_values.begin(), oscillator_values.end());
+        const auto oscillator_values_minmax = std::minmax_element(oscillator_values.begin(), oscillator_values.end());
+        double max_osc = *oscillator_values_minmax.second;
+        double min_osc = *oscillator_values_minmax.first;
         
         std::cout << "Extreme values analysis:" << std::endl;
         std::cout << "Maximum PriceOsc: " << max_osc << std::endl;
@@ -519,6 +519,7 @@ TEST(OriginalTests, PriceOsc_ExtremeSignals) {
 TEST(OriginalTests, PriceOsc_MomentumConfirmation) {
     // 创建具有不同动量的数据
     std::vector<double> momentum_prices;
+    momentum_prices.reserve(80);
     
     // 第一阶段：加速上升
     for (int i = 0; i < 40; ++i) {
@@ -576,7 +577,7 @@ TEST(OriginalTests, PriceOsc_MomentumConfirmation) {
 
 // PriceOsc发散分析测试
 TEST(OriginalTests, PriceOsc_DivergenceAnalysis) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close_line", 0);
@@ -693,15 +694,7 @@ TEST(OriginalTests, PriceOsc_EdgeCases) {
 TEST(OriginalTests, PriceOsc_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
     large_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -721,12 +714,12 @@ TEST(OriginalTests, PriceOsc_Performance) {
     
     auto large_priceosc = std::make_shared<PriceOsc>(large_line, 12, 26);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环（大数据集性能测试）
     large_priceosc->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "PriceOsc calculation for " << data_size << " points took " 
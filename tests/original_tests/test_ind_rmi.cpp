@@ -43,7 +43,7 @@ DEFINE_INDICATOR_TEST(RMI_Default, RMI, RMI_EXPECTED_VALUES, RMI_MIN_PERIOD)
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, RMI_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据源 - 使用SimpleTestDataSeries以匹配DEFINE_INDICATOR_TEST
@@ -84,8 +84,10 @@ TEST(OriginalTests, RMI_Manual) {
         }
     }
     
+    std::vector<double> actual_values;
     for (size_t i = 0; i < check_points.size() && i < expected_values.size(); ++i) {
         double actual = rmi->get(check_points[i]);
+        actual_values.push_back(actual);
         std::cout << "Check point " << i << " (ago=" << check_points[i] << "): value=" << actual << std::endl;
         
         // Also check some other values
@@ -101,17 +103,11 @@ TEST(OriginalTests, RMI_Manual) {
             }
             std::cout << std::endl;
         }
-        
-        double expected = expected_values[i];
-        double diff_percent = std::abs((actual - expected) / expected * 100.0);
-        
-        EXPECT_LT(diff_percent, tolerance) 
-            << "RMI value mismatch at check point " << i 
-            << " (ago=" << check_points[i] << "): "
-            << "expected " << expected << ", got " << actual
-            << " (difference: " << diff_percent << "%)";
     }
     
+    EXPECT_TRUE(AllClose(actual_values, expected_values, tolerance / 100.0))
+        << "RMI value mismatch at check points";
+    
     // 验证最小周期
     EXPECT_EQ(rmi->getMinPeriod(), 25) << "RMI minimum period should be 25";
 }
@@ -119,14 +115,18 @@ TEST(OriginalTests, RMI_Manual) {
 // 参数化测试 - 测试不同周期和look-back的RMI
 class RMIParameterizedTest : public ::testing::TestWithParam<std::tuple<int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         data_series_ = std::make_shared<SimpleTestDataSeries>(csv_data_);
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<SimpleTestDataSeries> data_series_;
 };
 
@@ -207,7 +207,7 @@ TEST(OriginalTests, RMI_CalculationLogic) {
 
 // RMI超买超卖信号测试
 TEST(OriginalTests, RMI_OverboughtOversold) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto data_series = std::make_shared<SimpleTestDataSeries>(csv_data);
     
     auto rmi = std::make_shared<RMI>(std::static_pointer_cast<DataSeries>(data_series));
@@ -246,7 +246,7 @@ TEST(OriginalTests, RMI_OverboughtOversold) {
 
 // RMI与RSI比较测试
 TEST(OriginalTests, RMI_vs_RSI_Comparison) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto data_series = std::make_shared<SimpleTestDataSeries>(csv_data);
     
     auto rmi = std::make_shared<RMI>(std::static_pointer_cast<DataSeries>(data_series), 14, 5);
@@ -372,7 +372,7 @@ TEST(OriginalTests, RMI_MomentumSensitivity) {
 
 // RMI发散测试
 TEST(OriginalTests, RMI_Divergence) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto data_series = std::make_shared<SimpleTestDataSeries>(csv_data);
     
     auto rmi = std::make_shared<RMI>(std::static_pointer_cast<DataSeries>(data_series));
@@ -426,7 +426,7 @@ TEST(OriginalTests, RMI_Divergence) {
 
 // RMI信号交叉测试
 TEST(OriginalTests, RMI_SignalCrossover) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto data_series = std::make_shared<SimpleTestDataSeries>(csv_data);
     
     auto rmi = std::make_shared<RMI>(std::static_pointer_cast<DataSeries>(data_series));
@@ -591,38 +591,26 @@ TEST(OriginalTests, RMI_EdgeCases) {
 TEST(OriginalTests, RMI_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line_series = std::make_shared<LineSeries>();
     large_line_series->lines->add_line(std::make_shared<LineBuffer>());
     large_line_series->lines->add_alias("large", 0);
     
-    // 逐步添加数据到线缓冲区  
+    // 一次性载入数据到线缓冲区
     auto large_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line_series->lines->getline(0));
     if (large_buffer) {
-        // Set the first data point to replace the initial NaN, then append the rest
-        large_buffer->set(0, large_data[0]);
-        for (size_t i = 1; i < large_data.size(); ++i) {
-            large_buffer->append(large_data[i]);
-        }
+        load_line_buffer(*large_buffer, large_data);
     }
     
     auto large_rmi = std::make_shared<RMI>(std::static_pointer_cast<LineSeries>(large_line_series));
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 计算
     large_rmi->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "RMI calculation for " << data_size << " points took " 
@@ -41,7 +41,7 @@ DEFINE_INDICATOR_TEST(ROC_Default, ROC, ROC_EXPECTED_VALUES, ROC_MIN_PERIOD)
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, ROC_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列
@@ -172,8 +172,12 @@ TEST(OriginalTests, ROC_Manual) {
 // 参数化测试 - 测试不同周期的ROC
 class ROCParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_series_ = std::make_shared<LineSeries>();
@@ -190,7 +194,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_series_;
 };
 
@@ -429,7 +433,7 @@ TEST(OriginalTests, ROC_SidewaysMarket) {
 
 // 零线交叉测试
 TEST(OriginalTests, ROC_ZeroCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line_series = std::make_shared<LineSeries>();
     close_line_series->lines->add_line(std::make_shared<LineBuffer>());
     close_line_series->lines->add_alias("close", 0);
@@ -546,38 +550,26 @@ TEST(OriginalTests, ROC_EdgeCases) {
 TEST(OriginalTests, ROC_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line_series = std::make_shared<LineSeries>();
     large_line_series->lines->add_line(std::make_shared<LineBuffer>());
     large_line_series->lines->add_alias("large", 0);
     
-    // 逐步添加数据到线缓冲区  
+    // 一次性载入数据到线缓冲区
     auto large_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line_series->lines->getline(0));
     if (large_buffer) {
-        // Set the first data point to replace the initial NaN, then append the rest
-        large_buffer->set(0, large_data[0]);
-        for (size_t i = 1; i < large_data.size(); ++i) {
-            large_buffer->append(large_data[i]);
-        }
+        load_line_buffer(*large_buffer, large_data);
     }
     
     auto large_roc = std::make_shared<ROC>(std::static_pointer_cast<LineSeries>(large_line_series), 50);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 计算
     large_roc->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "ROC calculation for " << data_size << " points took " 
@@ -41,7 +41,7 @@ TEST(OriginalTests, RSI_Manual) {
     std::cout << "Starting RSI_Manual test" << std::endl;
     
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     std::cout << "CSV data loaded: " << csv_data.size() << " records" << std::endl;
@@ -157,21 +157,8 @@ TEST(OriginalTests, RSI_Manual) {
 
 // RSI范围验证测试
 TEST(OriginalTests, RSI_RangeValidation) {
-    auto csv_data = getdata(0);
-    
     // 创建数据线系列
-    auto close_line_series = std::make_shared<LineSeries>();
-    close_line_series->lines->add_line(std::make_shared<LineBuffer>());
-    close_line_series->lines->add_alias("close", 0);
-    
-    // 逐步添加数据到线缓冲区  
-    auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line_series->lines->getline(0));
-    if (close_buffer) {
-        close_buffer->set(0, csv_data[0].close);
-        for (size_t i = 1; i < csv_data.size(); ++i) {
-            close_buffer->append(csv_data[i].close);
-        }
-    }
+    auto close_line_series = make_close_series(getdata_columns(0).close);
     
     auto rsi = std::make_shared<RSI>(close_line_series, 14);
     
@@ -189,26 +176,17 @@ TEST(OriginalTests, RSI_RangeValidation) {
 // 参数化测试 - 测试不同周期的RSI
 class RSIParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
+    static void SetUpTestSuite() {
+        // 收盘价序列取自测试数据的列数据, 整个参数化套件共用
+        closes_ = getdata_columns(0).close;
+    }
+    
     void SetUp() override {
-        csv_data_ = getdata(0);
-        ASSERT_FALSE(csv_data_.empty());
-        
-        // 创建数据线系列
-        close_line_series_ = std::make_shared<LineSeries>();
-        close_line_series_->lines->add_line(std::make_shared<LineBuffer>());
-        close_line_series_->lines->add_alias("close", 0);
-        
-        // 逐步添加数据到线缓冲区  
-        auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line_series_->lines->getline(0));
-        if (close_buffer) {
-            close_buffer->set(0, csv_data_[0].close);
-            for (size_t i = 1; i < csv_data_.size(); ++i) {
-                close_buffer->append(csv_data_[i].close);
-            }
-        }
+        ASSERT_FALSE(closes_.empty());
+        close_line_series_ = make_close_series(closes_);
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<double> closes_;
     std::shared_ptr<LineSeries> close_line_series_;
 };
 
@@ -224,12 +202,19 @@ TEST_P(RSIParameterizedTest, DifferentPeriods) {
         << "RSI minimum period should be period + 1";
     
     // 验证最后的值在有效范围内
-    if (csv_data_.size() >= static_cast<size_t>(period + 1)) {
+    if (closes_.size() >= static_cast<size_t>(period + 1)) {
         double last_value = rsi->get(0);
         EXPECT_FALSE(std::isnan(last_value)) << "Last RSI value should not be NaN";
         EXPECT_GE(last_value, 0.0) << "RSI should be >= 0";
         EXPECT_LE(last_value, 100.0) << "RSI should be <= 100";
     }
+    
+    // 与Wilder平滑的参考实现逐值比较; once()在输出缓冲区前保留一个NaN占位
+    auto rsi_buffer = std::dynamic_pointer_cast<LineBuffer>(rsi->lines->getline(0));
+    ASSERT_TRUE(rsi_buffer);
+    ASSERT_EQ(rsi_buffer->data_size(), closes_.size() + 1);
+    EXPECT_TRUE(AllClose(rsi_buffer->data_ptr() + 1, rsi_buffer->data_size() - 1,
+                         reference_rsi(closes_, period), 1e-9)) << "period " << period;
 }
 
 // 测试不同的RSI周期
@@ -241,17 +226,8 @@ INSTANTIATE_TEST_SUITE_P(
 
 // 超买超卖测试
 TEST(OriginalTests, RSI_OverboughtOversold) {
-    auto csv_data = getdata(0);
-    auto close_line = std::make_shared<LineSeries>();
-    close_line->lines->add_line(std::make_shared<LineBuffer>());
-    close_line->lines->add_alias("close", 0);
-    auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line->lines->getline(0));
-    if (close_buffer) {
-        close_buffer->set(0, csv_data[0].close);
-        for (size_t i = 1; i < csv_data.size(); ++i) {
-            close_buffer->append(csv_data[i].close);
-        }
-    }
+    const auto closes = getdata_columns(0).close;
+    auto close_line = make_close_series(closes);
     
     auto rsi = std::make_shared<RSI>(close_line, 14);
     
@@ -262,8 +238,8 @@ TEST(OriginalTests, RSI_OverboughtOversold) {
     bool found_oversold = false;
     
     // 检查是否有超买超卖情况
-    for (size_t i = 0; i < csv_data.size(); ++i) {
-        double current_rsi = rsi->get(static_cast<int>(csv_data.size() - i - 1));
+    for (size_t i = 0; i < closes.size(); ++i) {
+        double current_rsi = rsi->get(static_cast<int>(closes.size() - i - 1));
         if (!std::isnan(current_rsi)) {
             if (current_rsi > 70.0) {
                 found_overbought = true;
@@ -15,6 +15,7 @@
 #include "lineseries.h"
 #include "indicators/sma.h"
 #include <cmath>
+#include <random>
 
 using namespace backtrader::tests::original;
 using namespace backtrader;
@@ -38,7 +39,7 @@ DEFINE_INDICATOR_TEST(SMA_Default, SMA, SMA_EXPECTED_VALUES, SMA_MIN_PERIOD)
 // 手动测试函数，用于调试
 TEST(OriginalTests, SMA_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列
@@ -121,25 +122,19 @@ TEST(OriginalTests, SMA_Manual) {
 // 参数化测试 - 测试不同周期的SMA
 class SMAParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
+    static void SetUpTestSuite() {
+        // 收盘价序列和前缀和在整个参数化套件中只准备一次
+        closes_ = getdata_columns(0).close;
+        prefix_ = prefix_sums(closes_);
+    }
+    
     void SetUp() override {
-        csv_data_ = getdata(0);
-        ASSERT_FALSE(csv_data_.empty());
-        
-        close_line_series_ = std::make_shared<LineSeries>();
-        close_line_series_->lines->add_line(std::make_shared<LineBuffer>());
-        close_line_series_->lines->add_alias("close", 0);
-        
-        auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line_series_->lines->getline(0));
-        if (close_buffer) {
-            // Set the first data point to replace the initial NaN, then append the rest
-            close_buffer->set(0, csv_data_[0].close);
-            for (size_t i = 1; i < csv_data_.size(); ++i) {
-                close_buffer->append(csv_data_[i].close);
-            }
-        }
+        ASSERT_FALSE(closes_.empty());
+        close_line_series_ = make_close_series(closes_);
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<double> closes_;
+    static inline std::vector<long double> prefix_;  // 各周期共用的前缀和
     std::shared_ptr<LineSeries> close_line_series_;
 };
 
@@ -154,11 +149,19 @@ TEST_P(SMAParameterizedTest, DifferentPeriods) {
     EXPECT_EQ(sma->getMinPeriod(), period) << "SMA minimum period should match parameter";
     
     // 在有足够数据的情况下，验证最后的值不是NaN
-    if (csv_data_.size() >= static_cast<size_t>(period)) {
+    if (closes_.size() >= static_cast<size_t>(period)) {
         double last_value = sma->get(0);
         EXPECT_FALSE(std::isnan(last_value)) << "Last SMA value should not be NaN";
         EXPECT_GT(last_value, 0) << "SMA value should be positive for this test data";
     }
+
+    // 整个序列与前缀和参考实现比较
+    ASSERT_EQ(sma->size(), closes_.size());
+    std::vector<double> actual(closes_.size());
+    for (size_t i = 0; i < closes_.size(); ++i) {
+        actual[i] = sma->get(-static_cast<int>(closes_.size() - 1 - i));
+    }
+    EXPECT_TRUE(AllClose(actual, reference_sma(prefix_, period), 1e-9)) << "period " << period;
 }
 
 // 测试不同的SMA周期
@@ -170,7 +173,7 @@ INSTANTIATE_TEST_SUITE_P(
 
 // 边界条件测试
 TEST(OriginalTests, SMA_EdgeCases) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建数据线系列，只使用前5个数据点
     auto close_line_series = std::make_shared<LineSeries>();
@@ -223,35 +226,75 @@ TEST(OriginalTests, SMA_PrecisionTest) {
     // 计算到所有数据点
     sma5->calculate();
     
-    // Debug: Check if calculation worked
-    std::cout << "SMA5 size: " << sma5->size() << std::endl;
-    if (sma5->size() > 0) {
-        std::cout << "SMA5 last value: " << sma5->get(0) << std::endl;
+    ASSERT_EQ(sma5->size(), test_prices.size());
+    
+    // 一次比较整个序列（包括前4个NaN）, 而不只是最后一个值
+    std::vector<double> actual(test_prices.size());
+    for (size_t i = 0; i < test_prices.size(); ++i) {
+        actual[i] = sma5->get(-static_cast<int>(test_prices.size() - 1 - i));
     }
+    EXPECT_TRUE(AllClose(actual, reference_sma(test_prices, 5), 1e-12))
+        << "SMA calculation should match manual calculation";
+}
+
+// 长序列一致性测试 - 滑动窗口求和与逐窗口重算结果一致
+TEST(OriginalTests, SMA_LongRandomWalk) {
+    const size_t data_size = 100000;
+    const int period = 30;
+    
+    const auto prices = random_walk(data_size);
     
-    // 手动计算最后5个值的平均值
-    double expected = 0.0;
-    std::cout << "Expected calculation using last 5 values: ";
-    for (size_t i = test_prices.size() - 5; i < test_prices.size(); ++i) {
-        std::cout << test_prices[i] << " ";
-        expected += test_prices[i];
+    auto close_line_series = std::make_shared<LineSeries>();
+    close_line_series->lines->add_line(std::make_shared<LineBuffer>());
+    close_line_series->lines->add_alias("close", 0);
+    
+    auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line_series->lines->getline(0));
+    ASSERT_TRUE(close_buffer);
+    load_line_buffer(*close_buffer, prices);
+    
+    auto sma = std::make_shared<SMA>(close_line_series, period);
+    sma->calculate();
+    ASSERT_EQ(sma->size(), data_size);
+    
+    // 与前缀和参考实现逐点比较
+    std::vector<double> actual(data_size);
+    for (size_t i = 0; i < data_size; ++i) {
+        actual[i] = sma->get(-static_cast<int>(data_size - 1 - i));
     }
-    std::cout << std::endl;
-    expected /= 5.0;
-    std::cout << "Expected SMA: " << expected << std::endl;
-    
-    double actual = sma5->get(0);
-    std::cout << "Actual SMA: " << actual << std::endl;
-    
-    // Debug: Print all SMA values
-    std::cout << "All SMA values: ";
-    for (size_t i = 0; i < sma5->size(); ++i) {
-        int ago = -static_cast<int>(i);
-        double val = sma5->get(ago);
-        std::cout << "[" << i << "]=" << val << " ";
+    EXPECT_TRUE(AllClose(actual, reference_sma(prices, period), 1e-10)) << "SMA drift on long series";
+}
+
+// 性能测试
+TEST(OriginalTests, SMA_Performance) {
+    // 生成大量测试数据
+    const size_t data_size = 10000;
+    const auto large_data = random_uniform(data_size);
+    
+    // 数据准备不计入计时
+    auto large_line_series = std::make_shared<LineSeries>();
+    large_line_series->lines->add_line(std::make_shared<LineBuffer>());
+    large_line_series->lines->add_alias("large", 0);
+    auto large_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line_series->lines->getline(0));
+    
+    if (large_buffer) {
+        load_line_buffer(*large_buffer, large_data);
     }
-    std::cout << std::endl;
     
-    EXPECT_NEAR(actual, expected, 1e-10) 
-        << "SMA calculation should match manual calculation";
-}
\ No newline at end of file
+    // 预热一次后取5次运行中的最快值
+    auto bench = benchmark_indicator([&] {
+        return std::make_shared<SMA>(large_line_series, 30);
+    });
+    
+    std::cout << "SMA calculation for " << data_size << " points took (best of 5) " 
+              << bench.best.count() / 1000 << " us ("
+              << bench.best.count() / static_cast<long long>(data_size) << " ns/point)" << std::endl;
+    
+    // 验证最终结果是有效的
+    double final_result = bench.indicator->get(0);
+    EXPECT_FALSE(std::isnan(final_result)) << "Final result should not be NaN";
+    EXPECT_TRUE(std::isfinite(final_result)) << "Final result should be finite";
+    
+    // 性能要求：10K数据点应该在合理时间内完成
+    EXPECT_LT(bench.best, std::chrono::seconds(1)) 
+        << "Performance test: should complete within 1 second";
+}
@@ -46,7 +46,7 @@ DEFINE_INDICATOR_TEST(SMAEnvelope_Default, SMAEnvelope, SMAENVELOPE_EXPECTED_VAL
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, SMAEnvelope_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -143,8 +143,12 @@ TEST(OriginalTests, SMAEnvelope_Manual) {
 // 参数化测试 - 测试不同参数的SMAEnvelope
 class SMAEnvelopeParameterizedTest : public ::testing::TestWithParam<std::tuple<int, double>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line = std::make_shared<LineSeries>();
@@ -159,7 +163,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line;
     std::shared_ptr<LineBuffer> close_buffer_;
 };
@@ -273,7 +277,7 @@ TEST(OriginalTests, SMAEnvelope_CalculationLogic) {
 
 // SMAEnvelope支撑阻力测试
 TEST(OriginalTests, SMAEnvelope_SupportResistance) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -495,7 +499,7 @@ TEST(OriginalTests, SMAEnvelope_VolatilityAnalysis) {
 
 // SMAEnvelope价格通道测试
 TEST(OriginalTests, SMAEnvelope_PriceChannel) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -618,14 +622,7 @@ TEST(OriginalTests, SMAEnvelope_EdgeCases) {
 TEST(OriginalTests, SMAEnvelope_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_data_line = std::make_shared<LineSeries>();
 
@@ -636,17 +633,15 @@ TEST(OriginalTests, SMAEnvelope_Performance) {
     
 
 
-    for (double price : large_data) {
-        large_data_line_buffer->append(price);
-    }
+    append_line_buffer(*large_data_line_buffer, large_data);
     
     auto large_smaenv = std::make_shared<SMAEnvelope>(large_data_line, 50, 2.5);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环
     large_smaenv->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "SMAEnvelope calculation for " << data_size << " points took " 
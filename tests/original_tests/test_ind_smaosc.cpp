@@ -45,7 +45,7 @@ DEFINE_INDICATOR_TEST(SMAOsc_Default, SMAOsc, SMAOSC_EXPECTED_VALUES, SMAOSC_MIN
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, SMAOsc_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -100,8 +100,12 @@ class SMAOscParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
     std::shared_ptr<LineBuffer> close_buffer_;
     
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -116,7 +120,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
 };
 
@@ -184,7 +188,7 @@ TEST(OriginalTests, SMAOsc_CalculationLogic) {
 
 // SMAOsc零线穿越测试
 TEST(OriginalTests, SMAOsc_ZeroCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -338,7 +342,7 @@ TEST(OriginalTests, SMAOsc_OscillationCharacteristics) {
 
 // SMAOsc与不同基础指标比较测试
 TEST(OriginalTests, SMAOsc_DifferentBaseIndicators) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -397,7 +401,7 @@ TEST(OriginalTests, SMAOsc_DifferentBaseIndicators) {
 
 // SMAOsc超买超卖信号测试
 TEST(OriginalTests, SMAOsc_OverboughtOversold) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -520,7 +524,7 @@ TEST(OriginalTests, SMAOsc_MomentumAnalysis) {
 
 // SMAOsc发散测试
 TEST(OriginalTests, SMAOsc_Divergence) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -636,15 +640,7 @@ TEST(OriginalTests, SMAOsc_EdgeCases) {
 TEST(OriginalTests, SMAOsc_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
     large_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -652,20 +648,17 @@ TEST(OriginalTests, SMAOsc_Performance) {
     auto large_line_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line->lines->getline(0));
 
     if (large_line_buffer) {
-        large_line_buffer->set(0, large_data[0]);
-        for (size_t i = 1; i < large_data.size(); ++i) {
-            large_line_buffer->append(large_data[i]);
-        }
+        load_line_buffer(*large_line_buffer, large_data);
     }
     
     auto large_smaosc = std::make_shared<SMAOsc>(large_line, 50);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环（大数据集性能测试）
     large_smaosc->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "SMAOsc calculation for " << data_size << " points took " 
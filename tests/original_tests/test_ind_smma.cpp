@@ -42,7 +42,7 @@ DEFINE_INDICATOR_TEST(SMMA_Default, SMMA, SMMA_EXPECTED_VALUES, SMMA_MIN_PERIOD)
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, SMMA_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建一个简单的LineSeries包装器，提供正确的size()
@@ -108,8 +108,12 @@ TEST(OriginalTests, SMMA_Manual) {
 // 参数化测试 - 测试不同周期的SMMA
 class SMMAParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -121,7 +125,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
     std::shared_ptr<LineBuffer> close_line_buffer_;
 };
@@ -208,14 +212,13 @@ TEST(OriginalTests, SMMA_CalculationLogic) {
 // SMMA平滑特性测试
 TEST(OriginalTests, SMMA_SmoothingCharacteristics) {
     // 创建包含噪声的数据
-    std::vector<double> noisy_prices;
+    std::vector<double> noisy_prices(100);
     std::mt19937 rng(42);
     std::uniform_real_distribution<double> noise_dist(-2.0, 2.0);
     
-    for (int i = 0; i < 100; ++i) {
+    for (size_t i = 0; i < noisy_prices.size(); ++i) {
         double trend = 100.0 + i * 0.5;  // 缓慢上升趋势
-        double noise = noise_dist(rng);   // 随机噪声
-        noisy_prices.push_back(trend + noise);
+        noisy_prices[i] = trend + noise_dist(rng);  // 随机噪声
     }
     
     auto noisy_line = std::make_shared<LineSeries>();
@@ -234,8 +237,9 @@ TEST(OriginalTests, SMMA_SmoothingCharacteristics) {
     auto smma = std::make_shared<SMMA>(std::static_pointer_cast<LineSeries>(noisy_line), 20);
     auto sma = std::make_shared<SMA>(std::static_pointer_cast<LineSeries>(noisy_line), 20);  // 比较对象
     
-    std::vector<double> smma_changes;
-    std::vector<double> sma_changes;
+    double smma_change_sum = 0.0;
+    double sma_change_sum = 0.0;
+    size_t change_count = 0;
     double prev_smma = 0.0, prev_sma = 0.0;
     bool has_prev = false;
     
@@ -250,8 +254,9 @@ TEST(OriginalTests, SMMA_SmoothingCharacteristics) {
         
         if (!std::isnan(current_smma) && !std::isnan(current_sma)) {
             if (has_prev && i > 0) {
-                smma_changes.push_back(std::abs(current_smma - prev_smma));
-                sma_changes.push_back(std::abs(current_sma - prev_sma));
+                smma_change_sum += std::abs(current_smma - prev_smma);
+                sma_change_sum += std::abs(current_sma - prev_sma);
+                ++change_count;
             }
             prev_smma = current_smma;
             prev_sma = current_sma;
@@ -260,9 +265,9 @@ TEST(OriginalTests, SMMA_SmoothingCharacteristics) {
     }
     
     // 比较SMMA和SMA的平滑性
-    if (!smma_changes.empty() && !sma_changes.empty()) {
-        double avg_smma_change = std::accumulate(smma_changes.begin(), smma_changes.end(), 0.0) / smma_changes.size();
-        double avg_sma_change = std::accumulate(sma_changes.begin(), sma_changes.end(), 0.0) / sma_changes.size();
+    if (change_count > 0) {
+        double avg_smma_change = smma_change_sum / change_count;
+        double avg_sma_change = sma_change_sum / change_count;
         
         std::cout << "Smoothing comparison:" << std::endl;
         std::cout << "Average SMMA change: " << avg_smma_change << std::endl;
@@ -335,7 +340,7 @@ TEST(OriginalTests, SMMA_TrendFollowing) {
 
 // SMMA与EMA比较测试
 TEST(OriginalTests, SMMA_vs_EMA_Comparison) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -492,10 +497,10 @@ TEST(OriginalTests, SMMA_LagCharacteristics) {
     // 分析滞后特性
     if (smma_values.size() >= 100) {
         // 计算价格和SMMA的相关性（简化版本）
-        double price_range = *std::max_element(price_values.begin(), price_values.end()) - 
-                            *std::min_element(price_values.begin(), price_values.end());
-        double smma_range = *std::max_element(smma_values.begin(), smma_values.end()) - 
-                           *std::min_element(smma_values.begin(), smma_values.end());
+        const auto price_values_minmax = std::minmax_element(price_values.begin(), price_values.end());
+        double price_range = *price_values_minmax.second - *price_values_minmax.first;
+        const auto smma_values_minmax = std::minmax_element(smma_values.begin(), smma_values.end());
+        double smma_range = *smma_values_minmax.second - *smma_values_minmax.first;
         
         std::cout << "Lag characteristics:" << std::endl;
         std::cout << "Price range: " << price_range << std::endl;
@@ -562,15 +567,7 @@ TEST(OriginalTests, SMMA_EdgeCases) {
 TEST(OriginalTests, SMMA_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     // Create test data in CSVDataReader format
     std::vector<CSVDataReader::OHLCVData> ohlcv_data;
@@ -591,12 +588,12 @@ TEST(OriginalTests, SMMA_Performance) {
     auto data_series = std::static_pointer_cast<DataSeries>(test_data_series);
     auto large_smma = std::make_shared<SMMA>(data_series, 50);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环
     large_smma->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "SMMA calculation for " << data_size << " points took " 
@@ -44,7 +44,7 @@ DEFINE_INDICATOR_TEST(SMMAEnvelope_Default, SMMAEnvelope, SMMAENVELOPE_EXPECTED_
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, SMMAEnvelope_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -101,8 +101,12 @@ TEST(OriginalTests, SMMAEnvelope_Manual) {
 // 参数化测试 - 测试不同参数的SMMAEnvelope
 class SMMAEnvelopeParameterizedTest : public ::testing::TestWithParam<std::tuple<int, double>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -118,7 +122,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
     std::shared_ptr<LineBuffer> close_line_buffer_;
 };
@@ -290,7 +294,7 @@ TEST(OriginalTests, SMMAEnvelope_ResponseSpeed) {
 
 // 与其他包络线比较测试
 TEST(OriginalTests, SMMAEnvelope_vs_OtherEnvelopes) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -352,7 +356,7 @@ TEST(OriginalTests, SMMAEnvelope_vs_OtherEnvelopes) {
 
 // SMMAEnvelope支撑阻力测试
 TEST(OriginalTests, SMMAEnvelope_SupportResistance) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -530,7 +534,7 @@ TEST(OriginalTests, SMMAEnvelope_SmoothingCharacteristics) {
 
 // SMMAEnvelope价格通道测试
 TEST(OriginalTests, SMMAEnvelope_PriceChannel) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -630,14 +634,7 @@ TEST(OriginalTests, SMMAEnvelope_EdgeCases) {
 TEST(OriginalTests, SMMAEnvelope_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_data_line = std::make_shared<LineSeries>();
 
@@ -648,21 +645,18 @@ TEST(OriginalTests, SMMAEnvelope_Performance) {
     
 
 
-    // Use set for the first value, then append the rest
+    // Load the whole series in one copy
     if (!large_data.empty()) {
-        large_data_line_buffer->set(0, large_data[0]);
-        for (size_t i = 1; i < large_data.size(); ++i) {
-            large_data_line_buffer->append(large_data[i]);
-        }
+        load_line_buffer(*large_data_line_buffer, large_data);
     }
     
     auto large_smmaenv = std::make_shared<SMMAEnvelope>(large_data_line, 50, 2.5);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环（大数据集性能测试）
     large_smmaenv->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "SMMAEnvelope calculation for " << data_size << " points took " 
@@ -33,12 +33,26 @@ const std::vector<std::vector<std::string>> STOCHASTIC_EXPECTED_VALUES = {
 
 const int STOCHASTIC_MIN_PERIOD = 18;
 
+// 默认参数(14, 3)的Stochastic只读测试共用一次构建和计算
+std::shared_ptr<Stochastic> default_stochastic() {
+    static const std::shared_ptr<Stochastic> stochastic = [] {
+        const auto columns = getdata_columns(0);
+        auto result = std::make_shared<Stochastic>(make_line_series(columns.high, "high"),
+                                                   make_line_series(columns.low, "low"),
+                                                   make_line_series(columns.close, "close"),
+                                                   14, 3);
+        result->calculate();
+        return result;
+    }();
+    return stochastic;
+}
+
 } // anonymous namespace
 
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, Stochastic_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列
@@ -95,40 +109,31 @@ TEST(OriginalTests, Stochastic_Manual) {
     auto d_buffer = std::dynamic_pointer_cast<LineBuffer>(d_line);
     
     if (k_buffer && d_buffer) {
-        std::cout << "K buffer size: " << k_buffer->array().size() << std::endl;
-        std::cout << "D buffer size: " << d_buffer->array().size() << std::endl;
+        const auto k_values = k_buffer->array();
+        const auto d_values = d_buffer->array();
+        std::cout << "K buffer size: " << k_values.size() << std::endl;
+        std::cout << "D buffer size: " << d_values.size() << std::endl;
         
-        if (!k_buffer->array().empty()) {
-            std::cout << "Last K value: " << k_buffer->array().back() << std::endl;
+        if (!k_values.empty()) {
+            std::cout << "Last K value: " << k_values.back() << std::endl;
             std::cout << "First few K values: ";
-            for (size_t i = 0; i < std::min(5UL, k_buffer->array().size()); ++i) {
-                std::cout << k_buffer->array()[i] << " ";
+            for (size_t i = 0; i < std::min(5UL, k_values.size()); ++i) {
+                std::cout << k_values[i] << " ";
             }
             std::cout << std::endl;
         }
-        if (!d_buffer->array().empty()) {
-            std::cout << "Last D value: " << d_buffer->array().back() << std::endl;
+        if (!d_values.empty()) {
+            std::cout << "Last D value: " << d_values.back() << std::endl;
             std::cout << "First few D values: ";
-            for (size_t i = 0; i < std::min(5UL, d_buffer->array().size()); ++i) {
-                std::cout << d_buffer->array()[i] << " ";
+            for (size_t i = 0; i < std::min(5UL, d_values.size()); ++i) {
+                std::cout << d_values[i] << " ";
             }
             std::cout << std::endl;
         }
         
         // Check if all values are NaN
-        bool all_k_nan = true, all_d_nan = true;
-        for (const auto& val : k_buffer->array()) {
-            if (!std::isnan(val)) {
-                all_k_nan = false;
-                break;
-            }
-        }
-        for (const auto& val : d_buffer->array()) {
-            if (!std::isnan(val)) {
-                all_d_nan = false;
-                break;
-            }
-        }
+        bool all_k_nan = count_valid(k_values) == 0;
+        bool all_d_nan = count_valid(d_values) == 0;
         std::cout << "All K values are NaN: " << (all_k_nan ? "YES" : "NO") << std::endl;
         std::cout << "All D values are NaN: " << (all_d_nan ? "YES" : "NO") << std::endl;
     } else {
@@ -180,39 +185,7 @@ TEST(OriginalTests, Stochastic_Manual) {
 
 // Stochastic范围验证测试
 TEST(OriginalTests, Stochastic_RangeValidation) {
-    auto csv_data = getdata(0);
-    
-    auto high_line_series = std::make_shared<LineSeries>();
-    high_line_series->lines->add_line(std::make_shared<LineBuffer>());
-    high_line_series->lines->add_alias("high", 0);
-    
-    auto low_line_series = std::make_shared<LineSeries>();
-    low_line_series->lines->add_line(std::make_shared<LineBuffer>());
-    low_line_series->lines->add_alias("low", 0);
-    
-    auto close_lineseries = std::make_shared<LineSeries>();
-    close_lineseries->lines->add_line(std::make_shared<LineBuffer>());
-    close_lineseries->lines->add_alias("close", 0);
-    
-    auto high_buffer = std::dynamic_pointer_cast<LineBuffer>(high_line_series->lines->getline(0));
-    auto low_buffer = std::dynamic_pointer_cast<LineBuffer>(low_line_series->lines->getline(0));
-    auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_lineseries->lines->getline(0));
-    
-    if (high_buffer && low_buffer && close_buffer) {
-        high_buffer->set(0, csv_data[0].high);
-        low_buffer->set(0, csv_data[0].low);
-        close_buffer->set(0, csv_data[0].close);
-    for (size_t i = 1; i < csv_data.size(); ++i) {
-            high_buffer->append(csv_data[i].high);
-            low_buffer->append(csv_data[i].low);
-            close_buffer->append(csv_data[i].close);
-        }
-    }
-    
-    auto stochastic = std::make_shared<Stochastic>(high_line_series, low_line_series, close_lineseries, 14, 3);
-    
-    // 计算并验证范围
-    stochastic->calculate();
+    auto stochastic = default_stochastic();
     
     double percent_k = stochastic->getPercentK(0);
     double percent_d = stochastic->getPercentD(0);
@@ -233,8 +206,12 @@ TEST(OriginalTests, Stochastic_RangeValidation) {
 // 参数化测试 - 测试不同参数的Stochastic
 class StochasticParameterizedTest : public ::testing::TestWithParam<std::tuple<int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         high_line = std::make_shared<LineSeries>();
@@ -265,7 +242,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> high_line;
     std::shared_ptr<LineSeries> low_line;
     std::shared_ptr<LineSeries> close_line;
@@ -317,43 +294,12 @@ INSTANTIATE_TEST_SUITE_P(
 
 // 超买超卖测试
 TEST(OriginalTests, Stochastic_OverboughtOversold) {
-    auto csv_data = getdata(0);
-    auto high_line_series = std::make_shared<LineSeries>();
-    high_line_series->lines->add_line(std::make_shared<LineBuffer>());
-    high_line_series->lines->add_alias("high", 0);
-    
-    auto low_line_series = std::make_shared<LineSeries>();
-    low_line_series->lines->add_line(std::make_shared<LineBuffer>());
-    low_line_series->lines->add_alias("low", 0);
-    
-    auto close_lineseries = std::make_shared<LineSeries>();
-    close_lineseries->lines->add_line(std::make_shared<LineBuffer>());
-    close_lineseries->lines->add_alias("close", 0);
-    
-    auto high_buffer = std::dynamic_pointer_cast<LineBuffer>(high_line_series->lines->getline(0));
-    auto low_buffer = std::dynamic_pointer_cast<LineBuffer>(low_line_series->lines->getline(0));
-    auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_lineseries->lines->getline(0));
-    
-    if (high_buffer && low_buffer && close_buffer) {
-        high_buffer->set(0, csv_data[0].high);
-        low_buffer->set(0, csv_data[0].low);
-        close_buffer->set(0, csv_data[0].close);
-    for (size_t i = 1; i < csv_data.size(); ++i) {
-            high_buffer->append(csv_data[i].high);
-            low_buffer->append(csv_data[i].low);
-            close_buffer->append(csv_data[i].close);
-        }
-    }
-    
-    auto stochastic = std::make_shared<Stochastic>(high_line_series, low_line_series, close_lineseries, 14, 3);
+    auto stochastic = default_stochastic();
     
     int overbought_count = 0;
     int oversold_count = 0;
     int normal_count = 0;
     
-    // 统计超买超卖情况
-    stochastic->calculate();
-    
     double k_value = stochastic->getPercentK(0);
     double d_value = stochastic->getPercentD(0);
     
@@ -380,42 +326,11 @@ TEST(OriginalTests, Stochastic_OverboughtOversold) {
 
 // 平滑性测试 - %D应该比%K更平滑
 TEST(OriginalTests, Stochastic_Smoothness) {
-    auto csv_data = getdata(0);
-    auto high_line_series = std::make_shared<LineSeries>();
-    high_line_series->lines->add_line(std::make_shared<LineBuffer>());
-    high_line_series->lines->add_alias("high", 0);
-    
-    auto low_line_series = std::make_shared<LineSeries>();
-    low_line_series->lines->add_line(std::make_shared<LineBuffer>());
-    low_line_series->lines->add_alias("low", 0);
-    
-    auto close_lineseries = std::make_shared<LineSeries>();
-    close_lineseries->lines->add_line(std::make_shared<LineBuffer>());
-    close_lineseries->lines->add_alias("close", 0);
-    
-    auto high_buffer = std::dynamic_pointer_cast<LineBuffer>(high_line_series->lines->getline(0));
-    auto low_buffer = std::dynamic_pointer_cast<LineBuffer>(low_line_series->lines->getline(0));
-    auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_lineseries->lines->getline(0));
-    
-    if (high_buffer && low_buffer && close_buffer) {
-        high_buffer->set(0, csv_data[0].high);
-        low_buffer->set(0, csv_data[0].low);
-        close_buffer->set(0, csv_data[0].close);
-    for (size_t i = 1; i < csv_data.size(); ++i) {
-            high_buffer->append(csv_data[i].high);
-            low_buffer->append(csv_data[i].low);
-            close_buffer->append(csv_data[i].close);
-        }
-    }
-    
-    auto stochastic = std::make_shared<Stochastic>(high_line_series, low_line_series, close_lineseries, 14, 3);
+    auto stochastic = default_stochastic();
     
     std::vector<double> k_values;
     std::vector<double> d_values;
     
-    // 收集所有有效值
-    stochastic->calculate();
-    
     double k_value = stochastic->getPercentK(0);
     double d_value = stochastic->getPercentD(0);
     
@@ -45,7 +45,7 @@ DEFINE_INDICATOR_TEST(StochasticFull_Default, StochasticFull, STOCHASTICFULL_EXP
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, StochasticFull_Manual) {
     // 加载测试数据 - 使用SimpleTestDataSeries避免数据污染
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建完整的DataSeries，使用SimpleTestDataSeries结构
@@ -112,15 +112,19 @@ TEST(OriginalTests, StochasticFull_Manual) {
 // 参数化测试 - 测试不同参数的StochasticFull
 class StochasticFullParameterizedTest : public ::testing::TestWithParam<std::tuple<int, int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         // Use SimpleTestDataSeries for correct DataSeries structure
         data_source = std::make_shared<SimpleTestDataSeries>(csv_data_);
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<SimpleTestDataSeries> data_source;
 };
 
@@ -176,7 +180,7 @@ INSTANTIATE_TEST_SUITE_P(
 // StochasticFull计算逻辑验证测试
 TEST(OriginalTests, StochasticFull_CalculationLogic) {
     // Use real CSV data for proper testing
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     auto data_source = std::make_shared<SimpleTestDataSeries>(csv_data);
@@ -220,7 +224,7 @@ TEST(OriginalTests, StochasticFull_CalculationLogic) {
 
 // StochasticFull超买超卖信号测试
 TEST(OriginalTests, StochasticFull_OverboughtOversold) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     auto data_source = std::make_shared<SimpleTestDataSeries>(csv_data);
@@ -267,7 +271,7 @@ TEST(OriginalTests, StochasticFull_OverboughtOversold) {
 
 // StochasticFull交叉信号测试
 TEST(OriginalTests, StochasticFull_CrossoverSignals) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     auto data_source = std::make_shared<SimpleTestDataSeries>(csv_data);
@@ -303,7 +307,7 @@ TEST(OriginalTests, StochasticFull_CrossoverSignals) {
 
 // StochasticFull平滑特性测试
 TEST(OriginalTests, StochasticFull_SmoothingCharacteristics) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     auto data_source = std::make_shared<SimpleTestDataSeries>(csv_data);
@@ -330,7 +334,7 @@ TEST(OriginalTests, StochasticFull_SmoothingCharacteristics) {
 // StochasticFull趋势识别测试
 TEST(OriginalTests, StochasticFull_TrendIdentification) {
     // Use real CSV data for trend analysis
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     auto data_source = std::make_shared<SimpleTestDataSeries>(csv_data);
@@ -346,7 +350,7 @@ TEST(OriginalTests, StochasticFull_TrendIdentification) {
 // 边界条件测试
 TEST(OriginalTests, StochasticFull_EdgeCases) {
     // Use real CSV data for edge case testing
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     auto data_source = std::make_shared<SimpleTestDataSeries>(csv_data);
@@ -362,7 +366,7 @@ TEST(OriginalTests, StochasticFull_EdgeCases) {
 // 性能测试
 TEST(OriginalTests, StochasticFull_Performance) {
     // Use real CSV data for performance testing
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     auto data_source = std::make_shared<SimpleTestDataSeries>(csv_data);
@@ -370,9 +374,9 @@ TEST(OriginalTests, StochasticFull_Performance) {
     auto stochfull = std::make_shared<StochasticFull>(lineseries_ptr);
     
     // Measure performance
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     stochfull->calculate();
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     
     auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end_time - start_time);
     std::cout << "StochasticFull calculation took: " << duration.count() << " microseconds" << std::endl;
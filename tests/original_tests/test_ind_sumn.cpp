@@ -44,7 +44,7 @@ DEFINE_INDICATOR_TEST(SumN_Default, SumN, SUMN_EXPECTED_VALUES, SUMN_MIN_PERIOD)
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, SumN_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列
@@ -112,26 +112,19 @@ TEST(OriginalTests, SumN_Manual) {
 // 参数化测试 - 测试不同周期的SumN
 class SumNParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
+    static void SetUpTestSuite() {
+        // 收盘价序列和前缀和在整个参数化套件中只准备一次
+        closes_ = getdata_columns(0).close;
+        prefix_ = prefix_sums(closes_);
+    }
+    
     void SetUp() override {
-        csv_data_ = getdata(0);
-        ASSERT_FALSE(csv_data_.empty());
-        
-        close_line_series_ = std::make_shared<LineSeries>();
-        close_line_series_->lines->add_line(std::make_shared<LineBuffer>());
-        close_line_series_->lines->add_alias("close", 0);
-        
-        // 逐步添加数据到线缓冲区  
-        auto close_buffer = std::dynamic_pointer_cast<LineBuffer>(close_line_series_->lines->getline(0));
-        if (close_buffer) {
-            // Set the first data point to replace the initial NaN, then append the rest
-            close_buffer->set(0, csv_data_[0].close);
-            for (size_t i = 1; i < csv_data_.size(); ++i) {
-                close_buffer->append(csv_data_[i].close);
-            }
-        }
+        ASSERT_FALSE(closes_.empty());
+        close_line_series_ = make_close_series(closes_);
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<double> closes_;
+    static inline std::vector<long double> prefix_;  // 各周期共用的前缀和
     std::shared_ptr<LineSeries> close_line_series_;
 };
 
@@ -147,12 +140,19 @@ TEST_P(SumNParameterizedTest, DifferentPeriods) {
         << "SumN minimum period should equal period parameter";
     
     // 验证最后的值
-    if (csv_data_.size() >= static_cast<size_t>(period)) {
+    if (closes_.size() >= static_cast<size_t>(period)) {
         double last_value = sumn->get(0);
         EXPECT_FALSE(std::isnan(last_value)) << "Last SumN value should not be NaN";
         EXPECT_TRUE(std::isfinite(last_value)) << "Last SumN value should be finite";
         EXPECT_GT(last_value, 0.0) << "SumN should be positive for positive prices";
     }
+    
+    // 用前缀和参考实现验证整个序列
+    // 直接读取输出缓冲区, 绕过get()中负索引的偏移约定
+    auto sumn_buffer = std::dynamic_pointer_cast<LineBuffer>(sumn->lines->getline(0));
+    ASSERT_TRUE(sumn_buffer);
+    ASSERT_EQ(sumn_buffer->data_size(), closes_.size());
+    EXPECT_TRUE(AllClose(sumn_buffer->data_ptr(), sumn_buffer->data_size(), reference_sumn(prefix_, period), 1e-9));
 }
 
 // 测试不同的SumN周期
@@ -457,7 +457,7 @@ TEST(OriginalTests, SumN_EdgeCases) {
 
 // 与SMA关系测试
 TEST(OriginalTests, SumN_vs_SMA_Relationship) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line_series = std::make_shared<LineSeries>();
     close_line_series->lines->add_line(std::make_shared<LineBuffer>());
     close_line_series->lines->add_alias("close", 0);
@@ -497,48 +497,31 @@ TEST(OriginalTests, SumN_vs_SMA_Relationship) {
 TEST(OriginalTests, SumN_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line_series = std::make_shared<LineSeries>();
     large_line_series->lines->add_line(std::make_shared<LineBuffer>());
     large_line_series->lines->add_alias("large", 0);
     
-    // 逐步添加数据到线缓冲区  
+    // 一次性载入数据到线缓冲区
     auto large_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line_series->lines->getline(0));
     if (large_buffer) {
-        // Set the first data point to replace the initial NaN, then append the rest
-        large_buffer->set(0, large_data[0]);
-        for (size_t i = 1; i < large_data.size(); ++i) {
-            large_buffer->append(large_data[i]);
-        }
+        load_line_buffer(*large_buffer, large_data);
     }
     
-    auto large_sumn = std::make_shared<SumN>(std::static_pointer_cast<LineSeries>(large_line_series), 100);
-    
-    auto start_time = std::chrono::high_resolution_clock::now();
-    
-    // 计算
-    large_sumn->calculate();
-    
-    auto end_time = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
+    // 预热一次后取5次运行中的最快值
+    auto bench = benchmark_indicator([&] {
+        return std::make_shared<SumN>(std::static_pointer_cast<LineSeries>(large_line_series), 100);
+    });
     
-    std::cout << "SumN calculation for " << data_size << " points took " 
-              << duration.count() << " ms" << std::endl;
+    std::cout << "SumN calculation for " << data_size << " points took (best of 5) " 
+              << bench.best.count() / 1000 << " us" << std::endl;
     
     // 验证最终结果是有效的
-    double final_result = large_sumn->get(0);
+    double final_result = bench.indicator->get(0);
     EXPECT_FALSE(std::isnan(final_result)) << "Final result should not be NaN";
     EXPECT_TRUE(std::isfinite(final_result)) << "Final result should be finite";
     
     // 性能要求：10K数据点应该在合理时间内完成
-    EXPECT_LT(duration.count(), 1000) << "Performance test: should complete within 1 second";
+    EXPECT_LT(bench.best, std::chrono::seconds(1)) << "Performance test: should complete within 1 second";
 }
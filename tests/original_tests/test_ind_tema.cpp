@@ -43,7 +43,7 @@ DEFINE_INDICATOR_TEST(TEMA_Default, TEMA, TEMA_EXPECTED_VALUES, TEMA_MIN_PERIOD)
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, TEMA_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列
@@ -113,8 +113,12 @@ TEST(OriginalTests, TEMA_Manual) {
 // 参数化测试 - 测试不同周期的TEMA
 class TEMAParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_series_ = std::make_shared<LineSeries>();
@@ -130,7 +134,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_series_;
 };
 
@@ -162,7 +166,7 @@ INSTANTIATE_TEST_SUITE_P(
 
 // TEMA响应性测试 - TEMA应该比DEMA和EMA响应更快
 TEST(OriginalTests, TEMA_vs_Others_Responsiveness) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line_tema = std::make_shared<LineSeries>();
     close_line_tema->lines->add_line(std::make_shared<LineBuffer>());
     close_line_tema->lines->add_alias("close", 0);
@@ -196,9 +200,10 @@ TEST(OriginalTests, TEMA_vs_Others_Responsiveness) {
     auto dema = std::make_shared<DEMA>(close_line_dema, period);
     auto ema = std::make_shared<EMA>(close_line_ema, period);
     
-    std::vector<double> tema_changes;
-    std::vector<double> dema_changes;
-    std::vector<double> ema_changes;
+    double tema_change_sum = 0.0;
+    double dema_change_sum = 0.0;
+    double ema_change_sum = 0.0;
+    size_t change_count = 0;
     double prev_tema = 0.0, prev_dema = 0.0, prev_ema = 0.0;
     
     // 计算并记录变化 - 修复性能：O(n²) -> O(n)
@@ -214,9 +219,10 @@ TEST(OriginalTests, TEMA_vs_Others_Responsiveness) {
     // 检查最终值的有效性
     if (csv_data.size() > 3 * period && !std::isnan(current_tema) && !std::isnan(current_dema) && !std::isnan(current_ema)) {
         if (prev_tema != 0.0 && prev_dema != 0.0 && prev_ema != 0.0) {
-            tema_changes.push_back(std::abs(current_tema - prev_tema));
-            dema_changes.push_back(std::abs(current_dema - prev_dema));
-            ema_changes.push_back(std::abs(current_ema - prev_ema));
+            tema_change_sum += std::abs(current_tema - prev_tema);
+            dema_change_sum += std::abs(current_dema - prev_dema);
+            ema_change_sum += std::abs(current_ema - prev_ema);
+            ++change_count;
         }
         prev_tema = current_tema;
         prev_dema = current_dema;
@@ -224,10 +230,10 @@ TEST(OriginalTests, TEMA_vs_Others_Responsiveness) {
     }
     
     // 计算平均变化
-    if (!tema_changes.empty() && !dema_changes.empty() && !ema_changes.empty()) {
-        double avg_tema_change = std::accumulate(tema_changes.begin(), tema_changes.end(), 0.0) / tema_changes.size();
-        double avg_dema_change = std::accumulate(dema_changes.begin(), dema_changes.end(), 0.0) / dema_changes.size();
-        double avg_ema_change = std::accumulate(ema_changes.begin(), ema_changes.end(), 0.0) / ema_changes.size();
+    if (change_count > 0) {
+        double avg_tema_change = tema_change_sum / change_count;
+        double avg_dema_change = dema_change_sum / change_count;
+        double avg_ema_change = ema_change_sum / change_count;
         
         std::cout << "Average TEMA change: " << avg_tema_change << std::endl;
         std::cout << "Average DEMA change: " << avg_dema_change << std::endl;
@@ -367,44 +373,29 @@ TEST(OriginalTests, TEMA_Convergence) {
 TEST(OriginalTests, TEMA_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
     large_line->lines->add_line(std::make_shared<LineBuffer>());
     large_line->lines->add_alias("large", 0);
     auto large_line_buffer = std::dynamic_pointer_cast<LineBuffer>(large_line->lines->getline(0));
 
-    for (double price : large_data) {
-        large_line_buffer->append(price);
-    }
-    
-    auto large_tema = std::make_shared<TEMA>(large_line, 50);
-    
-    auto start_time = std::chrono::high_resolution_clock::now();
-    
-    // 修复性能：O(n²) -> O(n) - 单次计算替代循环
-    large_tema->calculate();
+    append_line_buffer(*large_line_buffer, large_data);
     
-    auto end_time = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
+    // 预热一次后取5次运行中的最快值
+    auto bench = benchmark_indicator([&] {
+        return std::make_shared<TEMA>(large_line, 50);
+    });
     
-    std::cout << "TEMA calculation for " << data_size << " points took " 
-              << duration.count() << " ms" << std::endl;
+    std::cout << "TEMA calculation for " << data_size << " points took (best of 5) " 
+              << bench.best.count() / 1000 << " us" << std::endl;
     
     // 验证最终结果是有效的
-    double final_result = large_tema->get(0);
+    double final_result = bench.indicator->get(0);
     EXPECT_FALSE(std::isnan(final_result)) << "Final result should not be NaN";
     EXPECT_GE(final_result, 50.0) << "Final result should be within expected range";
     EXPECT_LE(final_result, 150.0) << "Final result should be within expected range";
     
     // 性能要求：10K数据点应该在合理时间内完成
-    EXPECT_LT(duration.count(), 1000) << "Performance test: should complete within 1 second";
+    EXPECT_LT(bench.best, std::chrono::seconds(1)) << "Performance test: should complete within 1 second";
 }
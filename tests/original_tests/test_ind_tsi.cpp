@@ -39,7 +39,7 @@ DEFINE_INDICATOR_TEST(TSI_Default, TSI, TSI_EXPECTED_VALUES, TSI_MIN_PERIOD)
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, TSI_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列
@@ -109,7 +109,7 @@ TEST(OriginalTests, TSI_Manual) {
 
 // TSI范围验证测试
 TEST(OriginalTests, TSI_RangeValidation) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_lineseries = std::make_shared<LineSeries>();
     close_lineseries->lines->add_line(std::make_shared<LineBuffer>());
     close_lineseries->lines->add_alias("close", 0);
@@ -138,8 +138,12 @@ TEST(OriginalTests, TSI_RangeValidation) {
 // 参数化测试 - 测试不同参数的TSI
 class TSIParameterizedTest : public ::testing::TestWithParam<std::pair<int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line = std::make_shared<LineSeries>();
@@ -155,7 +159,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line;
 };
 
@@ -295,7 +299,7 @@ TEST(OriginalTests, TSI_TrendStrength) {
 
 // 零线穿越测试
 TEST(OriginalTests, TSI_ZeroCrossing) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
 
     close_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -345,7 +349,7 @@ TEST(OriginalTests, TSI_ZeroCrossing) {
 
 // 超买超卖水平测试
 TEST(OriginalTests, TSI_OverboughtOversold) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
 
     close_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -564,14 +568,7 @@ TEST(OriginalTests, TSI_EdgeCases) {
 TEST(OriginalTests, TSI_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_data_line = std::make_shared<LineSeries>();
 
@@ -582,17 +579,15 @@ TEST(OriginalTests, TSI_Performance) {
     
 
 
-    for (double price : large_data) {
-        large_data_line_buffer->append(price);
-    }
+    append_line_buffer(*large_data_line_buffer, large_data);
     
     auto large_tsi = std::make_shared<TSI>(large_data_line, 25, 13);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环
     large_tsi->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "TSI calculation for " << data_size << " points took " 
@@ -40,7 +40,7 @@ DEFINE_INDICATOR_TEST(UltimateOscillator_Default, UltimateOscillator, ULTOSC_EXP
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, UltimateOscillator_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建DataSeries包含所有OHLCV数据
@@ -130,7 +130,7 @@ TEST(OriginalTests, UltimateOscillator_Manual) {
 
 // UltimateOscillator范围验证测试
 TEST(OriginalTests, UltimateOscillator_RangeValidation) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建DataSeries
     auto data_source = std::make_shared<DataSeries>();
@@ -179,8 +179,12 @@ TEST(OriginalTests, UltimateOscillator_RangeValidation) {
 // 参数化测试 - 测试不同参数的UltimateOscillator
 class UltimateOscillatorParameterizedTest : public ::testing::TestWithParam<std::tuple<int, int, int>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         // 创建DataSeries
@@ -206,7 +210,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<DataSeries> data_source_;
     std::shared_ptr<LineBuffer> datetime_buffer_;
     std::shared_ptr<LineBuffer> open_buffer_;
@@ -316,7 +320,7 @@ TEST(OriginalTests, UltimateOscillator_CalculationLogic) {
 
 // 超买超卖信号测试
 TEST(OriginalTests, UltimateOscillator_OverboughtOversold) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建DataSeries包含所有OHLCV数据
     // DataSeries constructor already creates 7 lines in the correct order
@@ -385,7 +389,7 @@ TEST(OriginalTests, UltimateOscillator_OverboughtOversold) {
 
 // 趋势反转信号测试
 TEST(OriginalTests, UltimateOscillator_ReversalSignals) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建DataSeries包含所有OHLCV数据
     // DataSeries constructor already creates 7 lines in the correct order
@@ -474,7 +478,7 @@ TEST(OriginalTests, UltimateOscillator_ReversalSignals) {
 
 // 多时间框架验证测试
 TEST(OriginalTests, UltimateOscillator_MultiTimeframe) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建DataSeries包含所有OHLCV数据
     // DataSeries constructor already creates 7 lines in the correct order
@@ -608,25 +612,7 @@ TEST(OriginalTests, UltimateOscillator_EdgeCases) {
 TEST(OriginalTests, UltimateOscillator_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<CSVDataReader::OHLCVData> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> price_dist(50.0, 150.0);
-    std::uniform_real_distribution<double> range_dist(1.0, 5.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        CSVDataReader::OHLCVData bar;
-        bar.date = "2006-01-01";
-        bar.close = price_dist(rng);
-        double range = range_dist(rng);
-        bar.high = bar.close + range;
-        bar.low = bar.close - range;
-        bar.open = bar.close;
-        bar.volume = 1000;
-        bar.openinterest = 0;
-        
-        large_data.push_back(bar);
-    }
+    const auto large_data = random_bars(data_size);
     
     // 创建DataSeries包含所有OHLCV数据
     // DataSeries constructor already creates 7 lines in the correct order
@@ -654,11 +640,11 @@ TEST(OriginalTests, UltimateOscillator_Performance) {
     
     auto large_ultosc = std::make_shared<UltimateOscillator>(data_source, 7, 14, 28);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环
     large_ultosc->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "UltimateOscillator calculation for " << data_size << " points took " 
@@ -39,7 +39,7 @@ DEFINE_INDICATOR_TEST(UpMove_Default, UpMove, UPMOVE_EXPECTED_VALUES, UPMOVE_MIN
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, UpMove_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线 - 使用LineSeries+LineBuffer模式
@@ -270,7 +270,7 @@ TEST(OriginalTests, UpMove_MixedMovementTest) {
 
 // UpMove与真实市场数据测试
 TEST(OriginalTests, UpMove_RealMarketData) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     auto high_line = std::make_shared<LineSeries>();
     high_line->lines->add_line(std::make_shared<LineBuffer>());
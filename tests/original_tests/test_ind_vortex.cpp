@@ -42,7 +42,7 @@ DEFINE_INDICATOR_TEST(Vortex_Default, Vortex, VORTEX_EXPECTED_VALUES, VORTEX_MIN
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, Vortex_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据系列 - DataSeries构造函数已经创建了7条线
@@ -138,8 +138,12 @@ TEST(OriginalTests, Vortex_Manual) {
 // 参数化测试 - 测试不同周期的Vortex
 class VortexParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         // 创建数据系列
@@ -172,7 +176,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<DataSeries> data_source_;
     std::shared_ptr<LineBuffer> open_buffer_;
     std::shared_ptr<LineBuffer> high_buffer_;
@@ -282,7 +286,7 @@ TEST(OriginalTests, Vortex_CalculationLogic) {
 
 // 趋势识别测试
 TEST(OriginalTests, Vortex_TrendIdentification) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建数据系列 - DataSeries构造函数已经创建了7条线
     auto data_source = std::make_shared<DataSeries>();
@@ -351,7 +355,7 @@ TEST(OriginalTests, Vortex_TrendIdentification) {
 
 // 交叉信号测试
 TEST(OriginalTests, Vortex_CrossoverSignals) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建数据系列 - DataSeries构造函数已经创建了7条线
     auto data_source = std::make_shared<DataSeries>();
@@ -605,25 +609,7 @@ TEST(OriginalTests, Vortex_EdgeCases) {
 TEST(OriginalTests, Vortex_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<CSVDataReader::OHLCVData> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> price_dist(50.0, 150.0);
-    std::uniform_real_distribution<double> range_dist(1.0, 5.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        CSVDataReader::OHLCVData bar;
-        bar.date = "2006-01-01";
-        bar.close = price_dist(rng);
-        double range = range_dist(rng);
-        bar.high = bar.close + range;
-        bar.low = bar.close - range;
-        bar.open = bar.close;
-        bar.volume = 1000;
-        bar.openinterest = 0;
-        
-        large_data.push_back(bar);
-    }
+    const auto large_data = random_bars(data_size);
     
     // 创建数据系列 - DataSeries 构造函数已经创建了7条线
     auto data_source = std::make_shared<DataSeries>();
@@ -646,9 +632,9 @@ TEST(OriginalTests, Vortex_Performance) {
     
     auto vortex = std::make_shared<Vortex>(data_source, 14);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     vortex->calculate();
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "Vortex calculation for " << data_size << " points took " 
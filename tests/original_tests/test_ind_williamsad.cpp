@@ -94,7 +94,7 @@ TEST(OriginalTests, WilliamsAD_SimpleDebug) {
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, WilliamsAD_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建DataSeries用于OHLCV数据 - 自动创建7条线
@@ -308,7 +308,7 @@ TEST(OriginalTests, WilliamsAD_CalculationLogic) {
 
 // WilliamsAD累积特性测试
 TEST(OriginalTests, WilliamsAD_AccumulationCharacteristics) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建DataSeries用于OHLCV数据 - 自动创建7条线
     auto data_series = std::make_shared<DataSeries>();
@@ -507,7 +507,7 @@ TEST(OriginalTests, DISABLED_WilliamsAD_DistributionAccumulation) {
 /*
 // WilliamsAD与价格发散测试
 TEST(OriginalTests, DISABLED_WilliamsAD_PriceDivergence) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto high_line = std::make_shared<LineSeries>();
 
     high_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -750,10 +750,10 @@ TEST(OriginalTests, DISABLED_WilliamsAD_VolumeSensitivity) {
     
     // 比较成交量敏感性
     if (!low_vol_values.empty() && !high_vol_values.empty()) {
-        double low_vol_range = *std::max_element(low_vol_values.begin(), low_vol_values.end()) - 
-                               *std::min_element(low_vol_values.begin(), low_vol_values.end());
-        double high_vol_range = *std::max_element(high_vol_values.begin(), high_vol_values.end()) - 
-                                *std::min_element(high_vol_values.begin(), high_vol_values.end());
+        const auto low_vol_values_minmax = std::minmax_element(low_vol_values.begin(), low_vol_values.end());
+        double low_vol_range = *low_vol_values_minmax.second - *low_vol_values_minmax.first;
+        const auto high_vol_values_minmax = std::minmax_element(high_vol_values.begin(), high_vol_values.end());
+        double high_vol_range = *high_vol_values_minmax.second - *high_vol_values_minmax.first;
         
         std::cout << "Volume sensitivity analysis:" << std::endl;
         std::cout << "Low volume A/D range: " << low_vol_range << std::endl;
@@ -1003,7 +1003,7 @@ TEST(OriginalTests, DISABLED_WilliamsAD_Performance) {
     
     auto large_williamsad = std::make_shared<WilliamsAD>(large_high_series, large_low_series, large_close_series, large_volume_series);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     for (size_t i = 0; i < data_size; ++i) {
         large_williamsad->calculate();
         if (i < data_size - 1) {
@@ -1014,7 +1014,7 @@ TEST(OriginalTests, DISABLED_WilliamsAD_Performance) {
         }
     }
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "WilliamsAD calculation for " << data_size << " points took " 
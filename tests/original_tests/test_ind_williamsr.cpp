@@ -39,7 +39,7 @@ DEFINE_INDICATOR_TEST(WilliamsR_Default, WilliamsR, WILLIAMSR_EXPECTED_VALUES, W
 /* 注释掉手动测试，使用宏测试
 TEST(OriginalTests, WilliamsR_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据系列 - DataSeries already has 7 lines initialized
@@ -148,7 +148,7 @@ TEST(OriginalTests, WilliamsR_Manual) {
 
 // Williams %R范围验证测试
 TEST(OriginalTests, WilliamsR_RangeValidation) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     
     // 创建数据系列 - DataSeries already has 7 lines initialized
     auto data_source = std::make_shared<DataSeries>();
@@ -201,8 +201,12 @@ TEST(OriginalTests, WilliamsR_RangeValidation) {
 /* 参数化测试 - 测试不同周期的Williams %R
 class WilliamsRParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         // 创建数据系列 - DataSeries已经有7条线
@@ -238,7 +242,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<DataSeries> data_source_;
     std::shared_ptr<LineBuffer> open_buffer_;
     std::shared_ptr<LineBuffer> high_buffer_;
@@ -313,7 +317,7 @@ TEST_P(WilliamsRParameterizedTest, DifferentPeriods) {
 // 超买超卖测试 - 暂时禁用，需要修复流式模式
 TEST(OriginalTests, DISABLED_WilliamsR_OverboughtOversold) {
     // 使用SimpleTestDataSeries，它会正确设置数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto data_source = std::make_shared<SimpleTestDataSeries>(csv_data);
     
     auto williamsr = std::make_shared<WilliamsR>(std::static_pointer_cast<DataSeries>(data_source), 14);
@@ -543,7 +547,7 @@ TEST(OriginalTests, WilliamsR_EdgeCases) {
 // TODO: Uncomment when Stochastic indicator is implemented
 /*
 TEST(OriginalTests, WilliamsR_vs_Stochastic) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto high_line = std::make_shared<LineSeries>();
     high_line->lines->add_line(std::make_shared<LineBuffer>());
     high_line->lines->add_alias("high", 0);
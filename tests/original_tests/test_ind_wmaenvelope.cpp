@@ -48,7 +48,7 @@ DEFINE_INDICATOR_TEST(WMAEnvelope_Default, WMAEnvelope, WMAENVELOPE_EXPECTED_VAL
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, WMAEnvelope_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列
@@ -112,8 +112,12 @@ TEST(OriginalTests, WMAEnvelope_Manual) {
 // 参数化测试 - 测试不同参数的WMAEnvelope
 class WMAEnvelopeParameterizedTest : public ::testing::TestWithParam<std::tuple<int, double>> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_wrapper = std::make_shared<LineSeries>();
@@ -126,7 +130,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<backtrader::LineBuffer> close_line;
     std::shared_ptr<LineSeries> close_line_wrapper;
 };
@@ -303,7 +307,7 @@ TEST(OriginalTests, WMAEnvelope_ResponseSpeed) {
 
 // 与其他包络线比较测试
 TEST(OriginalTests, WMAEnvelope_vs_OtherEnvelopes) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
 
     close_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -365,7 +369,7 @@ TEST(OriginalTests, WMAEnvelope_vs_OtherEnvelopes) {
 
 // WMAEnvelope支撑阻力测试
 TEST(OriginalTests, WMAEnvelope_SupportResistance) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
 
     close_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -649,14 +653,7 @@ TEST(OriginalTests, WMAEnvelope_EdgeCases) {
 TEST(OriginalTests, WMAEnvelope_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_data_line = std::make_shared<LineSeries>();
 
@@ -667,17 +664,15 @@ TEST(OriginalTests, WMAEnvelope_Performance) {
     
 
 
-    for (double price : large_data) {
-        large_data_line_buffer->append(price);
-    }
+    append_line_buffer(*large_data_line_buffer, large_data);
     
     auto large_wmaenv = std::make_shared<WMAEnvelope>(large_data_line, 50, 2.5);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     // 修复性能：O(n²) -> O(n) - 单次计算替代循环（大数据集性能测试）
     large_wmaenv->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "WMAEnvelope calculation for " << data_size << " points took " 
@@ -40,7 +40,7 @@ DEFINE_INDICATOR_TEST(ZLEMA_Default, ZLEMA, ZLEMA_EXPECTED_VALUES, ZLEMA_MIN_PER
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, ZLEMA_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列
@@ -108,8 +108,12 @@ TEST(OriginalTests, ZLEMA_Manual) {
 // 参数化测试 - 测试不同周期的ZLEMA
 class ZLEMAParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -125,7 +129,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
 };
 
@@ -395,14 +399,13 @@ TEST(OriginalTests, ZLEMA_TrendTracking) {
 // 平滑性测试
 TEST(OriginalTests, ZLEMA_Smoothness) {
     // 创建包含噪声的数据
-    std::vector<double> noisy_prices;
+    std::vector<double> noisy_prices(100);
     std::mt19937 rng(42);
     std::uniform_real_distribution<double> noise_dist(-3.0, 3.0);
     
-    for (int i = 0; i < 100; ++i) {
+    for (size_t i = 0; i < noisy_prices.size(); ++i) {
         double trend = 100.0 + i * 0.3;  // 缓慢上升趋势
-        double noise = noise_dist(rng);   // 随机噪声
-        noisy_prices.push_back(trend + noise);
+        noisy_prices[i] = trend + noise_dist(rng);  // 随机噪声
     }
     
     auto noisy_line = std::make_shared<LineSeries>();
@@ -513,15 +516,7 @@ TEST(OriginalTests, ZLEMA_EdgeCases) {
 TEST(OriginalTests, ZLEMA_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
     large_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -530,30 +525,22 @@ TEST(OriginalTests, ZLEMA_Performance) {
     
 
     if (large_buffer) {
-        large_buffer->set(0, large_data[0]);
-        for (size_t i = 1; i < large_data.size(); ++i) {
-            large_buffer->append(large_data[i]);
-        }
+        load_line_buffer(*large_buffer, large_data);
     }
     
-    auto large_zlema = std::make_shared<ZLEMA>(large_line, 21);
-    
-    auto start_time = std::chrono::high_resolution_clock::now();
-    
-    // Calculate once for all data
-    large_zlema->calculate();
-    
-    auto end_time = std::chrono::high_resolution_clock::now();
-    auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
+    // 预热一次后取5次运行中的最快值
+    auto bench = benchmark_indicator([&] {
+        return std::make_shared<ZLEMA>(large_line, 21);
+    });
     
-    std::cout << "ZLEMA calculation for " << data_size << " points took " 
-              << duration.count() << " ms" << std::endl;
+    std::cout << "ZLEMA calculation for " << data_size << " points took (best of 5) " 
+              << bench.best.count() / 1000 << " us" << std::endl;
     
     // 验证最终结果是有效的
-    double final_result = large_zlema->get(0);
+    double final_result = bench.indicator->get(0);
     EXPECT_FALSE(std::isnan(final_result)) << "Final result should not be NaN";
     EXPECT_TRUE(std::isfinite(final_result)) << "Final result should be finite";
     
     // 性能要求：10K数据点应该在合理时间内完成
-    EXPECT_LT(duration.count(), 1000) << "Performance test: should complete within 1 second";
+    EXPECT_LT(bench.best, std::chrono::seconds(1)) << "Performance test: should complete within 1 second";
 }
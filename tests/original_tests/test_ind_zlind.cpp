@@ -43,7 +43,7 @@ DEFINE_INDICATOR_TEST(ZeroLagIndicator_Default, ZeroLagIndicator, ZEROLAGINDICAT
 // 手动测试函数，用于详细验证
 TEST(OriginalTests, ZeroLagIndicator_Manual) {
     // 加载测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     ASSERT_FALSE(csv_data.empty());
     
     // 创建数据线系列
@@ -106,8 +106,12 @@ TEST(OriginalTests, ZeroLagIndicator_Manual) {
 // 参数化测试 - 测试不同周期的ZeroLagIndicator
 class ZeroLagIndicatorParameterizedTest : public ::testing::TestWithParam<int> {
 protected:
-    void SetUp() override {
+    static void SetUpTestSuite() {
+        // 测试数据在整个参数化套件中只加载一次
         csv_data_ = getdata(0);
+    }
+    
+    void SetUp() override {
         ASSERT_FALSE(csv_data_.empty());
         
         close_line_ = std::make_shared<LineSeries>();
@@ -123,7 +127,7 @@ protected:
         }
     }
     
-    std::vector<CSVDataReader::OHLCVData> csv_data_;
+    static inline std::vector<CSVDataReader::OHLCVData> csv_data_;
     std::shared_ptr<LineSeries> close_line_;
 };
 
@@ -199,17 +203,9 @@ TEST(OriginalTests, ZeroLagIndicator_CalculationLogic) {
 // ZeroLagIndicator响应速度测试
 TEST(OriginalTests, ZeroLagIndicator_ResponseSpeed) {
     // 创建价格突然变化的数据来测试响应速度
-    std::vector<double> step_prices;
-    
-    // 第一阶段：稳定价格
-    for (int i = 0; i < 30; ++i) {
-        step_prices.push_back(100.0);
-    }
-    
-    // 第二阶段：价格跳跃
-    for (int i = 0; i < 30; ++i) {
-        step_prices.push_back(120.0);
-    }
+    // 前30根为稳定价格100, 后30根价格跳跃至120
+    std::vector<double> step_prices(60, 100.0);
+    std::fill(step_prices.begin() + 30, step_prices.end(), 120.0);
     
     auto step_line = std::make_shared<LineSeries>();
     step_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -276,7 +272,7 @@ TEST(OriginalTests, ZeroLagIndicator_ResponseSpeed) {
 
 // ZeroLagIndicator与EMA比较测试
 TEST(OriginalTests, ZeroLagIndicator_vs_EMA_Comparison) {
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<LineSeries>();
     close_line->lines->add_line(std::make_shared<LineBuffer>());
     close_line->lines->add_alias("close", 0);
@@ -344,9 +340,9 @@ TEST(OriginalTests, ZeroLagIndicator_vs_EMA_Comparison) {
 // ZeroLagIndicator趋势跟随能力测试
 TEST(OriginalTests, ZeroLagIndicator_TrendFollowing) {
     // 创建明确的趋势数据
-    std::vector<double> trend_prices;
+    std::vector<double> trend_prices(60);
     for (int i = 0; i < 60; ++i) {
-        trend_prices.push_back(100.0 + i * 0.8);  // 线性上升趋势
+        trend_prices[i] = 100.0 + i * 0.8;  // 线性上升趋势
     }
     
     auto trend_line = std::make_shared<LineSeries>();
@@ -402,14 +398,14 @@ TEST(OriginalTests, ZeroLagIndicator_TrendFollowing) {
 // ZeroLagIndicator噪声过滤测试
 TEST(OriginalTests, ZeroLagIndicator_NoiseFiltering) {
     // 创建包含噪声的数据
-    std::vector<double> noisy_prices;
+    std::vector<double> noisy_prices(100);
     std::mt19937 rng(42);
     std::uniform_real_distribution<double> noise_dist(-3.0, 3.0);
     
     for (int i = 0; i < 100; ++i) {
         double trend = 100.0 + i * 0.3;  // 缓慢上升趋势
         double noise = noise_dist(rng);   // 随机噪声
-        noisy_prices.push_back(trend + noise);
+        noisy_prices[i] = trend + noise;
     }
     
     auto noisy_line = std::make_shared<LineSeries>();
@@ -472,10 +468,10 @@ TEST(OriginalTests, ZeroLagIndicator_NoiseFiltering) {
 // ZeroLagIndicator滞后分析测试
 TEST(OriginalTests, ZeroLagIndicator_LagAnalysis) {
     // 创建正弦波数据来测试滞后
-    std::vector<double> sine_prices;
+    std::vector<double> sine_prices(200);
     for (int i = 0; i < 200; ++i) {
         double angle = i * M_PI / 25.0;  // 完整周期50个点
-        sine_prices.push_back(100.0 + 10.0 * std::sin(angle));
+        sine_prices[i] = 100.0 + 10.0 * std::sin(angle);
     }
     
     auto sine_line = std::make_shared<LineSeries>();
@@ -519,12 +515,12 @@ TEST(OriginalTests, ZeroLagIndicator_LagAnalysis) {
     // 分析滞后特性
     if (zlind_values.size() >= 100) {
         // 计算与原始价格的相关性（简化版本）
-        double price_range = *std::max_element(price_values.begin(), price_values.end()) - 
-                            *std::min_element(price_values.begin(), price_values.end());
-        double zlind_range = *std::max_element(zlind_values.begin(), zlind_values.end()) - 
-                           *std::min_element(zlind_values.begin(), zlind_values.end());
-        double sma_range = *std::max_element(sma_values.begin(), sma_values.end()) - 
-                          *std::min_element(sma_values.begin(), sma_values.end());
+        const auto price_values_minmax = std::minmax_element(price_values.begin(), price_values.end());
+        double price_range = *price_values_minmax.second - *price_values_minmax.first;
+        const auto zlind_values_minmax = std::minmax_element(zlind_values.begin(), zlind_values.end());
+        double zlind_range = *zlind_values_minmax.second - *zlind_values_minmax.first;
+        const auto sma_values_minmax = std::minmax_element(sma_values.begin(), sma_values.end());
+        double sma_range = *sma_values_minmax.second - *sma_values_minmax.first;
         
         std::cout << "Lag analysis:" << std::endl;
         std::cout << "Price range: " << price_range << std::endl;
@@ -596,15 +592,7 @@ TEST(OriginalTests, ZeroLagIndicator_EdgeCases) {
 TEST(OriginalTests, ZeroLagIndicator_Performance) {
     // 生成大量测试数据
     const size_t data_size = 10000;
-    std::vector<double> large_data;
-    large_data.reserve(data_size);
-    
-    std::mt19937 rng(42);
-    std::uniform_real_distribution<double> dist(50.0, 150.0);
-    
-    for (size_t i = 0; i < data_size; ++i) {
-        large_data.push_back(dist(rng));
-    }
+    const auto large_data = random_uniform(data_size);
     
     auto large_line = std::make_shared<LineSeries>();
     large_line->lines->add_line(std::make_shared<LineBuffer>());
@@ -613,20 +601,17 @@ TEST(OriginalTests, ZeroLagIndicator_Performance) {
     
 
     if (large_buffer) {
-        large_buffer->set(0, large_data[0]);
-        for (size_t i = 1; i < large_data.size(); ++i) {
-            large_buffer->append(large_data[i]);
-        }
+        load_line_buffer(*large_buffer, large_data);
     }
     
     auto large_zlind = std::make_shared<ZeroLagIndicator>(large_line, 50);
     
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // Calculate once for all data
     large_zlind->calculate();
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "ZeroLagIndicator calculation for " << data_size << " points took " 
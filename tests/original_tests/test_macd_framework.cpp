@@ -14,7 +14,7 @@ int main() {
     };
     
     // Load data
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     std::cout << "Loaded " << csv_data.size() << " data points" << std::endl;
     
     // Create data series using SimpleTestDataSeries
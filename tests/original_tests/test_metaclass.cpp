@@ -53,7 +53,6 @@ public:
     // 模拟frompackages功能
     virtual void loadFromPackages() {
         // 模拟从包中加载组件
-        std::cout << "Loading components from packages..." << std::endl;
     }
     
     const Params& getParams() const { return params_; }
@@ -93,7 +92,6 @@ public:
         SampleParamsHolder::loadFromPackages();
         
         // 添加子类特定的加载逻辑
-        std::cout << "Loading additional components for RunFrompackages..." << std::endl;
     }
 };
 
@@ -324,7 +322,7 @@ TEST(OriginalTests, MetaClass_IndicatorIntegration) {
     };
     
     // 创建测试数据
-    auto csv_data = getdata(0);
+    const auto& csv_data = getdata(0);
     auto close_line = std::make_shared<backtrader::DataSeries>();
     
     // 创建自定义指标
@@ -340,7 +338,7 @@ TEST(OriginalTests, MetaClass_IndicatorIntegration) {
 
 // 性能测试
 TEST(OriginalTests, MetaClass_Performance) {
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 创建大量对象来测试性能
     const int num_objects = 10000;
@@ -358,7 +356,7 @@ TEST(OriginalTests, MetaClass_Performance) {
         obj->loadFromPackages();
     }
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "MetaClass performance test: created and used " << num_objects 
@@ -61,7 +61,7 @@ private:
     std::shared_ptr<Order> order_id_;
     std::shared_ptr<backtrader::indicators::SMA> sma_;
     std::shared_ptr<backtrader::indicators::CrossOver> cross_;
-    std::chrono::high_resolution_clock::time_point start_time_;
+    std::chrono::steady_clock::time_point start_time_;
 
 public:
     struct Params {
@@ -98,11 +98,11 @@ public:
     void start() override {
         // 设置佣金参数
         broker_ptr()->setcommission(2.0, 1000.0, 10.0);  // commission, margin, mult
-        start_time_ = std::chrono::high_resolution_clock::now();
+        start_time_ = std::chrono::steady_clock::now();
     }
 
     void stop() override {
-        auto end_time = std::chrono::high_resolution_clock::now();
+        auto end_time = std::chrono::steady_clock::now();
         auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end_time - start_time_);
         
         double final_value = broker_ptr()->getvalue();
@@ -370,47 +370,42 @@ TEST(OriginalTests, StrategyOptimized_BasicOptimization) {
     }
 }
 
-// 测试不同运行模式的组合
-TEST(OriginalTests, StrategyOptimized_DifferentModes) {
-    std::vector<std::tuple<bool, bool, int, std::string>> test_modes = {
-        {true, true, 1, "runonce=T,preload=T,exbar=T"},
-        {true, true, 0, "runonce=T,preload=T,exbar=F"},
-        {true, false, 1, "runonce=T,preload=F,exbar=T"},
-        {true, false, 0, "runonce=T,preload=F,exbar=F"},
-        {false, true, 1, "runonce=F,preload=T,exbar=T"},
-        {false, true, 0, "runonce=F,preload=T,exbar=F"},
-        {false, false, 1, "runonce=F,preload=F,exbar=T"},
-        {false, false, 0, "runonce=F,preload=F,exbar=F"}
-    };
-    
-    for (const auto& mode : test_modes) {
-        bool runonce = std::get<0>(mode);
-        bool preload = std::get<1>(mode);
-        int exbar = std::get<2>(mode);
-        std::string description = std::get<3>(mode);
+// 测试不同运行模式的组合 - 每种模式是独立的测试用例
+class StrategyOptimizedModeTest : public ::testing::TestWithParam<std::tuple<bool, bool, int>> {};
 
-        std::cout << "Testing mode: " << description << std::endl;
+TEST_P(StrategyOptimizedModeTest, DifferentModes) {
+    auto [runonce, preload, exbar] = GetParam();
+    std::string description = std::string("runonce=") + (runonce ? "T" : "F") +
+                              ",preload=" + (preload ? "T" : "F") +
+                              ",exbar=" + (exbar ? "T" : "F");
 
-        runOptimizationTest(runonce, preload, exbar, false);
+    runOptimizationTest(runonce, preload, exbar, false);
 
-        // 每种模式都应该产生相同的结果
-        EXPECT_EQ(g_check_values.size(), EXPECTED_VALUES.size()) 
-            << "Mode " << description << " should have correct number of results";
+    // 每种模式都应该产生相同的结果
+    EXPECT_EQ(g_check_values.size(), EXPECTED_VALUES.size()) 
+        << "Mode " << description << " should have correct number of results";
 
-        // Different execution modes may produce different results due to timing differences
-        // This is expected behavior - just verify that we have results
-        EXPECT_GT(g_check_values.size(), 0) 
-            << "Mode " << description << " should have results";
-        
-        // Verify results are reasonable (not zero or negative)
-        if (!g_check_values.empty()) {
-            double first_value = std::stod(g_check_values[0]);
-            EXPECT_GT(first_value, 1000.0) 
-                << "Mode " << description << " should have reasonable portfolio values";
-        }
-    }
+    // Different execution modes may produce different results due to timing differences
+    // This is expected behavior - just verify that we have results
+    ASSERT_GT(g_check_values.size(), 0) 
+        << "Mode " << description << " should have results";
+    
+    // Verify results are reasonable (not zero or negative)
+    double first_value = std::stod(g_check_values[0]);
+    EXPECT_GT(first_value, 1000.0) 
+        << "Mode " << description << " should have reasonable portfolio values";
 }
 
+INSTANTIATE_TEST_SUITE_P(
+    AllModes,
+    StrategyOptimizedModeTest,
+    ::testing::Combine(
+        ::testing::Bool(),
+        ::testing::Bool(),
+        ::testing::Values(1, 0)
+    )
+);
+
 // 测试单个周期的策略运行
 TEST(OriginalTests, StrategyOptimized_SinglePeriod) {
     auto cerebro = std::make_unique<backtrader::Cerebro>();
@@ -481,7 +476,7 @@ TEST(OriginalTests, StrategyOptimized_ParameterRange) {
 
 // 测试策略性能
 TEST(OriginalTests, StrategyOptimized_Performance) {
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
 
     // 运行多个周期的优化
     std::vector<int> periods = {10, 15, 20, 25, 30};
@@ -501,7 +496,7 @@ TEST(OriginalTests, StrategyOptimized_Performance) {
         auto results = cerebro->run();
     }
 
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
 
     std::cout << "Strategy optimization performance test: " << periods.size() 
@@ -610,8 +605,9 @@ TEST(OriginalTests, StrategyOptimized_Statistics) {
     }
 
     if (!values.empty()) {
-        double min_val = *std::min_element(values.begin(), values.end());
-        double max_val = *std::max_element(values.begin(), values.end());
+        const auto values_minmax = std::minmax_element(values.begin(), values.end());
+        double min_val = *values_minmax.first;
+        double max_val = *values_minmax.second;
         double sum = std::accumulate(values.begin(), values.end(), 0.0);
         double avg = sum / values.size();
 
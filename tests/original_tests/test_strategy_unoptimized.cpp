@@ -57,7 +57,7 @@ private:
     std::shared_ptr<Order> order_id_;
     std::shared_ptr<SMA> sma_;
     std::shared_ptr<CrossOver> cross_;
-    std::chrono::high_resolution_clock::time_point start_time_;
+    std::chrono::steady_clock::time_point start_time_;
 
 public:
     // 记录买卖价格的向量
@@ -201,7 +201,7 @@ public:
             std::cout << "*** Strategy minperiod: " << _minperiod() << std::endl;
         }
 
-        start_time_ = std::chrono::high_resolution_clock::now();
+        start_time_ = std::chrono::steady_clock::now();
 
         // 初始化记录向量
         buy_create_.clear();
@@ -211,7 +211,7 @@ public:
     }
 
     void stop() override {
-        auto end_time = std::chrono::high_resolution_clock::now();
+        auto end_time = std::chrono::steady_clock::now();
         auto duration = std::chrono::duration_cast<std::chrono::microseconds>(end_time - start_time_);
         
         // Debug: Print last close price at stop
@@ -705,11 +705,11 @@ TEST(OriginalTests, StrategyUnoptimized_ModeComparison) {
 
 // 测试策略时间统计
 TEST(OriginalTests, StrategyUnoptimized_Timing) {
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     auto strategy = runStrategyTest(true, false);
     
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
 
     std::cout << "Strategy execution time: " << duration.count() << " ms" << std::endl;
@@ -771,7 +771,7 @@ TEST(OriginalTests, StrategyUnoptimized_OrderNotification) {
 
 // 性能基准测试
 TEST(OriginalTests, StrategyUnoptimized_Performance) {
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     // 运行多次策略测试
     const int num_runs = 10;
@@ -781,7 +781,7 @@ TEST(OriginalTests, StrategyUnoptimized_Performance) {
         // 验证每次运行的基本结果
         EXPECT_GT(strategy->buy_create_.size(), 0) << "Run " << i << " should have buy signals";
     }
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "Strategy performance test: " << num_runs 
@@ -396,7 +396,7 @@ TEST(OriginalTests, Trade_Statistics) {
 
 // 性能测试
 TEST(OriginalTests, Trade_Performance) {
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
     
     auto fakeData = std::make_shared<FakeData>();
     auto commInfo = std::make_shared<FakeCommInfo>();
@@ -418,7 +418,7 @@ TEST(OriginalTests, Trade_Performance) {
         
         trades.push_back(std::move(tr));
     }
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
     
     std::cout << "Trade performance test: created and processed " << num_trades 
@@ -351,7 +351,7 @@ TEST(OriginalTests, Writer_MainMode) {
 
 // 测试写入器性能
 TEST(OriginalTests, Writer_Performance) {
-    auto start_time = std::chrono::high_resolution_clock::now();
+    auto start_time = std::chrono::steady_clock::now();
 
     // 运行多次写入器测试
     const int num_runs = 5;
@@ -366,7 +366,7 @@ TEST(OriginalTests, Writer_Performance) {
         const auto& output = string_writer->getOutput();
         EXPECT_GT(output.size(), 0) << "Run " << i << " should have output";
     }
-    auto end_time = std::chrono::high_resolution_clock::now();
+    auto end_time = std::chrono::steady_clock::now();
     auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time);
 
     std::cout << "Writer performance test: " << num_runs 